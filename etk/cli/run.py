@@ -0,0 +1,107 @@
+import warnings
+import sys
+import json
+import gzip
+import time
+import argparse
+
+from etk.etk import ETK
+from etk.knowledge_graph_schema import KGSchema
+
+
+def add_arguments(parser):
+    """
+    Parse arguments
+    Args:
+        parser (argparse.ArgumentParser)
+    """
+    parser.description = 'Run all etk modules (em_*.py) in the given directories over a JSON lines file.\n\n' \
+                         'Examples:\n' \
+                         'python -m etk run -m ./extraction_modules -k master_config.json /tmp/docs.jl\n' \
+                         'python -m etk run -m ./extraction_modules -w 4 -o /tmp/out.jl.gz /tmp/docs.jl.gz\n' \
+                         'cat /tmp/docs.jl | python -m etk run -m ./extraction_modules --progress 1000'
+    parser.add_argument('input_file', nargs='?', type=str, default='-',
+                        help='.jl or .jl.gz file, one CDR document per line (default: stdin)')
+    parser.add_argument('-m', '--modules', action='append', dest='modules', required=True,
+                        help='directory containing etk modules, can be given multiple times')
+    parser.add_argument('-k', '--kg-schema', action='store', type=str, dest='kg_schema',
+                        help='master config file used to build the knowledge graph schema')
+    parser.add_argument('-o', '--output-file', action='store', type=str, dest='output_file', default='-',
+                        help='.jl or .jl.gz output file (default: stdout)')
+    parser.add_argument('-w', '--workers', action='store', type=int, dest='workers', default=1,
+                        help='number of worker processes (default: 1)')
+    parser.add_argument('-b', '--batch-size', action='store', type=int, dest='batch_size', default=16,
+                        help='number of documents sent to a worker at a time (default: 16)')
+    parser.add_argument('--unordered', action='store_true', dest='unordered',
+                        help='write results as soon as they complete instead of in input order')
+    parser.add_argument('--output-kg-only', action='store_true', dest='output_kg_only',
+                        help='only write the knowledge graph of each document')
+    parser.add_argument('--generate-json-ld', action='store_true', dest='generate_json_ld')
+    parser.add_argument('--provenance', action='store', type=str, dest='provenance', default='full',
+                        choices=['full', 'compact', 'off'],
+                        help='provenance recorded in each document (default: full)')
+    parser.add_argument('-p', '--progress', action='store', type=int, dest='progress', default=0,
+                        help='report throughput to stderr every N documents (default: off)')
+
+
+def open_jl(path, mode):
+    if path == '-':
+        return sys.stdin if mode == 'r' else sys.stdout
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+def read_docs(input_file):
+    for line in input_file:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def report(docs_count, output_count, start_time):
+    elapsed = time.time() - start_time
+    rate = docs_count / elapsed if elapsed > 0 else 0.0
+    print('processed {} docs, wrote {} docs, {:.1f}s, {:.1f} docs/s'.format(docs_count, output_count, elapsed, rate),
+          file=sys.stderr)
+
+
+def run(args):
+    """
+    Args:
+        args (argparse.Namespace)
+    """
+    kg_schema = None
+    if args.kg_schema:
+        with open(args.kg_schema) as f:
+            kg_schema = KGSchema(json.load(f))
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+
+        etk = ETK(kg_schema=kg_schema, modules=args.modules, output_kg_only=args.output_kg_only,
+                  generate_json_ld=args.generate_json_ld, provenance=args.provenance)
+
+        input_file = open_jl(args.input_file, 'r')
+        output_file = open_jl(args.output_file, 'w')
+        docs_count, output_count = 0, 0
+        start_time = time.time()
+        try:
+            for results in etk.process_stream(read_docs(input_file), workers=args.workers,
+                                              chunk_size=args.batch_size, ordered=not args.unordered):
+                for result in results:
+                    output_file.write(json.dumps(result) + '\n')
+                    output_count += 1
+                docs_count += 1
+                if args.progress and docs_count % args.progress == 0:
+                    report(docs_count, output_count, start_time)
+        finally:
+            if input_file is not sys.stdin:
+                input_file.close()
+            if output_file is not sys.stdout:
+                output_file.close()
+            else:
+                output_file.flush()
+
+        if args.progress:
+            report(docs_count, output_count, start_time)
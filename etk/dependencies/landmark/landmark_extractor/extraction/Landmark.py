@@ -9,6 +9,7 @@ import uuid
 from etk.dependencies.landmark.landmark_extractor.postprocessing.PostProcessor import RemoveExtraSpaces, RemoveHtml
 # from landmark_extractor.postprocessing.PostProcessor import RemoveExtraSpaces, RemoveHtml
 from collections import OrderedDict
+from functools import lru_cache
 
 MAX_EXTRACT_LENGTH=100000
 ITEM_RULE = 'ItemRule'
@@ -33,6 +34,53 @@ def escape_regex_string(input_string):
                 s[i] = '\\' + c
     return input_string[:0].join(s)
 
+# inline flags making a pattern hard to scan for what it matches before its start: verbose, reverse or version 1
+_scan_flags_regex = re.compile(r'\(\?[a-zA-Z0-9-]*[xrV]')
+
+@lru_cache(maxsize=None)
+def _searchable_from_pos(rule):
+    """ True if rule.search(string, pos) matches as rule.search(string[pos:]), i.e. the pattern does not look at
+    the text before the position: no ^, \\A, \\b, \\B, \\m, \\M or lookbehind out of a character class """
+    pattern = rule.pattern
+    if isinstance(pattern, bytes):
+        pattern = pattern.decode('latin-1')
+    if rule.flags & (re.VERBOSE | re.REVERSE | re.VERSION1) or _scan_flags_regex.search(pattern):
+        return False
+    i = 0
+    in_class = False
+    while i < len(pattern):
+        c = pattern[i]
+        if c == '\\':
+            if not in_class and pattern[i+1:i+2] in ('A', 'b', 'B', 'm', 'M'):
+                return False
+            i += 2
+            continue
+        if in_class:
+            if c == ']':
+                in_class = False
+        elif c == '[':
+            in_class = True
+            # a ] first in the class is a character of the class
+            i += 1
+            if pattern[i:i+1] == '^':
+                i += 1
+            if pattern[i:i+1] == ']':
+                i += 1
+            continue
+        elif c == '^' or pattern.startswith('(?<=', i) or pattern.startswith('(?<!', i):
+            return False
+        i += 1
+    return True
+
+def _search_from(rule, string, pos):
+    """ The span of rule.search(string[pos:]) in string, None if there is no match. The rest of the string is only
+    copied for the patterns that look at the text before the position """
+    if pos == 0 or _searchable_from_pos(rule):
+        match = rule.search(string, pos)
+        return match.span() if match else None
+    match = rule.search(string[pos:])
+    return (match.start() + pos, match.end() + pos) if match else None
+
 def flattenResult(extraction_object, name = 'root'):
     result = {}
     if isinstance(extraction_object, dict):
@@ -200,25 +248,24 @@ class ItemRule(Rule):
             if self.begin_regex:
                 begin_match = self.begin_rule.search(page_string)
                 begin_match_end = begin_match.end()
-            end_match_start = len(page_string)
-            end_match_end = len(page_string)
+            # positions in page_string, the end regex is matched from the end of the begin match
+            end_match_start = begin_match_end + len(page_string)
+            end_match_end = begin_match_end + len(page_string)
             
             if self.end_regex:
-                end_match = self.end_rule.search(page_string[begin_match_end:])
-                end_match_start = end_match.start()
-                end_match_end   = end_match.end()
+                end_match_start, end_match_end = _search_from(self.end_rule, page_string, begin_match_end)
             
             if self.include_end_regex:
-                extract = page_string[begin_match_end:begin_match_end+end_match_end]
+                extract = page_string[begin_match_end:end_match_end]
                 begin_index = begin_match_end
-                end_index = begin_match_end+end_match_end
+                end_index = end_match_end
             else:
-                extract = page_string[begin_match_end:begin_match_end+end_match_start]
+                extract = page_string[begin_match_end:end_match_start]
                 begin_index = begin_match_end
-                end_index = begin_match_end+end_match_start
+                end_index = end_match_start
             
             if extract and self.strip_end_regex:
-                extract = re.sub(self.strip_end_regex+'$', '', extract)
+                extract = self.strip_end_rule.sub('', extract)
                 end_index = begin_index + len(extract)
         except:
             extract = ''
@@ -280,6 +327,9 @@ class ItemRule(Rule):
         Rule.__init__(self, name, validation_regex, required, removehtml, sub_rules)
         self.begin_rule = re.compile(begin_regex, re.S)
         self.end_rule = re.compile(end_regex, re.S)
+        self.strip_end_rule = None
+        if strip_end_regex:
+            self.strip_end_rule = re.compile(strip_end_regex + '$')
         
         self.begin_regex = begin_regex
         self.end_regex = end_regex
@@ -308,17 +358,19 @@ class IterationRule(ItemRule):
                     if start_index == 0 and self.no_first_begin_iter_rule:
                         begin_match_end = 0
                     else:
-                        begin_match = self.iter_begin_rule.search(start_page_string[start_index:])
-                        begin_match_end = begin_match.end()
+                        begin_match = _search_from(self.iter_begin_rule, start_page_string, start_index)
+                        begin_match_end = begin_match[1] - start_index
 
-                    end_match = self.iter_end_rule.search(start_page_string[start_index+begin_match_end:])
-                    value = start_page_string[start_index+begin_match_end:start_index+begin_match_end+end_match.start()]
+                    # begin_match_end is from start_index, end_match_start and end_match_end are in start_page_string
+                    end_match_start, end_match_end = _search_from(self.iter_end_rule, start_page_string,
+                                                                 start_index+begin_match_end)
+                    value = start_page_string[start_index+begin_match_end:end_match_start]
                     if 0 < len(value.strip()) < MAX_EXTRACT_LENGTH:
-                        extracts.append({'extract':value,'begin_index':start_index+begin_match_end+base_extract['begin_index'],'end_index':start_index+begin_match_end+end_match.start()+base_extract['begin_index'],'sequence_number':sequence_number})
+                        extracts.append({'extract':value,'begin_index':start_index+begin_match_end+base_extract['begin_index'],'end_index':end_match_start+base_extract['begin_index'],'sequence_number':sequence_number})
                         sequence_number = sequence_number + 1
-                    start_index = start_index+begin_match_end+end_match.start()
+                    start_index = end_match_start
                     if prev_index == start_index:
-                        start_index+= max(1, end_match.end())
+                        start_index+= max(1, end_match_end - (prev_index+begin_match_end))
                 except:
                     if self.no_last_end_iter_rule and begin_match_end >= 0:
                         end_match_start = len(start_page_string)
@@ -331,16 +383,16 @@ class IterationRule(ItemRule):
         elif self.iter_begin_regex:
             while start_index < len(start_page_string):
                 try:
-                    end_match = self.iter_begin_rule.search(start_page_string[start_index:])
-                    value = start_page_string[
-                            start_index:start_index + end_match.end()]
+                    end_match_start, end_match_end = _search_from(self.iter_begin_rule, start_page_string,
+                                                                 start_index)
+                    value = start_page_string[start_index:end_match_end]
                     if 0 < len(value.strip()) < MAX_EXTRACT_LENGTH:
                         extracts.append({'extract': value,
                                          'begin_index': start_index + base_extract['begin_index'],
-                                         'end_index': start_index + end_match.end() + base_extract[
-                                             'begin_index'], 'sequence_number': sequence_number})
+                                         'end_index': end_match_end + base_extract['begin_index'],
+                                         'sequence_number': sequence_number})
                         sequence_number = sequence_number + 1
-                    start_index = start_index + end_match.end()
+                    start_index = end_match_end
                 except:
                     if self.no_last_end_iter_rule and start_index >= 0:
                         end_match_end = len(start_page_string)
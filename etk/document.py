@@ -1,14 +1,17 @@
 from typing import List, Dict
-from bs4 import BeautifulSoup
 from etk.extraction_provenance_record import ExtractionProvenanceRecord
+from etk.provenance_store import ProvenanceLevel, ProvenanceStore
 from etk.extraction import Extractable, Extraction
 from etk.extractor import Extractor, InputType
 from etk.segment import Segment
-from etk.tokenizer import Tokenizer
+from etk.tokenizer import Tokenizer, TokenizationCache, use_tokenization_cache
+from etk.html_dom import HTMLDOMCache, use_html_dom_cache, looks_like_html
 from etk.knowledge_graph import KnowledgeGraph
 from etk.utilities import Utility
 from etk.etk_exceptions import ErrorPolicy, ExtractorValueError
 import warnings
+from collections import OrderedDict
+from contextlib import contextmanager
 
 
 class Document(Segment):
@@ -45,7 +48,14 @@ class Document(Segment):
             if not self.etk.kg_schema:
                 self.etk.log("Schema not found.", "warning", self.doc_id, self.url)
         self._provenance_id_index = 0
-        self._provenances = dict()
+        # see ETK provenance
+        self.provenance_level = etk.provenance_level
+        # tokens of the texts of this document, shared by all the extractors, see ETK tokenization_cache_size
+        self.tokenization_cache = etk.tokenization_cache if etk.tokenization_cache is not None \
+            else TokenizationCache()
+        # parsed html pages of this document, shared by all the html extractors
+        self.html_dom_cache = HTMLDOMCache()
+        self._provenances = ProvenanceStore(self) if self.provenance_level == ProvenanceLevel.COMPACT else dict()
         self._jsonpath_provenances = dict()
         self._kg_provenances = dict()
 
@@ -89,12 +99,13 @@ class Document(Segment):
 
         Returns: A list of Segments object that contains the elements selected by the json path.
         """
-        path = self.etk.parse_json_path(jsonpath)
+        path = self.etk.compile_json_path(jsonpath)
         matches = path.find(self.cdr_document)
 
         segments = list()
         for a_match in matches:
-            this_segment = Segment(str(a_match.full_path), a_match.value, self)
+            # the full path of the segment is built when it is needed
+            this_segment = Segment(a_match, a_match.value, self)
             segments.append(this_segment)
 
         return segments
@@ -139,7 +150,8 @@ class Document(Segment):
                         "Extractor needs tokens, tokenizer needs string to tokenize, got dict, converting to string")
                 tokens = extractable.get_tokens(tokenizer)
                 if tokens:
-                    extracted_results = extractor.extract(tokens, **options)
+                    with self._shared_parses():
+                        extracted_results = extractor.extract(tokens, **options)
             else:
                 raise ExtractorValueError(
                     "Extractor needs string, tokenizer needs string to tokenize, got " + str(type(extractable.value)))
@@ -156,28 +168,103 @@ class Document(Segment):
                     warnings.warn("Extractor needs string, got extractable value as dict, converting to string")
                 text = extractable.get_string(joiner)
                 if text:
-                    extracted_results = extractor.extract(text, **options)
+                    with self._shared_parses():
+                        extracted_results = extractor.extract(text, **options)
             else:
                 # raise ExtractorValueError("Extractor needs string, got " + str(type(extractable.value)))
                 # TODO: Yixiang - needs to be handled properly
                 pass
 
         elif extractor.input_type == InputType.OBJECT:
-            extracted_results = extractor.extract(extractable.value, **options)
+            with self._shared_parses():
+                extracted_results = extractor.extract(extractable.value, **options)
 
         elif extractor.input_type == InputType.HTML:
-            if bool(BeautifulSoup(extractable.value, "html.parser").find()):
-                extracted_results = extractor.extract(extractable.value, **options)
+            if looks_like_html(extractable.value):
+                with self._shared_parses():
+                    extracted_results = extractor.extract(extractable.value, **options)
             else:
                 # raise ExtractorValueError("Extractor needs HTML, got non HTML string")
                 # TODO: Yixiang - needs to be handled properly
                 pass
 
+        self._record_extraction_provenance(extracted_results, extractable)
+        return extracted_results
+
+    def extract_many(self, extractor: Extractor, extractables: List[Extractable], tokenizer: Tokenizer = None,
+                     joiner: str = "  ", batch_size: int = 1000, n_process: int = 1,
+                     **options) -> List[List[Extraction]]:
+        """
+        Invoke the extractor on each of the given extractables, processing their text with spaCy in batches
+        when possible: the tokens of TOKENS extractors come from Tokenizer.tokenize_many, and TEXT extractors
+        having an extract_many method, e.g. SpacyNerExtractor, get all the texts at once.
+
+        Args:
+            extractor (Extractor):
+            extractables (List[Extractable]): e.g. the segments returned by select_segments
+            tokenizer: user can pass custom tokenizer if extractor wants token
+            joiner: user can pass joiner if extractor wants text
+            batch_size (int): number of texts spaCy processes at a time
+            n_process (int): number of processes spaCy uses
+            options: user can pass arguments as a dict to the extract() function of different extractors
+
+        Returns: List of List of Extraction, the extractions of each extractable, in the same order.
+
+        """
+        if not tokenizer:
+            tokenizer = self.etk.default_tokenizer
+
+        if self.etk.error_policy == ErrorPolicy.PROCESS:
+            if extractor.input_type == InputType.TOKENS:
+                not_tokenized = list(OrderedDict.fromkeys(
+                    text for text in (e.get_string() for e in extractables)
+                    if (tokenizer, text) not in self.tokenization_cache))
+                if not_tokenized and hasattr(tokenizer, "tokenize_many"):
+                    all_tokens = tokenizer.tokenize_many(not_tokenized, batch_size=batch_size, n_process=n_process)
+                    for text, tokens in zip(not_tokenized, all_tokens):
+                        self.tokenization_cache.get((tokenizer, text), lambda: tokens)
+
+            elif extractor.input_type == InputType.TEXT and hasattr(extractor, "extract_many"):
+                texts = [e.get_string(joiner) for e in extractables]
+                to_extract = [i for i, text in enumerate(texts) if text]
+                with self._shared_parses():
+                    extracted = extractor.extract_many([texts[i] for i in to_extract], batch_size=batch_size,
+                                                       n_process=n_process, **options)
+                results = [list() for _ in extractables]
+                for i, extracted_results in zip(to_extract, extracted):
+                    self._record_extraction_provenance(extracted_results, extractables[i])
+                    results[i] = extracted_results
+                return results
+
+        return [self.extract(extractor, e, tokenizer, joiner, **options) for e in extractables]
+
+    @contextmanager
+    def _shared_parses(self):
+        """
+        The tokenizations and the parsed html pages of this document are shared by the extractors run inside
+        the with block
+        """
+        with use_tokenization_cache(self.tokenization_cache), use_html_dom_cache(self.html_dom_cache):
+            yield
+
+    def _record_extraction_provenance(self, extracted_results: List[Extraction], extractable: Extractable) -> None:
+        if self.provenance_level == ProvenanceLevel.OFF:
+            return
         try:
             jsonPath = extractable.full_path
         except AttributeError:
             jsonPath = None
 
+        if self.provenance_level == ProvenanceLevel.COMPACT:
+            for e in extracted_results:
+                e.prov_id = self._provenances.add_extraction(jsonPath, e.provenance["extractor_name"],
+                                                             e.provenance["start_char"], e.provenance["end_char"],
+                                                             e.provenance["confidence"], extractable.prov_id)
+                self.provenance_id_index_incrementer()
+                if jsonPath is not None:
+                    self._jsonpath_provenances.setdefault(jsonPath, []).append(e.prov_id)
+            return
+
         for e in extracted_results:
             # for the purpose of provenance hierarrchy tracking, a parent's id for next generation.
             e.prov_id = self.provenance_id_index
@@ -191,7 +278,16 @@ class Document(Segment):
             self.provenance_id_index_incrementer()
             self.create_provenance(extraction_provenance_record)
 
-        return extracted_results
+    def serialize_provenances(self) -> None:
+        """
+        Adds the provenances recorded in COMPACT level to the "provenances" of the CDR document,
+        the FULL level adds them as they are recorded. ETK.process_ems calls it when a document is processed.
+        """
+        if self.provenance_level != ProvenanceLevel.COMPACT:
+            return
+        provenances = self._provenances.serialize()
+        if provenances:
+            self.cdr_document.setdefault("provenances", []).extend(provenances)
 
     @property
     def doc_id(self):
@@ -21,15 +21,39 @@ class DocumentSelector(object):
 
 
 class DefaultDocumentSelector(DocumentSelector):
-
-    def __init__(self):
-        pass
-
     """
     A concrete implementation of DocumentSelector that supports commonly used methods for
     selecting documents.
+
+    The selection can be given when the selector is created, so it is compiled once and select_document(document)
+    only runs the compiled regexes and json_paths, or in each call to select_document.
+
+    Examples:
+        ::
+
+            selector = DefaultDocumentSelector(datasets=["news"], url_patterns=[r"\.gov/"])
+            selector.select_document(doc)
     """
 
+    def __init__(self,
+                 datasets: List[str] = None,
+                 url_patterns: List[str] = None,
+                 website_patterns: List[str] = None,
+                 json_paths: List[str] = None,
+                 json_paths_regex: List[str] = None) -> None:
+        """
+        Args:
+            datasets (List[str]): test the "dataset" attribute in the doc contains any of the strings provided
+            url_patterns (List[str]): test the "url" of the doc matches any of the regexes using regex.search
+            website_patterns (List[str]): test the "website" of the doc contains any of the regexes using regex.search
+            json_paths (List[str]): test existence of any of the given JSONPaths in a document
+            json_paths_regex(List[str]): test that any of the values selected in 'json_paths' satisfy any of
+              the regexex provided using regex.search
+        """
+        self._selection = self._compile(datasets, url_patterns, website_patterns, json_paths, json_paths_regex)
+        # compiled selections given to select_document, a module usually gives the same one for every document
+        self._compiled = dict()
+
     """
         Args:
             document ():
@@ -64,35 +88,38 @@ class DefaultDocumentSelector(DocumentSelector):
                         json_paths: List[str] = None,
                         json_paths_regex: List[str] = None) -> bool:
 
+        if datasets is None and url_patterns is None and website_patterns is None and json_paths is None \
+                and json_paths_regex is None:
+            selection = self._selection
+        else:
+            key = tuple(tuple(x) if x is not None else None for x in
+                        (datasets, url_patterns, website_patterns, json_paths, json_paths_regex))
+            selection = self._compiled.get(key)
+            if selection is None:
+                selection = self._compile(datasets, url_patterns, website_patterns, json_paths, json_paths_regex)
+                self._compiled[key] = selection
+
+        if selection is None:
+            return True
+
+        datasets_regex, url_regex, website_regex, rw_json_paths, rw_json_paths_regex = selection
         json_doc = document.cdr_document
 
-        if (json_paths_regex is not None) and (json_paths is None):
+        if (rw_json_paths_regex is not None) and (rw_json_paths is None):
             print("please specify both json_paths_regex and json_paths")
             # TODO: print out some error message here
             return False
 
-        if datasets is not None:
-            res = self.check_content(json_doc, "$.dataset", datasets, False)
-            if not res:
-                return False
-
-        if url_patterns is not None:
-            res = self.check_content(json_doc, "$.url", url_patterns, True)
-            if not res:
-                return False
+        if datasets_regex is not None and not self._check_field(json_doc, "dataset", datasets_regex):
+            return False
 
-        if website_patterns is not None:
-            res = self.check_content(json_doc, "$.website", website_patterns, True)
-            if not res:
-                return False
+        if url_regex is not None and not self._check_field(json_doc, "url", url_regex):
+            return False
 
-        if json_paths is not None:
-            rw_json_paths = []
-            for json_path in json_paths:
-                rw_json_paths.append(parse(json_path))
+        if website_regex is not None and not self._check_field(json_doc, "website", website_regex):
+            return False
 
-        if json_paths_regex is not None:
-            rw_json_paths_regex = re.compile('|'.join(json_paths_regex))
+        if rw_json_paths_regex is not None:
             # TODO AMandeep: what is going at the line below
             res = self.check_json_path_codition(json_doc, rw_json_paths, rw_json_paths_regex)
             if not res:
@@ -100,6 +127,29 @@ class DefaultDocumentSelector(DocumentSelector):
 
         return True
 
+    @staticmethod
+    def _compile(datasets: List[str] = None,
+                 url_patterns: List[str] = None,
+                 website_patterns: List[str] = None,
+                 json_paths: List[str] = None,
+                 json_paths_regex: List[str] = None) -> tuple or None:
+        """Compiles the regexes and the json_paths of a selection, None if nothing is selected"""
+        if datasets is None and url_patterns is None and website_patterns is None and json_paths is None \
+                and json_paths_regex is None:
+            return None
+        return (re.compile('|'.join(datasets)) if datasets is not None else None,
+                re.compile('|'.join(url_patterns)) if url_patterns is not None else None,
+                re.compile('|'.join(website_patterns)) if website_patterns is not None else None,
+                [parse(json_path) for json_path in json_paths] if json_paths is not None else None,
+                re.compile('|'.join(json_paths_regex)) if json_paths_regex is not None else None)
+
+    @staticmethod
+    def _check_field(json_doc: dict, field: str, compiled_regex) -> bool:
+        """Same as check_content with the json path '$.<field>', without running a json path"""
+        if not isinstance(json_doc, dict) or field not in json_doc:
+            return False
+        return compiled_regex.search(json_doc[field]) is not None
+
     @staticmethod
     def check_content(json_doc: dict, json_path: str, patterns: List[str], enable_regexp: bool = True) -> bool:
         if enable_regexp:
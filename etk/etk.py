@@ -1,10 +1,18 @@
 import platform
 import tempfile
-from typing import List, Dict
-import spacy, copy, json, os, jsonpath_ng.ext, importlib, logging, sys
-from etk.tokenizer import Tokenizer
+from typing import List, Dict, Iterable, Iterator
+import json, os, jsonpath_ng.ext, importlib, logging, sys
+import multiprocessing
+import itertools
+import collections
+import queue
+import weakref
+from etk.tokenizer import Tokenizer, TokenizationCache
 from etk.crf_tokenizer import CrfTokenizer
+from etk import nlp_registry
 from etk.document import Document
+from etk.provenance_store import ProvenanceLevel
+from etk.json_path import CompiledJsonPath
 from etk.etk_exceptions import InvalidJsonPathError
 from etk.etk_module import ETKModule
 from etk.etk_exceptions import ErrorPolicy, NotGetETKModuleError
@@ -13,34 +21,72 @@ import gzip
 
 TEMP_DIR = '/tmp' if platform.system() == 'Darwin' else tempfile.gettempdir()
 
+# the ETK instance owned by a process_stream worker, built once by _init_stream_worker
+_stream_worker_etk = None
+
+
+def _configure_logging(logger_path: str, filemode: str) -> None:
+    logging.basicConfig(
+        level=logging.DEBUG,
+        format='%(asctime)s %(name)-6s %(levelname)s %(message)s',
+        datefmt='%m-%d %H:%M',
+        filename=logger_path,
+        filemode=filemode
+    )
+
+
+def _init_stream_worker(etk_args: Dict, logger_name: str) -> None:
+    global _stream_worker_etk
+    # a started (not forked) worker does not inherit the logging handlers, it appends to the log of the parent
+    # instead of truncating it, basicConfig does nothing when the handlers were inherited
+    _configure_logging(etk_args["logger_path"], 'a')
+    _stream_worker_etk = ETK(logger=logging.getLogger(logger_name), **etk_args)
+
+
+def _process_chunk_in_stream_worker(cdr_documents: List[Dict]) -> List[List[Dict]]:
+    return [_stream_worker_etk.process_cdr_document(cdr_document) for cdr_document in cdr_documents]
+
 
 class ETK(object):
     def __init__(self, kg_schema=None, modules=None, extract_error_policy="process", logger=None,
                  logger_path=os.path.join(TEMP_DIR, 'etk.log'), ontology=None, generate_json_ld=False,
-                 output_kg_only=False, use_spacy_tokenizer=False):
+                 output_kg_only=False, use_spacy_tokenizer=False, tokenization_cache_size=0, provenance="full"):
 
         self.generate_json_ld = generate_json_ld
         self.output_kg_only = output_kg_only
+        # everything needed to rebuild an equivalent ETK in a process_stream worker
+        self._init_args = {
+            "kg_schema": kg_schema,
+            "modules": modules,
+            "extract_error_policy": extract_error_policy,
+            "logger_path": logger_path,
+            "ontology": ontology,
+            "generate_json_ld": generate_json_ld,
+            "output_kg_only": output_kg_only,
+            "use_spacy_tokenizer": use_spacy_tokenizer,
+            "tokenization_cache_size": tokenization_cache_size,
+            "provenance": provenance
+        }
 
         if logger:
             self.logger = logger
         else:
-            logging.basicConfig(
-                level=logging.DEBUG,
-                format='%(asctime)s %(name)-6s %(levelname)s %(message)s',
-                datefmt='%m-%d %H:%M',
-                filename=logger_path,
-                filemode='w'
-            )
+            _configure_logging(logger_path, 'w')
             self.logger = logging.getLogger('ETK')
 
         self.parser = jsonpath_ng.ext.parse
-        self.default_nlp = spacy.load('en_core_web_sm')
+        # shared with the other ETKs and extractors using the same model, see nlp_registry
+        self.default_nlp = nlp_registry.load_model('en_core_web_sm')
+        weakref.finalize(self, nlp_registry.release, self.default_nlp)
         if use_spacy_tokenizer:
-            self.default_tokenizer = Tokenizer(copy.deepcopy(self.default_nlp))
+            self.default_tokenizer = nlp_registry.get_tokenizer(self.default_nlp)
+            weakref.finalize(self, nlp_registry.release, self.default_tokenizer)
         else:
             self.default_tokenizer = CrfTokenizer()
+        # by default each document has its own tokenization cache, a size shares a LRU cache across documents
+        self.tokenization_cache = TokenizationCache(tokenization_cache_size) if tokenization_cache_size else None
         self.parsed = dict()
+        self.compiled = dict()
         self.kg_schema = kg_schema
         self.ontology = ontology
         self.em_lst = list()
@@ -48,7 +94,7 @@ class ETK(object):
             if isinstance(modules, list):
                 for module in modules:
                     if isinstance(module, str):
-                        self.em_lst.extend(self.load_ems(modules))
+                        self.em_lst.extend(self.load_ems([module]))
                     elif issubclass(module, ETKModule):
                         self.em_lst.append(module(self))
             elif issubclass(modules, ETKModule):
@@ -65,6 +111,9 @@ class ETK(object):
         else:
             self.error_policy = ErrorPolicy.PROCESS
 
+        # "full", "compact" or "off", see ProvenanceLevel
+        self.provenance_level = ProvenanceLevel(provenance.lower())
+
     def create_document(self, doc: Dict, mime_type: str = None, url: str = "http://ex.com/123",
                         doc_id=None, type_=None) -> Document:
         """
@@ -102,6 +151,20 @@ class ETK(object):
 
         return self.parsed[jsonpath]
 
+    def compile_json_path(self, jsonpath) -> CompiledJsonPath:
+        """
+        Parse a jsonpath, the simple paths like '$.a.b' or '$.a[*].b' are evaluated without jsonpath_ng
+
+        Args:
+            jsonpath: str
+
+        Returns: a CompiledJsonPath, its find method returns matches with a value and a full_path str
+
+        """
+        if jsonpath not in self.compiled:
+            self.compiled[jsonpath] = CompiledJsonPath(self.parse_json_path(jsonpath))
+        return self.compiled[jsonpath]
+
     def process_and_frame(self, doc: Document):
         """
         Processes a document and if it has child docs, embeds them in the parent document. Only works for 1 level of
@@ -168,6 +231,7 @@ class ETK(object):
             #         raise e
 
         # Do house cleaning.
+        doc.serialize_provenances()
         doc.insert_kg_into_cdr()
         if not self.generate_json_ld:
             if "knowledge_graph" in doc.cdr_document:
@@ -185,6 +249,80 @@ class ETK(object):
 
         return results
 
+    def process_cdr_document(self, cdr_document: Dict) -> List[Dict]:
+        """
+        Wrap a JSON doc in a Document, run all etk modules on it and return plain JSON results.
+
+        Args:
+            cdr_document (Dict): a JSON object containing a document in CDR format.
+
+        Returns: List[Dict], the processed document followed by any documents created by the modules
+
+        """
+        results = self.process_ems(self.create_document(cdr_document))
+        return [x.cdr_document if isinstance(x, Document) else x for x in results]
+
+    def process_stream(self, cdr_documents: Iterable[Dict], workers: int = 1, chunk_size: int = 16,
+                       ordered: bool = True) -> Iterator[List[Dict]]:
+        """
+        Run all etk modules over a stream of JSON docs, optionally in a pool of worker processes.
+
+        Each worker builds its own ETK (spaCy models and etk modules) once, from the arguments this ETK
+        was constructed with, and then processes the docs it receives in chunks of chunk_size.
+        At most a few chunks per worker are read ahead from cdr_documents, so it can be a lazy stream of any length.
+        With workers <= 1 the docs are processed in the calling process by this ETK.
+
+        A custom logger given to this ETK is not used in the workers: they log to a logger of the same name, which
+        keeps the handlers inherited by forked workers, and otherwise appends to logger_path.
+
+        Args:
+            cdr_documents (Iterable[Dict]): JSON objects containing documents in CDR format.
+            workers (int): number of worker processes.
+            chunk_size (int): number of docs sent to a worker at a time.
+            ordered (bool): yield results in input order, otherwise as soon as they complete.
+
+        Returns: an iterator over the results of process_cdr_document, one list per input doc
+
+        """
+        if workers <= 1:
+            for cdr_document in cdr_documents:
+                yield self.process_cdr_document(cdr_document)
+            return
+
+        # a bounded number of chunks is in flight, a new chunk is sent each time the results of one are taken, so the
+        # workers are kept busy while a slow chunk is processed, without reading the whole stream ahead
+        max_chunks = workers * 4
+        cdr_documents = iter(cdr_documents)
+        pending = collections.deque()
+        completed = queue.Queue()
+        in_flight = 0
+        exhausted = False
+        with multiprocessing.Pool(processes=workers, initializer=_init_stream_worker,
+                                  initargs=(self._init_args, self.logger.name)) as pool:
+            while True:
+                while not exhausted and in_flight < max_chunks:
+                    chunk = list(itertools.islice(cdr_documents, chunk_size))
+                    if not chunk:
+                        exhausted = True
+                    elif ordered:
+                        pending.append(pool.apply_async(_process_chunk_in_stream_worker, (chunk,)))
+                        in_flight += 1
+                    else:
+                        pool.apply_async(_process_chunk_in_stream_worker, (chunk,), callback=completed.put,
+                                         error_callback=completed.put)
+                        in_flight += 1
+                if not in_flight:
+                    break
+                if ordered:
+                    results = pending.popleft().get()
+                else:
+                    results = completed.get()
+                    if isinstance(results, BaseException):
+                        raise results
+                in_flight -= 1
+                for result in results:
+                    yield result
+
     @staticmethod
     def load_glossary(file_path: str, read_json=False) -> List[str]:
         """
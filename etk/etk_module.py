@@ -2,6 +2,9 @@ from etk.document import Document
 from etk.document_selector import DefaultDocumentSelector
 from typing import List
 
+# selects every document, shared by all the modules not overriding document_selector
+_default_document_selector = DefaultDocumentSelector()
+
 
 class ETKModule(object):
     """
@@ -29,7 +32,7 @@ class ETKModule(object):
         Returns:
 
         """
-        return DefaultDocumentSelector().select_document(doc)
+        return _default_document_selector.select_document(doc)
 
     @property
     def produces(self) -> List[str]:
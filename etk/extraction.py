@@ -110,7 +110,8 @@ class Extractable(ExtractableBase):
         As it is common to need the same tokens for multiple extractors, the Extractable should cache the
         tokenize results, keyed by segment and tokenizer so that given the same segment and tokenizer,
         the same results are returned. If the same segment is given, but different tokenizer, the different
-        results are cached separately.
+        results are cached separately. Segments of a Document use the tokenization cache of the document instead,
+        keyed by text and tokenizer, so segments selected again or with the same text are not tokenized again.
 
         Args:
             tokenizer (Tokenizer)
@@ -118,6 +119,14 @@ class Extractable(ExtractableBase):
         Returns: a sequence of tokens.
         """
 
+        document = getattr(self, "document", None)
+        cache = getattr(document, "tokenization_cache", None)
+        if cache is not None:
+            # shared by all the segments of the document with the same text
+            segment_value_for_tokenize = self.get_string()
+            return cache.get((tokenizer, segment_value_for_tokenize),
+                             lambda: tokenizer.tokenize(segment_value_for_tokenize))
+
         if (self, tokenizer) in self.tokenize_results:
             return self.tokenize_results[(self, tokenizer)]
         else:
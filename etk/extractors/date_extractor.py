@@ -1,14 +1,15 @@
 from warnings import warn
 from typing import List
 from enum import Enum, auto
-import datetime, re, calendar, pytz
+from functools import lru_cache
+import datetime, re, calendar, pytz, copy
 from tzlocal import get_localzone
 from dateutil.relativedelta import relativedelta
-from langdetect import detect
 
 from etk.etk import ETK
 from etk.extractor import Extractor, InputType
 from etk.extractors.spacy_rule_extractor import SpacyRuleExtractor
+from etk.extractors.language_identification_extractor import detect_language
 from etk.extraction import Extraction
 from etk.dependencies.date_extractor_resources.date_regex_generator import DateRegexGenerator
 from etk.dependencies.date_extractor_resources.constants import units, singleton_regex, \
@@ -33,6 +34,15 @@ PREFER_DATES_FROM = 'prefer_dates_from'
 DATE_VALUE_RESOLUTION = 'date_value_resolution'
 MIN_RESOLUTION = 'min_resolution'
 
+# every default format match lies within this many chars of one of the anchors in DateExtractor._anchor_regex
+# (the text between anchors in a date is at most a weekday name, a splitter, am/pm or a timezone name)
+ANCHOR_WINDOW_MARGIN = 64
+WHITESPACE = re.compile(r'\s')
+ILLEGAL = re.compile(illegal)
+POSSIBLE_ILLEGAL = re.compile(possible_illegal)
+POSSIBLE_ILLEGAL_3 = re.compile(possible_illegal_3)
+SINGLE_YEAR_ONLY = re.compile('^\b?[0-9]{4}\b?$')
+
 
 class DateResolution(Enum):
     """
@@ -134,9 +144,13 @@ class DateExtractor(Extractor):
         d = DateRegexGenerator(singleton_regex, units)
         self._final_regex = d.final_regex
         self._symbol_list = d.symbol_list
+        self._compiled_regex = {order: re.compile(self._final_regex[order], re.I) for order in self._final_regex}
+        self._anchor_regex = self._generate_anchor_regex()
+        self._additional_regex = {}
         self._settings = {}
         self._etk = etk
         self._lan = 'en'
+        self._relative_date_extractor = None
 
     def extract(self, text: str = None,
                 extract_first_date_only: bool = False,
@@ -154,6 +168,7 @@ class DateExtractor(Extractor):
                 prefer_day_of_month: str = "first",
                 prefer_dates_from: str = "current",
                 date_value_resolution: DateResolution = DateResolution.DAY,
+                language: str = None
                 ) -> List[Extraction]:
         """
         Args:
@@ -175,6 +190,8 @@ class DateExtractor(Extractor):
             date_value_resolution (enum[DateResolution.SECOND, DateResolution.MINUTE, DateResolution.HOUR, \
                 DateResolution.DAY, DateResolution.MONTH, DateResolution.YEAR]): specify resolution \
                 when convert to iso format string, default to DateResolution.DAY
+            language (str): ISO 639-1 code of the language of the 'text' if already known (e.g. the output of \
+                LanguageIdentificationExtractor for the document), skips language detection, default to None
 
         Returns:
             List[Extraction]: List of extractions, the information including::
@@ -193,6 +210,126 @@ class DateExtractor(Extractor):
                 }
         """
 
+        self._set_settings(extract_first_date_only, additional_formats, use_default_formats, ignore_dates_before,
+                           ignore_dates_after, detect_relative_dates, relative_base, preferred_date_order,
+                           prefer_language_date_order, timezone, to_timezone, return_as_timezone_aware,
+                           prefer_day_of_month, prefer_dates_from, date_value_resolution)
+        return self._extract(text, language)
+
+    def extract_batch(self, texts: List[str], language: str = None, cache_size: int = 4096,
+                      **settings) -> List[List[Extraction]]:
+        """
+        Extract dates from many short texts (e.g. the cells of a date column) with the same settings.
+        The settings are resolved once, and identical texts are only extracted once.
+
+        Args:
+            texts (List[str]): extract dates from each of these texts
+            language (str): ISO 639-1 code of the language of all the texts if already known, default to None
+            cache_size (int): number of distinct texts whose extractions are remembered, default to 4096
+            **settings: any other argument of extract(), e.g. preferred_date_order='DMY'
+
+        Returns:
+            List[List[Extraction]]: one list of extractions per text, in the same order as texts
+        """
+        self._set_settings(**settings)
+        extract = lru_cache(maxsize=cache_size)(lambda text: self._extract(text, language))
+        # copy the cached extractions, Document.extract sets the provenance id on each of them
+        return [[copy.copy(e) for e in extract(text)] for text in texts]
+
+    def _extract(self, text: str, language: str = None) -> List[Extraction]:
+        """
+        extract dates from 'text' with the current settings, see extract() for the args
+
+        """
+        prefer_language_date_order = self._settings[PREFER_LANGUAGE_DATE_ORDER]
+        additional_formats = self._settings[ADDITIONAL_FORMATS]
+        if language:
+            self._lan = language
+        elif prefer_language_date_order:
+            try:
+                # only a prefix of the text is used, detection results are cached by this prefix
+                self._lan = detect_language(text)
+            except Exception as e:
+                warn('DateExtractor: Catch LangDetectException ' + str(e))
+                warn(message='DateExtractor: Catch LangDetectException {}'.format(str(e)))
+
+        results = []
+        if additional_formats:
+            for date_format in additional_formats:
+                r = self._get_additional_regex(date_format)
+                try:
+                    matches = [self._wrap_date_match(r['order'], match, pattern=r['pattern']) for
+                           match in r['compiled_reg'].finditer(text) if match]
+                    if matches:
+                        results.append(matches)
+                except:
+                    warn('DateExtractor: Failed to extract with additional format ' + str(r) + '.')
+            if self._settings[USE_DEFAULT_FORMATS]:
+                results.extend(x for x in self._match_default_formats(text) if x)
+        else:
+            results = self._match_default_formats(text)
+
+        # for absolute dates:
+        ans = self._remove_overlapped_date_str(results)
+        # for relative dates:
+        if self._settings[DETECT_RELATIVE_DATES]:
+            ans += self._extract_relative_dates(text)
+
+        return ans
+
+    def extract_relative_dates(self, texts: List[str],
+                               ignore_dates_before: datetime.datetime = None,
+                               ignore_dates_after: datetime.datetime = None,
+                               relative_base: datetime.datetime = None,
+                               timezone: str = None,
+                               to_timezone: str = None,
+                               return_as_timezone_aware: bool = True,
+                               date_value_resolution: DateResolution = DateResolution.DAY
+                               ) -> List[List[Extraction]]:
+        """
+        Extract relative dates like '9 days before' only, from many texts with the same settings.
+        Requires an ETK instance (with spaCy enabled) passed in when init the DateExtractor.
+
+        Args:
+            texts (List[str]): extract relative dates from each of these texts
+            ignore_dates_before (datetime.datetime): ignore dates before 'ignore_dates_before', default to None
+            ignore_dates_after (datetime.datetime): ignore dates after 'ignore_dates_after', default to None
+            relative_base (datetime.datetime): offset relative dates detected based on 'relative_base', default to None
+            timezone (str): add 'timezone' if there is no timezone information in the extracted date, default to None
+            to_timezone (str): convert all dates extracted to this timezone, default to None
+            return_as_timezone_aware (bool): returned datetime timezone awareness, default to None
+            date_value_resolution (DateResolution): specify resolution when convert to iso format string, \
+                default to DateResolution.DAY
+
+        Returns:
+            List[List[Extraction]]: one list of extractions per text, in the same order as texts
+        """
+        self._set_settings(ignore_dates_before=ignore_dates_before, ignore_dates_after=ignore_dates_after,
+                           detect_relative_dates=True, relative_base=relative_base, timezone=timezone,
+                           to_timezone=to_timezone, return_as_timezone_aware=return_as_timezone_aware,
+                           date_value_resolution=date_value_resolution)
+        return [self._extract_relative_dates(text) for text in texts]
+
+    def _set_settings(self, extract_first_date_only: bool = False,
+                      additional_formats: List[str] = list(),
+                      use_default_formats: bool = False,
+                      ignore_dates_before: datetime.datetime = None,
+                      ignore_dates_after: datetime.datetime = None,
+                      detect_relative_dates: bool = False,
+                      relative_base: datetime.datetime = None,
+                      preferred_date_order: str = "MDY",
+                      prefer_language_date_order: bool = True,
+                      timezone: str = None,
+                      to_timezone: str = None,
+                      return_as_timezone_aware: bool = True,
+                      prefer_day_of_month: str = "first",
+                      prefer_dates_from: str = "current",
+                      date_value_resolution: DateResolution = DateResolution.DAY
+                      ) -> None:
+        """
+        set up the default timezone and the settings used by the current extraction, see extract() for the args
+
+        """
         if return_as_timezone_aware:
             self._default_tz = pytz.timezone(timezone) if timezone else get_localzone()
             if ignore_dates_before and not ignore_dates_before.tzinfo:
@@ -209,13 +346,6 @@ class DateExtractor(Extractor):
             if relative_base and relative_base.tzinfo:
                 relative_base = relative_base.replace(tzinfo=None)
 
-        if prefer_language_date_order:
-            try:
-                self._lan = detect(text)
-            except Exception as e:
-                warn('DateExtractor: Catch LangDetectException ' + str(e))
-                warn(message='DateExtractor: Catch LangDetectException {}'.format(str(e)))
-
         self._settings = {
             EXTRACT_FIRST_DATE_ONLY: extract_first_date_only,
             ADDITIONAL_FORMATS: additional_formats,
@@ -234,55 +364,105 @@ class DateExtractor(Extractor):
             DATE_VALUE_RESOLUTION: date_value_resolution
         }
 
-        results = []
-        additional_regex = []
-        if additional_formats:
-            for date_format in additional_formats:
-                order = ''
-                reg = date_format
-                for key in singleton_regex:
-                    if key[0] == '%':
-                        reg2 = re.sub(key, singleton_regex[key], reg)
-                        if reg != reg2:
-                            if key in units['M']:
-                                order += 'M'
-                            elif key in units['Y']:
-                                order += 'Y'
-                            elif key in units['D']:
-                                order += 'D'
-                            reg = reg2
-                additional_regex.append({
-                    'reg': reg,
-                    'pattern': date_format,
-                    'order': order,
-                })
-            for r in additional_regex:
-                try:
-                    matches = [self._wrap_date_match(r['order'], match, pattern=r['pattern']) for
-                           match in re.finditer(r['reg'], text, re.I) if match]
-                    if matches:
-                        results.append(matches)
-                except:
-                    warn('DateExtractor: Failed to extract with additional format ' + str(r) + '.')
-            if use_default_formats:
-                for order in self._final_regex.keys():
-                    matches = [self._wrap_date_match(order, match) for match
-                               in re.finditer(self._final_regex[order], text, re.I) if match]
-                    if matches:
-                        results.append(matches)
-        else:
-            for order in self._final_regex.keys():
-                matches = [self._wrap_date_match(order, match) for match
-                           in re.finditer(self._final_regex[order], text, re.I) if match]
-                results.append(matches)
+    @staticmethod
+    def _generate_anchor_regex() -> dict:
+        """
+        For each order, a regex for tokens of which every date of that order contains at least one, used to skip
+        the parts of a text that cannot contain a date. The regexes are lower case and applied to the lower cased
+        text, since case insensitive alternations are much slower to scan for.
 
-        # for absolute dates:
-        ans = self._remove_overlapped_date_str(results)
-        # for relative dates:
-        if detect_relative_dates:
-            ans += self._extract_relative_dates(text)
+        """
+        month = r'(?:' + singleton_regex['%B'] + r'|' + singleton_regex['%b'] + r')'
+        weekday = singleton_regex['%A'] + r'|' + singleton_regex['w_prefix'] + singleton_regex['%a']
+        # a date without digits contains a month name, possibly right after a weekday, so it is not anchored at \b
+        month_anchor = re.compile((r'[0-9]+|' + month).lower())
+        return {
+            'MDY': month_anchor,
+            'DMY': month_anchor,
+            'YMD': month_anchor,
+            'SINGLE_YEAR': re.compile(r'[0-9]+'),
+            'SINGLE_MONTH': month_anchor,
+            'SINGLE_WEEK': re.compile((r'\b(?:' + weekday + r')').lower())
+        }
 
-        return ans
+    @staticmethod
+    def _anchor_windows(text: str, lower_text: str, anchor_regex) -> List[list]:
+        """
+        Merged [start, end] windows of the text around the matches of anchor_regex, each window ends
+        before a whitespace (or at the end of the text) so that word boundaries at its end are unchanged.
+
+        """
+        windows = []
+        for anchor in anchor_regex.finditer(lower_text):
+            start = max(0, anchor.start() - ANCHOR_WINDOW_MARGIN)
+            end = anchor.end() + ANCHOR_WINDOW_MARGIN
+            if windows and start <= windows[-1][1]:
+                windows[-1][1] = max(windows[-1][1], end)
+            else:
+                windows.append([start, end])
+
+        result = []
+        for start, end in windows:
+            whitespace = WHITESPACE.search(text, end)
+            end = whitespace.start() if whitespace else len(text)
+            if result and start <= result[-1][1]:
+                result[-1][1] = max(result[-1][1], end)
+            else:
+                result.append([start, end])
+        return result
+
+    def _match_default_formats(self, text: str) -> List[List[dict]]:
+        """
+        Match all the default formats in the text, only scanning the windows around the anchors of each order.
+        Returns the same matches as running finditer of each order on the whole text.
+
+        """
+        lower_text = text.lower()
+        if len(lower_text) != len(text):
+            # a few characters change length when lower cased, the anchor offsets would not match the text
+            return [[self._wrap_date_match(order, match) for match in compiled_regex.finditer(text)]
+                    for order, compiled_regex in self._compiled_regex.items()]
+
+        results = []
+        windows_by_anchor = {}
+        for order, compiled_regex in self._compiled_regex.items():
+            anchor_regex = self._anchor_regex[order]
+            if anchor_regex not in windows_by_anchor:
+                windows_by_anchor[anchor_regex] = self._anchor_windows(text, lower_text, anchor_regex)
+            results.append([self._wrap_date_match(order, match) for start, end in windows_by_anchor[anchor_regex]
+                            for match in compiled_regex.finditer(text, start, end)])
+        return results
+
+    def _get_additional_regex(self, date_format: str) -> dict:
+        """
+        Translate a user defined format like '%Y@%m@%d' to a regex, cached per format.
+
+        """
+        if date_format not in self._additional_regex:
+            order = ''
+            reg = date_format
+            for key in singleton_regex:
+                if key[0] == '%':
+                    reg2 = re.sub(key, singleton_regex[key], reg)
+                    if reg != reg2:
+                        if key in units['M']:
+                            order += 'M'
+                        elif key in units['Y']:
+                            order += 'Y'
+                        elif key in units['D']:
+                            order += 'D'
+                        reg = reg2
+            try:
+                compiled_reg = re.compile(reg, re.I)
+            except re.error:
+                compiled_reg = None
+            self._additional_regex[date_format] = {
+                'reg': reg,
+                'compiled_reg': compiled_reg,
+                'pattern': date_format,
+                'order': order,
+            }
+        return self._additional_regex[date_format]
 
     def _wrap_extraction(self, date_object: datetime.datetime,
                         original_text: str,
@@ -316,9 +496,7 @@ class DateExtractor(Extractor):
 
         """
         res = []
-        all_results = []
-        for x in results:
-            all_results = all_results + x
+        all_results = [x for matches in results for x in matches]
         if not all_results or len(all_results) == 0:
             return list()
         all_results.sort(key=lambda k: k['start'])
@@ -539,7 +717,11 @@ class DateExtractor(Extractor):
             base = base.replace(tzinfo=None)
         elif not base.tzinfo:
             base = base.astimezone(self._default_tz)
-        res = SpacyRuleExtractor(self._etk.default_nlp, spacy_rules, 'relative_date_extractor').extract(text)
+        if not self._relative_date_extractor:
+            # building the rule extractor is expensive (spaCy patterns, vocab flags), do it once per DateExtractor
+            self._relative_date_extractor = SpacyRuleExtractor(self._etk.default_nlp, spacy_rules,
+                                                               'relative_date_extractor')
+        res = self._relative_date_extractor.extract(text)
         ans = list()
         for relative_date in res:
             if relative_date.rule_id == 'direction_number_unit':
@@ -595,10 +777,10 @@ class DateExtractor(Extractor):
         if date_info['pattern']:
             return True
         # TODO: consider more context when extract dates?? (e.g. for 'may')
-        if date_info['value'] == 'may' or re.match(illegal, date_info['value'])\
-            or (re.match(possible_illegal, date_info['value']) and len([g for g in date_info['groups'] if g]) != 2) \
-            or (re.match(possible_illegal_3, date_info['value']) and len([g for g in date_info['groups'] if g]) != 3) \
-            or (re.match('^\b?[0-9]{4}\b?$', date_info['value']) and len([g for g in date_info['groups'] if g]) > 1):
+        if date_info['value'] == 'may' or ILLEGAL.match(date_info['value'])\
+            or (POSSIBLE_ILLEGAL.match(date_info['value']) and len([g for g in date_info['groups'] if g]) != 2) \
+            or (POSSIBLE_ILLEGAL_3.match(date_info['value']) and len([g for g in date_info['groups'] if g]) != 3) \
+            or (SINGLE_YEAR_ONLY.match(date_info['value']) and len([g for g in date_info['groups'] if g]) > 1):
             return False
         return True
 
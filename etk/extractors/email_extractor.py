@@ -1,9 +1,9 @@
 from etk.extractor import Extractor, InputType
 from etk.extraction import Extraction
+from etk.tokenizer import pipe
 from spacy.matcher import Matcher
 from spacy.attrs import LIKE_EMAIL
 from typing import List
-import copy
 
 
 FILTER_PROVIDER = ["noon", "no"]
@@ -20,6 +20,7 @@ class EmailExtractor(Extractor):
 
             email_extractor = EmailExtractor(...)
             email_extractor.extract(text=input_doc,...)
+            email_extractor.extract_many(texts=input_docs, batch_size=100)
 
     """
     def __init__(self,
@@ -40,8 +41,10 @@ class EmailExtractor(Extractor):
                            category="build_in_extractor",
                            name=extractor_name)
 
-        self._nlp = copy.deepcopy(nlp)
+        # only the tokenizer and the vocab of nlp are used, it does not need a copy
+        self._nlp = nlp
         self._like_email_matcher = Matcher(self._nlp.vocab)
+        self._load_email_matcher()
         self._tokenizer = tokenizer
 
     def _load_email_matcher(self):
@@ -58,9 +61,27 @@ class EmailExtractor(Extractor):
 
         """
 
+        return self._wrap_emails(self._nlp.make_doc(text))
+
+    def extract_many(self, texts: List[str], batch_size: int = 1000, n_process: int = 1) -> List[List[Extraction]]:
+        """
+        Extract from many texts at once, the texts are tokenized in batches with nlp.pipe,
+        the other pipes are not needed to match emails.
+
+        Args:
+            texts (List[str]): The input sources to be processed
+            batch_size (int): number of texts spaCy processes at a time
+            n_process (int): number of processes spaCy uses
+
+        Returns:
+            List[List[Extraction]]: The list of extractions of each text, in the same order as texts
+
+        """
+        return [self._wrap_emails(doc) for doc in
+                pipe(self._nlp, texts, disable=self._nlp.pipe_names, batch_size=batch_size, n_process=n_process)]
+
+    def _wrap_emails(self, first_phase_doc) -> List[Extraction]:
         result = []
-        first_phase_doc = self._nlp(text)
-        self._load_email_matcher()
         like_email_matches = self._like_email_matcher(first_phase_doc)
 
         like_emails_filtered = []
@@ -116,7 +137,7 @@ class EmailExtractor(Extractor):
             if "mail:" in e.text.lower():
                 idx = e.text.lower().index("mail:") + 5
                 value = e.text[idx:]
-                tmp_doc = self._nlp(value)
+                tmp_doc = self._nlp.make_doc(value)
                 tmp_email_matches = self._like_email_matcher(tmp_doc)
                 for match_id, start, end in tmp_email_matches:
                     span = tmp_doc[start:end]
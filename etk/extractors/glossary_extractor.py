@@ -5,12 +5,23 @@ from etk.extraction import Extraction
 from etk.tokenizer import Tokenizer
 from etk.etk_exceptions import ExtractorError
 from spacy.tokens import Token
-from pygtrie import CharTrie
-from itertools import *
+import spacy
 from functools import reduce
+import hashlib
+import json
+import os
 import re
+import tempfile
 
 disable_spacy = ['tagger', 'parser', 'ner']
+# key of the glossary value in a token trie node, cannot collide with a token
+_VALUE = None
+_token_regex = re.compile(r"[A-Za-z0-9]+|[^\w\s]|_")
+# format of the index files, part of their name, change it when the format changes
+_INDEX_FORMAT = "json entries 1"
+# the rules of a spaCy tokenizer, they decide how the glossary entries are tokenized
+_TOKENIZER_RULES = ("prefix_search", "suffix_search", "infix_finditer", "token_match", "url_match")
+
 # TODO have an elegant way of handling spacy tokens vs str tokens
 class GlossaryExtractor(Extractor):
     """
@@ -25,6 +36,13 @@ class GlossaryExtractor(Extractor):
             glossary_extractor = GlossaryExtractor(glossary=glossary,
                                                   ngrams=3,
                                                   case_sensitive=True)
+            # only the longest matches, e.g. 'New York City' but not 'New York' inside it
+            glossary_extractor = GlossaryExtractor(glossary=glossary,
+                                                  ngrams=None,
+                                                  longest_match_only=True)
+            # tokenize the glossary once, and load the tokenized entries from index_dir afterwards
+            glossary_extractor = GlossaryExtractor(glossary=glossary,
+                                                  index_dir=os.path.expanduser('~/.etk/glossary_index'))
             glossary_extractor.extract(tokens=Tokenizer(input_text))
 
     """
@@ -34,21 +52,24 @@ class GlossaryExtractor(Extractor):
                  extractor_name: str,
                  tokenizer: None,
                  ngrams: int = 2,
-                 case_sensitive=False) -> None:
+                 case_sensitive=False,
+                 longest_match_only=False,
+                 index_dir: str = None) -> None:
         # if we set tokenizer as None, extractor will use regex to extract tokens to expedite the extraction
         Extractor.__init__(self,
                            input_type=InputType.TOKENS,
                            category="glossary",
                            name=extractor_name)
         self._case_sensitive = case_sensitive
+        self._longest_match_only = longest_match_only
         self._default_tokenizer = tokenizer
-        if not ngrams:
-            ngrams = 0
-            for word in glossary:
-                ngrams = max(ngrams, len(self._default_tokenizer.tokenize(word)))
-        self._ngrams = min(ngrams, 5)
         self._joiner = " "
-        self._glossary = self._populate_trie(glossary)
+        if index_dir:
+            self._glossary = self._load_or_build_index(glossary, index_dir)
+        else:
+            self._glossary = self._populate_trie(glossary)
+        # matching walks the token trie, so the length of the longest entry is the only bound needed
+        self._ngrams = ngrams if ngrams else self._max_depth
 
     def extract(self, tokens: List[Token]) -> List[Extraction]:
         """
@@ -59,6 +80,8 @@ class GlossaryExtractor(Extractor):
 
         Returns:
             List[Extraction]: the list of extraction or the empty list if there are no matches.
+            All the matches are returned shortest first, unless the extractor is created with longest_match_only,
+            then only the longest match starting at each position, not overlapping the previous one, is returned.
 
         """
         results = list()
@@ -72,54 +95,156 @@ class GlossaryExtractor(Extractor):
             return results
 
         try:
-            ngrams_iter = self._generate_ngrams_with_context(new_tokens)
-            results.extend(map(lambda term: self._wrap_value_with_context(tokens, term[1], term[2]),
-                               filter(lambda term: isinstance(term[0], str),
-                                      map(lambda term: (self._glossary.get(term[0]), term[1], term[2]),
-                                          map(lambda term: (
-                                              self._combine_ngrams(term[0], self._joiner), term[1], term[2]),
-                                              ngrams_iter)))))
+            results.extend(self._wrap_value_with_context(tokens, start, end) for start, end in
+                           self._match_trie(new_tokens))
         except Exception as e:
             raise ExtractorError('GlossaryExtractor: Failed to extract with ' + self.name + '. Catch ' + str(e) + '. ')
         return results
 
-    def _generate_ngrams_with_context(self, tokens: List[Token]) -> chain:
-        """Generates the 1-gram to n-grams tuples of the list of tokens"""
-        chained_ngrams_iter = self._generate_ngrams_with_context_helper(iter(tokens), 1)
-        for n in range(2, self._ngrams + 1):
-            ngrams_iter = tee(tokens, n)
-            for j in range(1, n):
-                for k in range(j):
-                    next(ngrams_iter[j], None)
-            ngrams_iter_with_context = self._generate_ngrams_with_context_helper(zip(*ngrams_iter), n)
-            chained_ngrams_iter = chain(chained_ngrams_iter, ngrams_iter_with_context)
-        return chained_ngrams_iter
-
-    def _populate_trie(self, values: List[str]) -> CharTrie:
-        """Takes a list and inserts its elements into a new trie and returns it"""
-        if self._default_tokenizer:
-            return reduce(self._populate_trie_reducer, iter(values), CharTrie())
-        return reduce(self._populate_trie_reducer_regex, iter(values), CharTrie())
+    def _match_trie(self, tokens: List[str]) -> List[tuple]:
+        """Walks the token trie from every token once and returns the (start, end) of the matches"""
+        matches = list()
+        max_len = self._ngrams
+        num_tokens = len(tokens)
+        start = 0
+        while start < num_tokens:
+            node = self._glossary.get(tokens[start])
+            end = start + 1
+            longest = None
+            while node is not None:
+                if _VALUE in node:
+                    if self._longest_match_only:
+                        longest = end
+                    else:
+                        matches.append((start, end))
+                if end >= num_tokens or end - start >= max_len:
+                    break
+                node = node.get(tokens[end])
+                end += 1
+            if longest:
+                matches.append((start, longest))
+                start = longest
+            else:
+                start += 1
+        if not self._longest_match_only:
+            # same order as generating the 1-grams to n-grams
+            matches.sort(key=lambda match: match[1] - match[0])
+        return matches
 
-    def _populate_trie_reducer(self, trie_accumulator=CharTrie(), value="") -> CharTrie:
-        """Adds value to trie accumulator"""
-        if self._case_sensitive:
-            key = self._joiner.join([x.orth_ if isinstance(x, Token) else x for x in
-                                     self._default_tokenizer.tokenize(value, disable=disable_spacy)])
+    def _load_or_build_index(self, values: List[str], index_dir: str) -> dict:
+        """
+        Loads the tokenized entries of the glossary from index_dir, or tokenizes them and saves them there, then
+        builds the token trie.
+        The index file is named by the hash of the glossary and of the tokenizer settings, so it can be shared by all
+        the processes using the same glossary, and is rebuilt when either changes. It is a json file of the entries,
+        loading it never runs code from it.
+        """
+        index_path = os.path.join(index_dir, self._index_key(values) + ".glossary")
+        if os.path.exists(index_path):
+            try:
+                with open(index_path, "r", encoding="utf-8") as f:
+                    entries = json.load(f)["entries"]
+                if not all(isinstance(key, list) and all(isinstance(token, str) for token in key)
+                           and isinstance(value, str) for key, value in entries):
+                    raise ValueError("not a list of [tokens, entry]")
+                return self._trie_from_entries(entries)
+            except Exception as e:
+                warn('GlossaryExtractor: Failed to load glossary index ' + index_path + '. Catch ' + str(e) + '. ')
+
+        entries = [[self._entry_key(value), value] for value in values]
+        try:
+            os.makedirs(index_dir, exist_ok=True)
+            # write to a temporary file first, so other processes never load a partial index
+            fd, tmp_path = tempfile.mkstemp(dir=index_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump({"entries": entries}, f, ensure_ascii=False)
+                os.replace(tmp_path, index_path)
+            except BaseException:
+                # only a complete index is left in index_dir
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            warn('GlossaryExtractor: Failed to save glossary index ' + index_path + '. Catch ' + str(e) + '. ')
+        return self._trie_from_entries(entries)
+
+    def _trie_from_entries(self, entries: List[list]) -> dict:
+        """Builds the token trie of the [tokens, entry] of the glossary"""
+        self._max_depth = 0
+        trie = dict()
+        for key, value in entries:
+            self._add_to_trie(trie, key, value)
+        return trie
+
+    def _index_key(self, values: List[str]) -> str:
+        """Hash of the glossary entries and of everything used to tokenize them"""
+        h = hashlib.sha256()
+        settings = [type(self).__name__, str(self._case_sensitive), _INDEX_FORMAT]
+        if self._default_tokenizer:
+            settings.append(type(self._default_tokenizer).__name__)
+            settings.extend("{}={}".format(k, v) for k, v in sorted(vars(self._default_tokenizer).items())
+                            if isinstance(v, (bool, int, float, str)))
+            nlp = getattr(self._default_tokenizer, "nlp", None)
+            if nlp is not None:
+                settings.append(spacy.__version__)
+                settings.extend("{}={}".format(k, nlp.meta.get(k)) for k in ("lang", "name", "version"))
+                settings.extend(self._tokenizer_rules(nlp.tokenizer))
         else:
-            key = self._joiner.join([x.lower_ if isinstance(x, Token) else x.lower() for x in
-                                     self._default_tokenizer.tokenize(value, disable=disable_spacy)])
-        trie_accumulator[key] = value
-        return trie_accumulator
+            settings.append(_token_regex.pattern)
+        h.update("\n".join(settings).encode("utf-8"))
+        h.update(b"\0")
+        for value in values:
+            h.update(value.encode("utf-8"))
+            h.update(b"\n")
+        return h.hexdigest()
 
-    def _populate_trie_reducer_regex(self, trie_accumulator=CharTrie(), value="") -> CharTrie:
+    @staticmethod
+    def _tokenizer_rules(spacy_tokenizer) -> List[str]:
+        """
+        The prefix, suffix, infix, token match and special case rules of a spaCy tokenizer, the patterns of the
+        rules that are regex methods and the names of the other functions
+        """
+        rules = list()
+        for name in _TOKENIZER_RULES:
+            rule = getattr(spacy_tokenizer, name, None)
+            pattern = getattr(getattr(rule, "__self__", None), "pattern", None)
+            if pattern is None and rule is not None:
+                pattern = getattr(rule, "__module__", "") + "." + getattr(rule, "__qualname__", repr(rule))
+            rules.append("{}={}".format(name, pattern))
+        special_cases = getattr(spacy_tokenizer, "rules", None)
+        if special_cases:
+            rules.extend("rule {}={}".format(k, v) for k, v in sorted(special_cases.items()))
+        return rules
+
+    def _populate_trie(self, values: List[str]) -> dict:
+        """Takes a list and inserts the tokens of its elements into a new token trie and returns it"""
+        self._max_depth = 0
+        return reduce(self._populate_trie_reducer, iter(values), dict())
+
+    def _populate_trie_reducer(self, trie_accumulator=None, value="") -> dict:
         """Adds value to trie accumulator"""
-        regex = re.compile(r"[A-Za-z0-9]+|[^\w\s]|_")
+        return self._add_to_trie(trie_accumulator, self._entry_key(value), value)
+
+    def _entry_key(self, value: str) -> List[str]:
+        """The tokens of a glossary entry, as matched against the tokens of the documents"""
+        if self._default_tokenizer:
+            tokens = self._default_tokenizer.tokenize(value, disable=disable_spacy)
+            if self._case_sensitive:
+                return [x.orth_ if isinstance(x, Token) else x for x in tokens]
+            return [x.lower_ if isinstance(x, Token) else x.lower() for x in tokens]
         if self._case_sensitive:
-            key = self._joiner.join([x for x in re.findall(regex, value)])
-        else:
-            key = self._joiner.join([x.lower() for x in re.findall(regex, value)])
-        trie_accumulator[key] = value
+            return _token_regex.findall(value)
+        return [x.lower() for x in _token_regex.findall(value)]
+
+    def _add_to_trie(self, trie_accumulator: dict, key: List[str], value: str) -> dict:
+        """Adds the tokens of value to trie accumulator, the value is stored in the node of its last token"""
+        if not key:
+            return trie_accumulator
+        node = trie_accumulator
+        for token in key:
+            node = node.setdefault(token, dict())
+        node[_VALUE] = value
+        self._max_depth = max(self._max_depth, len(key))
         return trie_accumulator
 
     def _wrap_value_with_context(self, tokens: List[Token], start: int, end: int) -> Extraction:
@@ -132,17 +257,3 @@ class GlossaryExtractor(Extractor):
                           end_char=tokens[end - 1].idx + len(tokens[end - 1].orth_) if isinstance(tokens[end - 1],
                                                                                                   Token) else -1
                           )
-
-    @staticmethod
-    def _generate_ngrams_with_context_helper(ngrams_iter: iter, ngrams_len: int) -> map:
-        """Updates the end index"""
-        return map(lambda term: (term[1], term[0], term[0] + ngrams_len), enumerate(ngrams_iter))
-
-    @staticmethod
-    def _combine_ngrams(ngrams, joiner) -> str:
-        """Construct keys for checking in trie"""
-        if isinstance(ngrams, str):
-            return ngrams
-        else:
-            combined = joiner.join(ngrams)
-            return combined
@@ -4,6 +4,7 @@ from bs4 import BeautifulSoup
 from bs4.element import Comment
 from etk.extractor import Extractor, InputType
 from etk.extraction import Extraction
+from etk.html_dom import parse_html
 from etk.extractors.readability.readability import Document
 
 
@@ -54,7 +55,7 @@ class HTMLContentExtractor(Extractor):
 
         if html_text:
             if strategy == Strategy.ALL_TEXT:
-                soup = BeautifulSoup(html_text, 'html.parser')
+                soup = parse_html(html_text, 'html.parser')
                 texts = soup.findAll(text=True)
                 visible_texts = filter(self._tag_visible, texts)
                 all_text = u" ".join(t.strip() for t in visible_texts)
@@ -1,10 +1,10 @@
 from typing import List
 from etk.extractor import Extractor, InputType
 from etk.extraction import Extraction, Extractable
+from etk.html_dom import parse_html, LXML_HTML
 from extruct.w3cmicrodata import MicrodataExtractor
 from extruct.jsonld import JsonLdExtractor
 from extruct.rdfa import RDFaExtractor
-from bs4 import BeautifulSoup
 
 
 class HTMLMetadataExtractor(Extractor):
@@ -61,7 +61,7 @@ class HTMLMetadataExtractor(Extractor):
             List[Extraction]: the list of extraction or the empty list if there are no matches.
         """
         res = list()
-        soup = BeautifulSoup(html_text, 'html.parser')
+        soup = parse_html(html_text, 'html.parser')
 
         if soup.title and extract_title:
             title = self._wrap_data("title", soup.title.string.encode('utf-8').decode('utf-8'))
@@ -72,14 +72,17 @@ class HTMLMetadataExtractor(Extractor):
             meta_data = self._wrap_data("meta", meta_content)
             res.append(meta_data)
 
+        # microdata and json-ld are extracted from the same lxml tree
+        tree = parse_html(html_text, LXML_HTML) if extract_microdata or extract_json_ld else None
+
         if extract_microdata:
             mde = MicrodataExtractor()
-            mde_data = self._wrap_data("microdata", mde.extract(html_text, microdata_base_url))
+            mde_data = self._wrap_data("microdata", mde.extract_items(tree, microdata_base_url))
             res.append(mde_data)
 
         if extract_json_ld:
             jslde = JsonLdExtractor()
-            jslde_data = self._wrap_data("json-ld", jslde.extract(html_text))
+            jslde_data = self._wrap_data("json-ld", jslde.extract_items(tree))
             res.append(jslde_data)
 
         if extract_rdfa:
@@ -3,8 +3,55 @@ from etk.extraction import Extraction
 from etk.extractor import Extractor, InputType
 
 from enum import Enum, auto
+from functools import lru_cache
 from langid import classify
-from langdetect import detect
+from langdetect.detector_factory import DetectorFactory, PROFILES_DIRECTORY
+
+# number of leading characters of a text used to detect its language when sampling
+LANGUAGE_DETECTION_SAMPLE_SIZE = 1000
+
+_detector_factory = None
+
+
+def _get_detector_factory() -> DetectorFactory:
+    """
+    The langdetect DetectorFactory shared by all extractors, profiles are loaded once and the factory is seeded,
+    so the same text always gets the same language.
+    """
+    global _detector_factory
+    if _detector_factory is None:
+        factory = DetectorFactory()
+        factory.load_profile(PROFILES_DIRECTORY)
+        factory.set_seed(0)
+        _detector_factory = factory
+    return _detector_factory
+
+
+def _detect(text: str) -> str:
+    detector = _get_detector_factory().create()
+    detector.append(text)
+    return detector.detect()
+
+
+@lru_cache(maxsize=4096)
+def _detect_sample(sample: str) -> str:
+    return _detect(sample)
+
+
+def detect_language(text: str, sample_size: int = LANGUAGE_DETECTION_SAMPLE_SIZE) -> str:
+    """
+    Detect the language of a text with langdetect, using the shared seeded DetectorFactory.
+
+    Args:
+        text (str): any text
+        sample_size (int): only use this many leading characters of the text, results for the samples are cached.
+            None to use the whole text, without caching.
+
+    Returns: str, the ISO 639-1 code of the language. Raises LangDetectException if no language can be detected.
+    """
+    if sample_size:
+        return _detect_sample(text[:sample_size])
+    return _detect(text)
 
 
 class LanguageIdentificationExtractor(Extractor):
@@ -54,7 +101,7 @@ class LanguageIdentificationExtractor(Extractor):
 
         elif method == IdentificationTool.LANGDETECT.name:
             try:
-                language = detect(text)
+                language = detect_language(text, sample_size=None)
             except:
                 language = 'unknown'
 
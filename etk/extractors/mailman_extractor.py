@@ -1,5 +1,6 @@
 from etk.extractor import Extractor, InputType
 from etk.extraction import Extraction
+from etk.html_dom import parse_html
 from typing import List
 from email.utils import parsedate_to_datetime
 from bs4 import BeautifulSoup
@@ -108,7 +109,7 @@ class MailmanExtractor(Extractor):
         Returns: Extraction
         """
         
-        content = BeautifulSoup(text, 'html5lib')
+        content = parse_html(text, 'html5lib')
         subject = content.find('h1').text.strip()
         recip = self.mailing_list_name
         
@@ -1,9 +1,10 @@
 from typing import List
 from etk.extraction import Extraction
 from etk.extractor import Extractor, InputType
+from etk.tokenizer import pipe
 
-import copy
-import spacy
+import weakref
+from etk import nlp_registry
 
 
 class SentenceExtractor(Extractor):
@@ -16,6 +17,7 @@ class SentenceExtractor(Extractor):
 
             sentence_extractor = SentenceExtractor(custom_nlp=nlp)
             sentence_extractor.extract(text=text)
+            sentence_extractor.extract_many(texts=texts, batch_size=100)
     """
 
     def __init__(self, name: str = None, custom_nlp: type = None) -> None:
@@ -24,35 +26,26 @@ class SentenceExtractor(Extractor):
                            category="Text extractor",
                            name=name if name else "Sentence extractor")
 
-        load_parser = False
+        # the pipeline is shared, the pipes other than the parser are disabled when it is called
+        self._parser = None
         if custom_nlp:
             try:
-                custom_pipeline = copy.deepcopy(custom_nlp)
-                pipe_names = custom_pipeline.pipe_names
-                for pipe in pipe_names:
-                    if pipe != "parser":
-                        custom_pipeline.remove_pipe(pipe)
-
-                try:
-                    assert "parser" in custom_pipeline.pipe_names
-                    self._parser = custom_pipeline
-                except AssertionError:
+                if "parser" in custom_nlp.pipe_names:
+                    self._parser = custom_nlp
+                else:
                     print("Note: custom_pipeline does not have a parser. \n"
                           "Loading parser from en_core_web_sm... ")
-                    load_parser = True
 
             except AttributeError as e:
                 print("Note: custom_pipeline does not have expected "
                       "attributes.")
                 print(e)
                 print("Loading parser from en_core_web_sm...")
-                load_parser = True
-        else:
-            load_parser = True
 
-        if load_parser:
-            self._parser = spacy.load("en_core_web_sm",
-                                     disable=["tagger", "ner"])
+        if self._parser is None:
+            self._parser = nlp_registry.load_model("en_core_web_sm")
+            weakref.finalize(self, nlp_registry.release, self._parser)
+        self._disable = [name for name in self._parser.pipe_names if name != "parser"]
 
     def extract(self, text: str) -> List[Extraction]:
         """
@@ -65,8 +58,24 @@ class SentenceExtractor(Extractor):
             List[Extraction]: the list of extraction or the empty list if there are no matches.
         """
 
-        doc = self._parser(text)
+        return self._wrap_sentences(self._parser(text, disable=self._disable))
 
+    def extract_many(self, texts: List[str], batch_size: int = 1000, n_process: int = 1) -> List[List[Extraction]]:
+        """
+        Splits many texts by sentences, the texts are processed in batches with nlp.pipe.
+
+        Args:
+            texts (List[str]): Input texts to be extracted.
+            batch_size (int): number of texts spaCy processes at a time.
+            n_process (int): number of processes spaCy uses.
+
+        Returns:
+            List[List[Extraction]]: the list of extractions of each text, in the same order as texts.
+        """
+        return [self._wrap_sentences(doc) for doc in
+                pipe(self._parser, texts, disable=self._disable, batch_size=batch_size, n_process=n_process)]
+
+    def _wrap_sentences(self, doc) -> List[Extraction]:
         extractions = list()
         for sent in doc.sents:
             this_extraction = Extraction(value=sent.text,
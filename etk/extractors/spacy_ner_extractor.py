@@ -1,6 +1,7 @@
 import spacy
 from etk.extractor import Extractor, InputType
 from etk.extraction import Extraction
+from etk.tokenizer import pipe
 from typing import List
 
 
@@ -16,6 +17,7 @@ class SpacyNerExtractor(Extractor):
             get_attr = ['PERSON', 'ORG', 'GPE']
             spacy_ner_extractor = SpacyNerExtractor()
             spacy_ner_extractor.extract(text=text, get_attr=get_attr)
+            spacy_ner_extractor.extract_many(texts=texts, get_attr=get_attr, batch_size=100)
 
     """
     def __init__(self, extractor_name: str, nlp=spacy.load('en_core_web_sm')):
@@ -35,7 +37,27 @@ class SpacyNerExtractor(Extractor):
         Returns:
             List(Extraction): the list of extraction or the empty list if there are no matches.
         """
-        doc = self.__nlp(text)
+        return self._wrap_entities(self.__nlp(text), get_attr)
+
+    def extract_many(self, texts: List[str], get_attr=['PERSON', 'ORG', 'GPE'], batch_size: int = 1000,
+                     n_process: int = 1) -> List[List[Extraction]]:
+        """
+        Extract from many texts at once, the texts are processed in batches with nlp.pipe,
+        without the tagger and the parser.
+
+        Args:
+            texts (List[str]): the texts to extract from.
+            get_attr (List[str]): The spaCy NER attributes we're interested in.
+            batch_size (int): number of texts spaCy processes at a time.
+            n_process (int): number of processes spaCy uses.
+
+        Returns:
+            List(List(Extraction)): the list of extractions of each text, in the same order as texts.
+        """
+        return [self._wrap_entities(doc, get_attr) for doc in
+                pipe(self.__nlp, texts, disable=["tagger", "parser"], batch_size=batch_size, n_process=n_process)]
+
+    def _wrap_entities(self, doc, get_attr: List[str]) -> List[Extraction]:
         attr_list = list()
         for ent in doc.ents:
             if ent.label_ in get_attr:
@@ -2,61 +2,17 @@ from typing import List, Dict
 from etk.extractor import Extractor, InputType
 from etk.extraction import Extraction
 from etk.tokenizer import Tokenizer
+from etk import nlp_registry
 from spacy.matcher import Matcher
 from spacy import attrs
 from spacy.tokens import span, doc
 from etk.extractors.util.util import tf_transfer
 import copy
 import itertools
+import weakref
 import sys
 import re
-
-FLAG_DICT = {
-    20: attrs.FLAG20,
-    21: attrs.FLAG21,
-    22: attrs.FLAG22,
-    23: attrs.FLAG23,
-    24: attrs.FLAG24,
-    25: attrs.FLAG25,
-    26: attrs.FLAG26,
-    27: attrs.FLAG27,
-    28: attrs.FLAG28,
-    29: attrs.FLAG29,
-    30: attrs.FLAG30,
-    31: attrs.FLAG31,
-    32: attrs.FLAG32,
-    33: attrs.FLAG33,
-    34: attrs.FLAG34,
-    35: attrs.FLAG35,
-    36: attrs.FLAG36,
-    37: attrs.FLAG37,
-    38: attrs.FLAG38,
-    39: attrs.FLAG39,
-    40: attrs.FLAG40,
-    41: attrs.FLAG41,
-    42: attrs.FLAG42,
-    43: attrs.FLAG43,
-    44: attrs.FLAG44,
-    45: attrs.FLAG45,
-    46: attrs.FLAG46,
-    47: attrs.FLAG47,
-    48: attrs.FLAG48,
-    49: attrs.FLAG49,
-    50: attrs.FLAG50,
-    51: attrs.FLAG51,
-    52: attrs.FLAG52,
-    53: attrs.FLAG53,
-    54: attrs.FLAG54,
-    55: attrs.FLAG55,
-    56: attrs.FLAG56,
-    57: attrs.FLAG57,
-    58: attrs.FLAG58,
-    59: attrs.FLAG59,
-    60: attrs.FLAG60,
-    61: attrs.FLAG61,
-    62: attrs.FLAG62,
-    63: attrs.FLAG63
-}
+import spacy
 
 POS_MAP = {
     "AUX": "AUX",
@@ -81,8 +37,9 @@ POS_MAP = {
     "PRON": "PRON"
 }
 
+# The Matcher takes set membership predicates, e.g. {"IN": [...]}, since spaCy 2.1
+SET_PREDICATES = tuple(int(x) for x in re.findall(r"\d+", spacy.__version__)[:2]) >= (2, 1)
 
-FLAG_ID = 20
 
 
 class SpacyRuleExtractor(Extractor):
@@ -121,15 +78,19 @@ class SpacyRuleExtractor(Extractor):
                            category="spacy_rule_extractor",
                            name=extractor_name)
         self._rules = rules["rules"]
-        self._nlp = copy.deepcopy(nlp)
-        self._tokenizer = Tokenizer(self._nlp)
+        # the pipeline and vocab are shared, the matchers and flags belong to this extractor
+        self._tokenizer = nlp_registry.get_tokenizer(nlp)
+        weakref.finalize(self, nlp_registry.release, self._tokenizer)
+        self._nlp = self._tokenizer.nlp
         self._matcher = Matcher(self._nlp.vocab)
         self._field_name = rules["field_name"] if "field_name" in rules else extractor_name
         self._rule_lst = {}
         self._hash_map = {}
+        self._relation_matchers = {}
         for idx, a_rule in enumerate(self._rules):
             this_rule = Rule(a_rule, self._nlp)
             self._rule_lst[this_rule.identifier + "rule_id##" + str(idx)] = this_rule
+        self._load_matcher()
 
     def extract(self, text: str) -> List[Extraction]:
         """
@@ -143,15 +104,15 @@ class SpacyRuleExtractor(Extractor):
         """
 
         doc = self._tokenizer.tokenize_to_spacy_doc(text)
-        self._load_matcher()
 
         matches = [x for x in self._matcher(doc) if x[1] != x[2]]
         pos_filtered_matches = []
         neg_filtered_matches = []
         for idx, start, end in matches:
-            span_doc = self._tokenizer.tokenize_to_spacy_doc(doc[start:end].text)
+            # copy the matched tokens into their own Doc instead of running the pipeline on the span text again
+            span_doc = doc[start:end].as_doc()
             this_spacy_rule = self._matcher.get(idx)
-            relations = self._find_relation(span_doc, this_spacy_rule)
+            relations = self._find_relation(span_doc, idx, this_spacy_rule)
             rule_id, _ = self._hash_map[idx]
             this_rule = self._rule_lst[rule_id]
             if self._filter_match(doc[start:end], relations, this_rule.patterns):
@@ -186,7 +147,7 @@ class SpacyRuleExtractor(Extractor):
 
     def _load_matcher(self) -> None:
         """
-        Add constructed spacy rule to Matcher
+        Add constructed spacy rule to Matcher, called once when the extractor is created
         """
         for id_key in self._rule_lst:
             if self._rule_lst[id_key].active:
@@ -419,11 +380,30 @@ class SpacyRuleExtractor(Extractor):
         self._hash_map[hash_v] = hash_key
         return hash_v
 
-    def _find_relation(self, span_doc: doc, r: List) -> Dict:
+    def _get_relation_matcher(self, match_key: int, e_id: int, rule: List) -> Matcher:
+        """
+        Matcher for the element e_id of a spacy rule and the element after it, cached per spacy rule and element
+        Args:
+            match_key: int, the key of the spacy rule in self._matcher
+            e_id: int
+            rule: List
+
+        Returns: Matcher
+        """
+
+        if (match_key, e_id) not in self._relation_matchers:
+            tmp_matcher = Matcher(self._nlp.vocab)
+            tmp_matcher.add(0, None, [rule[e_id]])
+            tmp_matcher.add(1, None, [rule[e_id+1]])
+            self._relation_matchers[(match_key, e_id)] = tmp_matcher
+        return self._relation_matchers[(match_key, e_id)]
+
+    def _find_relation(self, span_doc: doc, match_key: int, r: List) -> Dict:
         """
         Get the relations between the each pattern in the spacy rule and the matches
         Args:
             span_doc: doc
+            match_key: int, the key of the spacy rule in self._matcher
             r: List
 
         Returns: Dict
@@ -437,18 +417,17 @@ class SpacyRuleExtractor(Extractor):
                 for extra_id, _, in enumerate(rule[e_id:]):
                     relation[e_id+extra_id] = None
                 break
-            new_doc = self._tokenizer.tokenize_to_spacy_doc(span_doc[span_pivot:].text)
             if "OP" not in element:
                 relation[e_id] = (span_pivot, span_pivot+1)
                 span_pivot += 1
             else:
                 if e_id < len(rule)-1:
-                    tmp_rule_1 = [rule[e_id]]
-                    tmp_rule_2 = [rule[e_id+1]]
-                    tmp_matcher = Matcher(self._nlp.vocab)
-                    tmp_matcher.add(0, None, tmp_rule_1)
-                    tmp_matcher.add(1, None, tmp_rule_2)
-                    tmp_matches = sorted([x for x in tmp_matcher(new_doc) if x[1] != x[2]], key=lambda a: a[1])
+                    tmp_matcher = self._get_relation_matcher(match_key, e_id, rule)
+                    # both patterns are single tokens, so matching the whole span and shifting the offsets
+                    # is the same as matching the remainder of the span starting at span_pivot
+                    tmp_matches = sorted([(m_id, s - span_pivot, e - span_pivot)
+                                          for m_id, s, e in tmp_matcher(span_doc) if s >= span_pivot and s != e],
+                                         key=lambda a: a[1])
 
                     if not tmp_matches:
                         relation[e_id] = None
@@ -551,16 +530,7 @@ class Pattern(object):
 
         else:
             if "match_all_forms" in d and not tf_transfer(d["match_all_forms"]):
-                global FLAG_ID
-                token_set = set(d["token"])
-
-                def is_selected_token(x):
-                    return x in token_set
-
-                FLAG_DICT[FLAG_ID] = nlp.vocab.add_flag(is_selected_token)
-                this_token = {FLAG_DICT[FLAG_ID]: True}
-                FLAG_ID += 1
-                result.append(this_token)
+                result = self._orth_in(set(d["token"]))
 
             else:
                 token_set = [nlp(x)[0].lemma_ for x in set(d["token"])]
@@ -622,16 +592,7 @@ class Pattern(object):
             this_token = {attrs.ORTH: str(d["numbers"][0])}
             result.append(this_token)
         else:
-            global FLAG_ID
-            number_set = set(d["numbers"])
-
-            def is_selected_number(x):
-                return x in number_set
-
-            FLAG_DICT[FLAG_ID] = nlp.vocab.add_flag(is_selected_number)
-            this_token = {FLAG_DICT[FLAG_ID]: True}
-            FLAG_ID += 1
-            result.append(this_token)
+            result = self._orth_in({x for x in d["numbers"] if isinstance(x, str)})
         result = self._add_common_constrain(result, d)
         return result
 
@@ -647,20 +608,11 @@ class Pattern(object):
 
         result = []
         if not d["token"]:
-            this_token = {attrs.IS_PUNCT: True}
+            result.append({attrs.IS_PUNCT: True})
         elif len(d["token"]) == 1:
-            this_token = {attrs.ORTH: d["token"][0]}
+            result.append({attrs.ORTH: d["token"][0]})
         else:
-            global FLAG_ID
-            punct_set = set(d["token"])
-
-            def is_selected_punct(x):
-                return x in punct_set
-
-            FLAG_DICT[FLAG_ID] = nlp.vocab.add_flag(is_selected_punct)
-            this_token = {FLAG_DICT[FLAG_ID]: True}
-            FLAG_ID += 1
-        result.append(this_token)
+            result = self._orth_in(set(d["token"]))
         result = self._add_common_constrain(result, d)
         return result
 
@@ -728,6 +680,21 @@ class Pattern(object):
                     result.append(copy.deepcopy(a_token))
         return result
 
+    @staticmethod
+    def _orth_in(values: set) -> List[Dict]:
+        """
+        Construct the tokens matching one of the given texts. The texts are not added as a lexeme flag, the flags
+        belong to the vocab shared by all the extractors of a pipeline, and spaCy has few of them.
+        Args:
+            values: set
+
+        Returns: List[Dict]
+        """
+
+        if SET_PREDICATES:
+            return [{attrs.ORTH: {"IN": sorted(values)}}]
+        return [{attrs.ORTH: value} for value in sorted(values)] or [{attrs.ORTH: ""}]
+
     @staticmethod
     def _add_pos_constrain(token_lst: List[Dict], pos_tags: List) -> List[Dict]:
         """
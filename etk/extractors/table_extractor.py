@@ -1,14 +1,37 @@
 # -*- coding: utf-8 -*-
-from typing import List
+from typing import List, Dict, Set
+from enum import Enum, auto
 from etk.extractor import Extractor, InputType
 from etk.extraction import Extraction
 
+from etk.html_dom import parse_html, LXML_HTML
+
 from bs4 import BeautifulSoup
-from bs4.element import Comment
+from bs4.element import Comment, NavigableString, Tag
+from bs4.builder import HTML5TreeBuilder, HTMLParserTreeBuilder
+from lxml import etree
+import itertools
 import re
 import copy
 
 
+class TableEngine(Enum):
+    """
+    HTML5LIB: TableExtraction, the page is parsed by html5lib into BeautifulSoup
+    LXML: LxmlTableExtraction, the page is parsed by lxml, faster, the same tables for pages without markup errors
+        in their tables
+    """
+    HTML5LIB = auto()
+    LXML = auto()
+
+
+# characters removed from the cells by Toolkit.clean_cells: non ascii characters, punctuation other than the kept
+# ones, and the dot before a lowercase letter, e.g. "a.m." -> "a m."
+_unclean_re = re.compile(r'[^\x00-\x7F]|[^\s\w\.\-\$_%\^&*#~+@"\']|\.(?=[a-z])')
+_email_name_re = re.compile('[a-z][a-z][a-z]+@')
+_digits_to_num = str.maketrans({digit: 'NUM' for digit in '0123456789'})
+
+
 class Toolkit:
     @staticmethod
     def create_table_array(t, put_extractions=False):
@@ -30,30 +53,48 @@ class Toolkit:
         return tt
 
     @staticmethod
-    def regulize_cells(t):
+    def regulize_cells(t):  # modifies t
         for r in t:
-            for i in range(len(r)):
-                r[i] = re.sub('[0-9]', 'NUM', r[i])
-                # for x in re.findall('([0-9])', r[i]):
-                #     int_x = int(x)
-                #     if int_x < 5:
-                #         r[i] = re.sub(x, 'SSSS', r[i])
-                #     else:
-                #         r[i] = re.sub(x, 'LLLL', r[i])
-                for x in re.findall('([a-z][a-z][a-z]+@)', r[i]):
-                    r[i] = re.sub(x, 'EMAILNAME ', r[i])
-
-    @staticmethod
-    def clean_cells(t): # modifies t
+            r[:] = [Toolkit._regulize_cell(cell) for cell in r]
+
+    @staticmethod
+    def clean_cells(t):  # modifies t
         for r in t:
-            for i in range(len(r)):
-                r[i] = re.sub(r'[^\x00-\x7F]',' ', r[i]) #remove unicodes
-                # r[i] = re.sub('[\'"]', '', r[i]) #remove annoying puncts
-                r[i] = re.sub('[^\s\w\.\-\$_%\^&*#~+@"\']', ' ', r[i]) #remove annoying puncts
-                for x in re.findall('(\.[a-z])', r[i]):
-                    r[i] = re.sub('\.{0}'.format(x[1]), ' {0}'.format(x[1]), r[i])
-                r[i] = re.sub('\s+', ' ', r[i])
-                r[i] = r[i].strip()
+            r[:] = [Toolkit._clean_cell(cell) for cell in r]
+
+    @staticmethod
+    def normalize_cells(t):  # modifies t
+        """
+        clean_cells then regulize_cells, in one pass over the table array
+
+        Args:
+            t: a table array, e.g. from create_table_array
+        """
+        regulize_cell = Toolkit._regulize_cell
+        clean_cell = Toolkit._clean_cell
+        for r in t:
+            r[:] = [regulize_cell(clean_cell(cell)) for cell in r]
+
+    @staticmethod
+    def _clean_cell(cell: str) -> str:
+        return ' '.join(_unclean_re.sub(' ', cell).split())
+
+    @staticmethod
+    def _regulize_cell(cell: str) -> str:
+        cell = cell.translate(_digits_to_num)
+        if '@' not in cell:
+            return cell
+        names = _email_name_re.findall(cell)
+        if not names:
+            return cell
+
+        def replace(match):
+            # the names found used to be replaced one after the other, a match is replaced from the first one it ends with
+            text = match.group()
+            for name in names:
+                if text.endswith(name):
+                    return text[:-len(name)] + 'EMAILNAME '
+        return _email_name_re.sub(replace, cell)
 
 
 class EntityTableDataExtraction(Extractor):
@@ -63,6 +104,8 @@ class EntityTableDataExtraction(Extractor):
                            category="data",
                            name="DigEntityTableDataExtractor")
         self.glossaries = dict()
+        # attribute name -> (entries of its glossary, index of the entries), see _glossary_index
+        self._glossary_indexes = dict()
 
     def add_glossary(self, glossary: List[str], attr_name: str) -> None:
         """
@@ -71,6 +114,7 @@ class EntityTableDataExtraction(Extractor):
         :param attr_name: the attribute name (field name)
         """
         self.glossaries[attr_name] = glossary
+        self._glossary_indexes[attr_name] = (tuple(glossary), self._index_glossary(glossary))
 
     def wrap_value_with_context(self, value: dict, field_name: str, start: int=0, end: int=0) -> Extraction:
         """Wraps the final result"""
@@ -83,23 +127,66 @@ class EntityTableDataExtraction(Extractor):
         """
         if table['features']['max_cols_in_a_row'] != 2 and table['features']['no_of_rows'] < 2:
             return []
+        indexes = {field_name: self._glossary_index(glossary) for field_name, glossary in self.glossaries.items()}
         results = list()
         for row in table['rows']:
             if len(row['cells']) != 2:
                 continue
             text = [row['cells'][0]['text'], row['cells'][1]['text']]
-            for field_name in self.glossaries.keys():
-                if self.cell_matches_dict(text[0], self.glossaries[field_name]):
+            for field_name, index in indexes.items():
+                if self._cell_matches_index(text[0], index):
                     results.append(self.wrap_value_with_context(text[1], field_name))
-                if self.cell_matches_dict(text[1], self.glossaries[field_name]):
+                if self._cell_matches_index(text[1], index):
                     results.append(self.wrap_value_with_context(text[0], field_name))
         return results
 
     def cell_matches_dict(self, cell_text: str, glossary: List[str]) -> bool:
-        if any([self.cell_matches_text(cell_text, x) for x in glossary]):
-            return True
+        """
+        True if cell_text matches an entry of the glossary, as cell_matches_text, looking up the substrings of
+        cell_text in the index of the glossary instead of testing every entry
+        """
+        return self._cell_matches_index(cell_text, self._glossary_index(glossary))
+
+    def _glossary_index(self, glossary: List[str]) -> Dict[int, Set[str]]:
+        """
+        The index of the glossary, kept for the added glossaries while their entries are the same. A glossary
+        changed since it was added is indexed again, other glossaries are indexed on each call.
+        """
+        entries = tuple(glossary)
+        for indexed_entries, index in self._glossary_indexes.values():
+            if indexed_entries == entries:
+                return index
+        index = self._index_glossary(entries)
+        for field_name, added in self.glossaries.items():
+            if added is glossary:
+                self._glossary_indexes[field_name] = (entries, index)
+        return index
+
+    @staticmethod
+    def _cell_matches_index(cell_text: str, index: Dict[int, Set[str]]) -> bool:
+        cell_text = cell_text.lower()
+        length = len(cell_text)
+        for entry_length, entries in index.items():
+            # cell_matches_text: entry in cell_text and len(cell_text) / len(entry) < 1.5
+            if 2 * length < 3 * entry_length <= 3 * length:
+                for start in range(length - entry_length + 1):
+                    if cell_text[start:start + entry_length] in entries:
+                        return True
         return False
 
+    @staticmethod
+    def _index_glossary(glossary: List[str]) -> Dict[int, Set[str]]:
+        """
+        Returns: the lowercased entries of the glossary by length
+        """
+        index = dict()
+        for entry in glossary:
+            entry = entry.lower()
+            # an empty entry made cell_matches_text divide by zero, it matches nothing
+            if entry:
+                index.setdefault(len(entry), set()).add(entry)
+        return index
+
     def cell_matches_text(self, cell_text: str, text: str) -> bool:
         cell_text = cell_text.lower()
         text = text.lower()
@@ -178,11 +265,15 @@ class TableExtraction:
 
     @staticmethod
     def gen_context(seq):
+        # seq is only read up to its 5th distinct string
         seen = set()
-        seen_add = seen.add
-        uniq_list = [x for x in seq if not (x in seen or seen_add(x))]
-        if len(uniq_list) > 5:
-            uniq_list = uniq_list[:5]
+        uniq_list = list()
+        for x in seq:
+            if x not in seen:
+                seen.add(x)
+                uniq_list.append(x)
+                if len(uniq_list) == 5:
+                    break
         uniq_list = [x.replace("\t", "").replace("\r", "").replace("\n", "").strip() for x in uniq_list]
         if '' in uniq_list:
             uniq_list.remove('')
@@ -190,235 +281,340 @@ class TableExtraction:
             uniq_list.remove(' ')
         return uniq_list
 
-    def extract(self, html_doc, min_data_rows = 1):
+    @staticmethod
+    def index_strings(soup):
+        """
+        Walks the page once, so the context of each table is read from the strings around it instead of
+        searching the whole page before and after the table
+
+        Args:
+            soup: BeautifulSoup
+
+        Returns: the strings of the page in document order, and for each table of the page, in document order,
+            the indexes in the strings of its first string and of the first string after it
+        """
+        strings = list()
+        table_starts = list()
+        for element in soup.descendants:
+            if isinstance(element, NavigableString):
+                strings.append(element)
+            elif isinstance(element, Tag) and element.name == 'table':
+                table_starts.append((element, len(strings)))
+        table_spans = [(start, start + sum(1 for d in table.descendants if isinstance(d, NavigableString)))
+                       for table, start in table_starts]
+        return strings, table_spans
+
+    @staticmethod
+    def _strings_before(strings, removed, index):
+        """The strings before strings[index], nearest first, skipping the removed tables, as find_all_previous"""
+        i = index - 1
+        while i >= 0:
+            if i in removed:
+                i = removed[i]
+                continue
+            yield strings[i]
+            i -= 1
+
+    @staticmethod
+    def _strings_after(table, strings, index):
+        """The strings of the table and the strings from strings[index], as find_all_next"""
+        for d in table.descendants:
+            if isinstance(d, NavigableString):
+                yield d
+        for i in range(index, len(strings)):
+            yield strings[i]
+
+    def extract(self, html_doc, min_data_rows = 1, context: bool = True):
+        """
+        Args:
+            html_doc (str): raw html of the page
+            min_data_rows (int): minimum number of data rows of a data table
+            context (bool): if False, context_before and context_after of the tables are empty
+
+        Returns: dict, the data tables and the text of the page without them
+        """
         soup = BeautifulSoup(html_doc, 'html5lib')
         result_tables = list()
         tables = soup.findAll('table')
-        for table in tables:
-            tdcount = 0
-            max_tdcount = 0
-            img_count = 0
-            href_count = 0
-            inp_count = 0
-            sel_count = 0
-            colspan_count = 0
-            colon_count = 0
-            len_row = 0
-            table_data = ""
-            data_table = dict()
-            row_list = list()
+        if context:
+            strings, table_spans = TableExtraction.index_strings(soup)
+            # index of the last string of a removed table -> index of the string before the table
+            removed = dict()
+        for ti, table in enumerate(tables):
             rows = TableExtraction.is_data_table(table, min_data_rows)
             if rows != False:
-                features = dict()
-                row_len_list = list()
-                avg_cell_len = 0
-                avg_row_len_dev = 0
-                
-                num_rows = 0
-                num_cols = 0
-                max_cols = 0
-                row_shift = 0
-                
-                ## detect merged cells and find table demension
-                merged_cells = []
-                row_spans = dict()
-                for ri, row in enumerate(rows):
-                    rshift = 0
-                    num_rows += 1
-                    num_cols = 0
-                    col_shift = 0
-                    for ci, c in enumerate(row.findAll(['td', 'th'])):
-                        num_cols += 1
-                        cspan = c.get('colspan')
-                        rspan = c.get('rowspan')
-                        ci += col_shift+rshift
-                        
-                        if ci in row_spans:
-                            if row_spans[ci] <= 0:
-                                del row_spans[ci]
-                            else:
-                                rshift += 1
-                                row_spans[ci] -= 1
-                                ci += 1
-                        if cspan is not None and rspan is not None:
-                            cspan = int(cspan)
-                            rspan = int(rspan)
-                            col_shift += cspan-1
-                            row_spans[ci] = rspan-1
-                            merged_cells.append((ri, ri+rspan, ci, ci+cspan))
-                        elif cspan is not None:
-                            cspan = int(cspan)
-                            col_shift += cspan-1
-                            merged_cells.append((ri, ri+1, ci, ci+cspan))
-                        elif rspan is not None:
-                            rspan = int(rspan)
-                            row_spans[ci] = rspan-1
-                            merged_cells.append((ri, ri+rspan, ci, ci+1))
-                    if max_cols < num_cols:
-                        max_cols = num_cols
-                if len(merged_cells) > 0:
-                    max_cols = max(max_cols, max([x[3] for x in merged_cells]))
-                    num_rows = max(len(rows), max([x[1] for x in merged_cells]))
+                features, row_list = self.table_rows(rows)
+                if context:
+                    start, end = table_spans[ti]
+                    context_before = ' '.join(TableExtraction.gen_context(
+                        TableExtraction._strings_before(strings, removed, start)))
+                    context_after = ' '.join(TableExtraction.gen_context(
+                        TableExtraction._strings_after(table, strings, end)))
+                    if end > start:
+                        removed[end - 1] = min(start - 1, removed.get(end - 1, start - 1))
                 else:
-                    num_rows = len(rows)
-                
-                ## create table array
-                row_spans = dict()
-                for ri, row in enumerate(rows):
-                    row_data = ' '.join(row.stripped_strings)
-                    row_data = row_data.replace("\\t", "").replace("\\r", "").replace("\\n", "")
-                    
-                    row_len_list.append(len(row_data))
-                    row_tdcount = len(row.findAll('td')) + len(row.findAll('th'))
-                    if row_tdcount > max_tdcount:
-                        max_tdcount = row_tdcount
-                    tdcount += row_tdcount
-                    img_count += len(row.findAll('img'))
-                    href_count += len(row.findAll('a'))
-                    inp_count += len(row.findAll('input'))
-                    sel_count += len(row.findAll('select'))
-                    colspan_count += row_data.count("colspan")
-                    colon_count += row_data.count(":")
-                    len_row += 1
-                    table_data += str(row)
-                    
-                    row_dict = dict()
-                    newr = [None]*max_cols
-                    shift = 0
-                    rshift = 0
-                    ci = 0
-                    
-                    for i, c in enumerate(row.findAll(['td', 'th'])):
-                        ci = i+shift+rshift
-                        if ci in row_spans:
-                            if row_spans[ci] <= 0:
-                                del row_spans[ci]
-                            else:
-                                rshift += 1
-                                row_spans[ci] -= 1
-                                ci += 1
-                        for br in c.find_all("br"):
-                            br.replace_with(" ")
-                        for br in c.find_all("script"):
-                            br.decompose()
-                        cell_dict = dict()
-                        cell_dict["cell"] = str(c)
-                        cell_dict["text"] = ' '.join(c.stripped_strings)
-                        cell_dict["id"] = 'row_{0}_col_{1}'.format(ri, ci)
-                        
-                        avg_cell_len += len(cell_dict["text"])
-                        
-                        newr[ci] = cell_dict
-                        cspan = c.get('colspan')
-                        rspan = c.get('rowspan')
-
-                        if rspan is not None:
-                            # ci = i+shift
-                            row_spans[ci] = int(rspan)-1
-                        if cspan is not None:
-                            shift += int(cspan)-1
-                    for i in range(ci+1, max_cols):
-                        if i in row_spans:
-                            row_spans[i] -= 1
-                    
-                    avg_row_len_dev += TableExtraction.pstdev([len(x["text"]) if x else 0 for x in newr])
-                    row_dict["cells"] = newr
-                    row_dict["text"] = self.row_to_text(newr)
-                    row_dict["html"] = self.row_to_html(newr)
-                    row_dict["id"] = "row_{}".format(ri)
-                    row_list.append(row_dict)
-                    
-                ## replicate merged cells
-                for m in merged_cells:
-                    for ii in range(m[0], m[1]):
-                        for jj in range(m[2], m[3]):
-                            if ii == m[0] and jj == m[2]:
-                                continue
-                            row_list[ii]['cells'][jj] = copy.deepcopy(row_list[m[0]]['cells'][m[2]])
-                            row_list[ii]['cells'][jj]['id'] += '_span_row{}_col{}'.format(ii,jj)
-                
-                # features["merged_cells"] = merged_cells
-                # To avoid division by zero
-                if len_row == 0:
-                    tdcount = 1
-                features["no_of_rows"] = len_row
-                features["no_of_cells"] = tdcount
-                features["max_cols_in_a_row"] = max_tdcount
-                features["ratio_of_img_tags_to_cells"] = img_count*1.0/tdcount
-                features["ratio_of_href_tags_to_cells"] = href_count*1.0/tdcount
-                features["ratio_of_input_tags_to_cells"] = inp_count*1.0/tdcount
-                features["ratio_of_select_tags_to_cells"] = sel_count*1.0/tdcount
-                features["ratio_of_colspan_tags_to_cells"] = colspan_count*1.0/tdcount
-                features["ratio_of_colons_to_cells"] = colon_count*1.0/tdcount
-                features["avg_cell_len"] = avg_cell_len*1.0/tdcount
-                features["avg_row_len"] = TableExtraction.mean(row_len_list)
-                features["avg_row_len_dev"] = avg_row_len_dev*1.0/max(len_row, 1)
-
-                avg_col_len = 0
-                avg_col_len_dev = 0
-                no_of_cols_containing_num = 0
-                no_of_cols_empty = 0
-
-                if colspan_count == 0.0 and \
-                    len_row != 0 and \
-                    (tdcount/(len_row * 1.0)) == max_tdcount:
-                    col_data = dict()
-                    for i in range(max_tdcount):
-                        col_data['c_{0}'.format(i)] = []
-                    soup_col = BeautifulSoup(table_data, 'html.parser')
-                    for row in soup_col.findAll('tr'):
-                        h_index = 0
-                        h_bool = True
-                        for col in row.findAll('th'):
-                            col_content = ' '.join(col.stripped_strings)
-                            h_bool = False
-                            if col_content is None:
-                                continue
-                            else:
-                                col_data['c_{0}'.format(h_index)].append(col_content)
-                            h_index += 1
-                        d_index = 0
-                        if(h_index == 1 and h_bool == False):
-                            d_index = 1
-                        for col in row.findAll('td'):
-                            col_content = ' '.join(col.stripped_strings)
-                            if col_content is None:
-                                d_index += 1
-                                continue
-                            else:
-                                col_data['c_{0}'.format(d_index)].append(col_content)
-                            d_index += 1
-
-                    for key, value in col_data.items():
-                        whole_col = ' '.join(value)
-                        # avg_cell_len += float("%.2f" % mean([len(x) for x in value]))
-                        avg_col_len += sum([len(x) for x in value])
-                        avg_col_len_dev += TableExtraction.pstdev([len(x) for x in value])
-                        no_of_cols_containing_num += 1 if TableExtraction.contains_digits(whole_col) is True else 0
-                        # features["column_" + str(key) + "_is_only_num"] = whole_col.isdigit()
-                        no_of_cols_empty += 1 if (whole_col == '') is True else 0
-                # To avoid division by zero
-                if max_tdcount == 0:
-                    max_tdcount = 1
-                features["avg_col_len"] = avg_col_len*1.0/max_tdcount
-                features["avg_col_len_dev"] = avg_col_len_dev/max_tdcount
-                features["no_of_cols_containing_num"] = no_of_cols_containing_num
-                features["no_of_cols_empty"] = no_of_cols_empty
-                data_table["features"] = features
-                data_table["rows"] = row_list
-                context_before = ' '.join(TableExtraction.gen_context(table.find_all_previous(string=True)))
-                context_after = ' '.join(TableExtraction.gen_context(table.find_all_next(string=True)))
-                table_rep = TableExtraction.gen_html(row_list)
-                fingerprint = TableExtraction.create_fingerprint(table_rep)
-                data_table["context_before"] = context_before
-                data_table["context_after"] = context_after
-                data_table["fingerprint"] = fingerprint
-                data_table['html'] = table_rep
-                data_table['text'] = self.table_to_text(row_list)
-                result_tables.append(data_table)
+                    context_before = ""
+                    context_after = ""
+                result_tables.append(self.create_data_table(features, row_list, context_before, context_after))
                 table.decompose()
         return dict(tables=result_tables, html_text=self.text_from_html(soup))
 
+    def table_rows(self, rows):
+        """
+        The rows of a data table and its features, the engine specific reads of the tree are done by _cells,
+        _stripped_strings, _tag_count, _cell_content and _column_strings
+
+        Args:
+            rows: the data rows of the table
+
+        Returns: the features of the table, and the rows with their cells, merged cells replicated in each
+            row and column they span
+        """
+        tdcount = 0
+        max_tdcount = 0
+        img_count = 0
+        href_count = 0
+        inp_count = 0
+        sel_count = 0
+        colspan_count = 0
+        colon_count = 0
+        len_row = 0
+        features = dict()
+        row_list = list()
+        row_len_list = list()
+        avg_cell_len = 0
+        avg_row_len_dev = 0
+
+        cells = [self._cells(row) for row in rows]
+        max_cols, merged_cells = TableExtraction.find_merged_cells(cells)
+        # read before the cells are modified
+        column_strings = self._column_strings(rows)
+
+        ## create table array
+        row_spans = dict()
+        for ri, row in enumerate(rows):
+            row_data = ' '.join(self._stripped_strings(row))
+            row_data = row_data.replace("\\t", "").replace("\\r", "").replace("\\n", "")
+
+            row_len_list.append(len(row_data))
+            row_tdcount = len(cells[ri])
+            if row_tdcount > max_tdcount:
+                max_tdcount = row_tdcount
+            tdcount += row_tdcount
+            img_count += self._tag_count(row, 'img')
+            href_count += self._tag_count(row, 'a')
+            inp_count += self._tag_count(row, 'input')
+            sel_count += self._tag_count(row, 'select')
+            colspan_count += row_data.count("colspan")
+            colon_count += row_data.count(":")
+            len_row += 1
+
+            row_dict = dict()
+            newr = [None]*max_cols
+            shift = 0
+            rshift = 0
+            ci = 0
+
+            for i, c in enumerate(cells[ri]):
+                ci = i+shift+rshift
+                if ci in row_spans:
+                    if row_spans[ci] <= 0:
+                        del row_spans[ci]
+                    else:
+                        rshift += 1
+                        row_spans[ci] -= 1
+                        ci += 1
+                cell_dict = dict()
+                cell_dict["cell"], cell_dict["text"] = self._cell_content(c)
+                cell_dict["id"] = 'row_{0}_col_{1}'.format(ri, ci)
+
+                avg_cell_len += len(cell_dict["text"])
+
+                newr[ci] = cell_dict
+                cspan = c.get('colspan')
+                rspan = c.get('rowspan')
+
+                if rspan is not None:
+                    # ci = i+shift
+                    row_spans[ci] = int(rspan)-1
+                if cspan is not None:
+                    shift += int(cspan)-1
+            for i in range(ci+1, max_cols):
+                if i in row_spans:
+                    row_spans[i] -= 1
+
+            avg_row_len_dev += TableExtraction.pstdev([len(x["text"]) if x else 0 for x in newr])
+            row_dict["cells"] = newr
+            row_dict["text"] = self.row_to_text(newr)
+            row_dict["html"] = self.row_to_html(newr)
+            row_dict["id"] = "row_{}".format(ri)
+            row_list.append(row_dict)
+
+        ## replicate merged cells
+        for m in merged_cells:
+            for ii in range(m[0], m[1]):
+                for jj in range(m[2], m[3]):
+                    if ii == m[0] and jj == m[2]:
+                        continue
+                    row_list[ii]['cells'][jj] = copy.deepcopy(row_list[m[0]]['cells'][m[2]])
+                    row_list[ii]['cells'][jj]['id'] += '_span_row{}_col{}'.format(ii,jj)
+
+        # features["merged_cells"] = merged_cells
+        # To avoid division by zero
+        if len_row == 0:
+            tdcount = 1
+        features["no_of_rows"] = len_row
+        features["no_of_cells"] = tdcount
+        features["max_cols_in_a_row"] = max_tdcount
+        features["ratio_of_img_tags_to_cells"] = img_count*1.0/tdcount
+        features["ratio_of_href_tags_to_cells"] = href_count*1.0/tdcount
+        features["ratio_of_input_tags_to_cells"] = inp_count*1.0/tdcount
+        features["ratio_of_select_tags_to_cells"] = sel_count*1.0/tdcount
+        features["ratio_of_colspan_tags_to_cells"] = colspan_count*1.0/tdcount
+        features["ratio_of_colons_to_cells"] = colon_count*1.0/tdcount
+        features["avg_cell_len"] = avg_cell_len*1.0/tdcount
+        features["avg_row_len"] = TableExtraction.mean(row_len_list)
+        features["avg_row_len_dev"] = avg_row_len_dev*1.0/max(len_row, 1)
+
+        avg_col_len = 0
+        avg_col_len_dev = 0
+        no_of_cols_containing_num = 0
+        no_of_cols_empty = 0
+
+        if colspan_count == 0.0 and \
+            len_row != 0 and \
+            (tdcount/(len_row * 1.0)) == max_tdcount:
+            col_data = dict()
+            for i in range(max_tdcount):
+                col_data['c_{0}'.format(i)] = []
+            for header_strings, data_strings in column_strings:
+                h_index = 0
+                h_bool = True
+                for col_content in header_strings:
+                    h_bool = False
+                    col_data['c_{0}'.format(h_index)].append(col_content)
+                    h_index += 1
+                d_index = 0
+                if(h_index == 1 and h_bool == False):
+                    d_index = 1
+                for col_content in data_strings:
+                    col_data['c_{0}'.format(d_index)].append(col_content)
+                    d_index += 1
+
+            for key, value in col_data.items():
+                whole_col = ' '.join(value)
+                # avg_cell_len += float("%.2f" % mean([len(x) for x in value]))
+                avg_col_len += sum([len(x) for x in value])
+                avg_col_len_dev += TableExtraction.pstdev([len(x) for x in value])
+                no_of_cols_containing_num += 1 if TableExtraction.contains_digits(whole_col) is True else 0
+                # features["column_" + str(key) + "_is_only_num"] = whole_col.isdigit()
+                no_of_cols_empty += 1 if (whole_col == '') is True else 0
+        # To avoid division by zero
+        if max_tdcount == 0:
+            max_tdcount = 1
+        features["avg_col_len"] = avg_col_len*1.0/max_tdcount
+        features["avg_col_len_dev"] = avg_col_len_dev/max_tdcount
+        features["no_of_cols_containing_num"] = no_of_cols_containing_num
+        features["no_of_cols_empty"] = no_of_cols_empty
+        return features, row_list
+
+    @staticmethod
+    def find_merged_cells(cells):
+        """
+        Detect merged cells and find table demension
+
+        Args:
+            cells: the cells of each row of the table
+
+        Returns: the number of columns of the table, and the (first row, end row, first column, end column) of
+            each merged cell
+        """
+        max_cols = 0
+        merged_cells = []
+        row_spans = dict()
+        for ri, row_cells in enumerate(cells):
+            rshift = 0
+            num_cols = 0
+            col_shift = 0
+            for ci, c in enumerate(row_cells):
+                num_cols += 1
+                cspan = c.get('colspan')
+                rspan = c.get('rowspan')
+                ci += col_shift+rshift
+
+                if ci in row_spans:
+                    if row_spans[ci] <= 0:
+                        del row_spans[ci]
+                    else:
+                        rshift += 1
+                        row_spans[ci] -= 1
+                        ci += 1
+                if cspan is not None and rspan is not None:
+                    cspan = int(cspan)
+                    rspan = int(rspan)
+                    col_shift += cspan-1
+                    row_spans[ci] = rspan-1
+                    merged_cells.append((ri, ri+rspan, ci, ci+cspan))
+                elif cspan is not None:
+                    cspan = int(cspan)
+                    col_shift += cspan-1
+                    merged_cells.append((ri, ri+1, ci, ci+cspan))
+                elif rspan is not None:
+                    rspan = int(rspan)
+                    row_spans[ci] = rspan-1
+                    merged_cells.append((ri, ri+rspan, ci, ci+1))
+            if max_cols < num_cols:
+                max_cols = num_cols
+        if len(merged_cells) > 0:
+            max_cols = max(max_cols, max([x[3] for x in merged_cells]))
+        return max_cols, merged_cells
+
+    def create_data_table(self, features, row_list, context_before, context_after):
+        """The data table of the result of extract"""
+        data_table = dict()
+        table_rep = TableExtraction.gen_html(row_list)
+        data_table["features"] = features
+        data_table["rows"] = row_list
+        data_table["context_before"] = context_before
+        data_table["context_after"] = context_after
+        data_table["fingerprint"] = TableExtraction.create_fingerprint(table_rep)
+        data_table['html'] = table_rep
+        data_table['text'] = self.table_to_text(row_list)
+        return data_table
+
+    @staticmethod
+    def _cells(row):
+        return row.findAll(['td', 'th'])
+
+    @staticmethod
+    def _stripped_strings(element):
+        return element.stripped_strings
+
+    @staticmethod
+    def _tag_count(element, tag):
+        return len(element.findAll(tag))
+
+    @staticmethod
+    def _cell_content(cell):
+        """The html and the text of the cell, after its br are replaced by a space and its scripts removed"""
+        for br in cell.find_all("br"):
+            br.replace_with(" ")
+        for br in cell.find_all("script"):
+            br.decompose()
+        return str(cell), ' '.join(cell.stripped_strings)
+
+    @staticmethod
+    def _column_strings(rows):
+        """The strings of the th and of the td of each row, read from the rows parsed again by html.parser"""
+        table_data = ''.join(str(row) for row in rows)
+
+        def column_strings():
+            soup_col = BeautifulSoup(table_data, 'html.parser')
+            for row in soup_col.findAll('tr'):
+                yield [' '.join(col.stripped_strings) for col in row.findAll('th')], \
+                    [' '.join(col.stripped_strings) for col in row.findAll('td')]
+        return column_strings()
+
     @staticmethod
     def create_fingerprint(table):
         table = str(table)
@@ -499,6 +695,309 @@ class TableExtraction:
         return u" ".join(t.strip() for t in visible_texts if t.strip() != "")
 
 
+# BeautifulSoup's rules to write the html of a tree parsed by html5lib
+_html5lib_builder = HTML5TreeBuilder()
+_VOID_ELEMENTS = frozenset(_html5lib_builder.empty_element_tags)
+_MULTI_VALUED_ATTRIBUTES = _html5lib_builder.cdata_list_attributes
+# the strings of these tags are written without escaping them
+_RAW_TEXT_ELEMENTS = ('script', 'style')
+# html.parser leaves the strings of these tags out of stripped_strings
+_STRING_CONTAINERS = tuple(getattr(HTMLParserTreeBuilder(), 'string_containers', ()))
+# the strings of these tags are not in the text of the page, see TableExtraction.tag_visible
+_INVISIBLE_PARENTS = ('style', 'script', 'head', 'title', 'meta')
+_non_whitespace_re = re.compile(r'\S+')
+# a doctype after comments and an xml declaration, which both parsers make comments
+_doctype_re = re.compile(r'\s*((?:(?:<!--.*?-->|<\?.*?>)\s*)*)<!doctype\s', re.IGNORECASE | re.DOTALL)
+_doctype_bytes_re = re.compile(br'\s*((?:(?:<!--.*?-->|<\?.*?>)\s*)*)<!doctype\s', re.IGNORECASE | re.DOTALL)
+_end_re = re.compile(r'</html\s*>(\s+)$', re.IGNORECASE)
+_end_bytes_re = re.compile(br'</html\s*>(\s+)$', re.IGNORECASE)
+
+
+def _events(root):
+    """('start', element) and ('end', element) for root and its descendants, in document order"""
+    yield 'start', root
+    stack = [(root, iter(root))]
+    while stack:
+        element, children = stack[-1]
+        child = next(children, None)
+        if child is None:
+            stack.pop()
+            yield 'end', element
+        else:
+            yield 'start', child
+            stack.append((child, iter(child)))
+
+
+def _escape(text: str) -> str:
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+class LxmlTableExtraction(TableExtraction):
+    """
+    TableExtraction on the page parsed by lxml, see etk.html_dom. The tables are the ones TableExtraction finds
+    in the page parsed by html5lib: the rows, cells, features, fingerprint and contexts are the same when both
+    parsers build the same tree, which is the case for pages without markup errors in their tables.
+
+    The tree is only read, data tables are not removed from it, so it can be shared with the other HTML extractors.
+    """
+
+    def extract(self, html_doc, min_data_rows = 1, context: bool = True):
+        """
+        Args:
+            html_doc (str): raw html of the page
+            min_data_rows (int): minimum number of data rows of a data table
+            context (bool): if False, context_before and context_after of the tables are empty
+
+        Returns: dict, the data tables and the text of the page without them
+        """
+        try:
+            root = parse_html(html_doc, LXML_HTML).getroottree().getroot()
+        except etree.ParserError:
+            # empty page
+            return dict(tables=list(), html_text="")
+        strings, visible, table_spans = LxmlTableExtraction._index_document(root, html_doc)
+        tables = list(root.iter('table'))
+        result_tables = list()
+        removed_tables = set()
+        removed_spans = list()
+        # index of the last string of a removed table -> index of the string before the table
+        removed = dict()
+        for ti, table in enumerate(tables):
+            if any(t in removed_tables for t in table.iterancestors('table')):
+                # BeautifulSoup decomposes the tables of a removed table
+                continue
+            rows = LxmlTableExtraction._data_rows(table, min_data_rows)
+            if rows is False:
+                continue
+            features, row_list = self.table_rows(rows)
+            start, end = table_spans[ti]
+            if context:
+                modified_cells = set(c for row in rows for c in self._cells(row))
+                context_before = ' '.join(TableExtraction.gen_context(
+                    TableExtraction._strings_before(strings, removed, start)))
+                context_after = ' '.join(TableExtraction.gen_context(
+                    LxmlTableExtraction._lxml_strings_after(table, modified_cells, strings, end)))
+            else:
+                context_before = ""
+                context_after = ""
+            if end > start:
+                removed[end - 1] = min(start - 1, removed.get(end - 1, start - 1))
+            removed_tables.add(table)
+            removed_spans.append((start, end))
+            result_tables.append(self.create_data_table(features, row_list, context_before, context_after))
+
+        for start, end in removed_spans:
+            visible[start:end] = [False] * (end - start)
+        html_text = u" ".join(s.strip() for s, v in zip(strings, visible) if v and s.strip() != "")
+        return dict(tables=result_tables, html_text=html_text)
+
+    @staticmethod
+    def _cells(row):
+        return list(row.iter('td', 'th'))
+
+    @staticmethod
+    def _tag_count(element, tag):
+        return sum(1 for _ in element.iter(tag))
+
+    @staticmethod
+    def _cell_content(cell):
+        """The html and the text the cell has in BeautifulSoup, after TableExtraction replaced its br by a space
+        and removed its scripts"""
+        return LxmlTableExtraction._cell_html(cell), ' '.join(LxmlTableExtraction._stripped_strings(cell, ('script',)))
+
+    @staticmethod
+    def _column_strings(rows):
+        """The strings of the th and of the td of each row, as TableExtraction reads them from the rows parsed
+        again by html.parser"""
+        return (([' '.join(LxmlTableExtraction._stripped_strings(col, _STRING_CONTAINERS)) for col in row.iter('th')],
+                 [' '.join(LxmlTableExtraction._stripped_strings(col, _STRING_CONTAINERS)) for col in row.iter('td')])
+                for row in rows)
+
+    @staticmethod
+    def _data_rows(table, k):
+        """The rows of TableExtraction.is_data_table, in the tree html5lib builds: rows out of a table section
+        are in a tbody"""
+        rows = list()
+        thead = next(table.iter('thead'), None)
+        if thead is not None:
+            rows.extend(child for child in thead if child.tag == 'tr')
+        for element in table.iter('tbody', 'tr'):
+            if element.tag == 'tbody':
+                rows.extend(child for child in element if child.tag == 'tr')
+                break
+            if element.getparent().tag == 'table':
+                for sibling in itertools.chain([element], element.itersiblings()):
+                    if sibling.tag in ('thead', 'tbody', 'tfoot', 'caption', 'colgroup', 'col'):
+                        break
+                    if sibling.tag == 'tr':
+                        rows.append(sibling)
+                break
+        rows = [row for row in rows if next(row.iter('table'), None) is None]
+        if len(rows) > k:
+            return rows
+        return False
+
+    @staticmethod
+    def _stripped_strings(element, exclude=()) -> List[str]:
+        """stripped_strings of BeautifulSoup, leaving out the strings in the tags of exclude"""
+        strings = list()
+        excluded = 0
+        for event, e in _events(element):
+            tag = e.tag
+            if event == 'start':
+                if isinstance(tag, str):
+                    if tag in exclude:
+                        excluded += 1
+                    elif not excluded and e.text:
+                        text = e.text.strip()
+                        if text:
+                            strings.append(text)
+            else:
+                if isinstance(tag, str) and tag in exclude:
+                    excluded -= 1
+                if e is not element and not excluded and e.tail:
+                    text = e.tail.strip()
+                    if text:
+                        strings.append(text)
+        return strings
+
+    @staticmethod
+    def _cell_html(cell) -> str:
+        """str() of the cell in BeautifulSoup, after TableExtraction replaced its br by a space and removed
+        its scripts"""
+        parts = list()
+        for event, element in _events(cell):
+            tag = element.tag
+            if not isinstance(tag, str):
+                if event == 'start' and tag is etree.Comment:
+                    parts.append('<!--' + (element.text or '') + '-->')
+            elif tag == 'br' or tag == 'script':
+                if event == 'start' and tag == 'br':
+                    parts.append(' ')
+            elif event == 'start':
+                parts.append('<' + tag)
+                multi_valued = _MULTI_VALUED_ATTRIBUTES.get(tag, ())
+                for key, value in sorted(element.attrib.items()):
+                    if key in _MULTI_VALUED_ATTRIBUTES['*'] or key in multi_valued:
+                        value = ' '.join(_non_whitespace_re.findall(value))
+                    value = _escape(value)
+                    quote = '"'
+                    if '"' in value:
+                        if "'" in value:
+                            value = value.replace('"', "&quot;")
+                        else:
+                            quote = "'"
+                    parts.append(' ' + key + '=' + quote + value + quote)
+                parts.append('/>' if tag in _VOID_ELEMENTS else '>')
+                if element.text:
+                    parts.append(element.text if tag in _RAW_TEXT_ELEMENTS else _escape(element.text))
+            elif tag not in _VOID_ELEMENTS:
+                parts.append('</' + tag + '>')
+            if event == 'end' and element is not cell and element.tail:
+                parent_tag = element.getparent().tag
+                parts.append(element.tail if parent_tag in _RAW_TEXT_ELEMENTS else _escape(element.tail))
+        return ''.join(parts)
+
+    @staticmethod
+    def _index_document(root, html_doc):
+        """
+        The strings of the page as BeautifulSoup finds them with find_all(string=True)
+
+        Returns: the strings in document order, whether each string is visible text as in
+            TableExtraction.text_from_html, and the span of each table in the strings
+        """
+        strings = list()
+        visible = list()
+        table_spans = list()
+        open_spans = list()
+        doctype = None
+        # lxml adds a doctype to the pages without one
+        match = (_doctype_bytes_re if isinstance(html_doc, bytes) else _doctype_re).match(html_doc)
+        if match:
+            docinfo = root.getroottree().docinfo
+            doctype = (docinfo.root_name or '').lower()
+            if docinfo.public_id:
+                doctype += ' PUBLIC "%s"' % docinfo.public_id
+                if docinfo.system_url:
+                    doctype += ' "%s"' % docinfo.system_url
+            elif docinfo.system_url:
+                doctype += ' SYSTEM "%s"' % docinfo.system_url
+            # number of comments before the doctype
+            before_doctype = match.group(1).count('<!--' if isinstance(html_doc, str) else b'<!--') + \
+                match.group(1).count('<?' if isinstance(html_doc, str) else b'<?')
+        top_nodes = list(reversed(list(root.itersiblings(preceding=True)))) + [root] + list(root.itersiblings())
+        for i, node in enumerate(top_nodes):
+            if doctype is not None and i == before_doctype:
+                strings.append(doctype)
+                visible.append(False)
+            for event, element in _events(node):
+                tag = element.tag
+                if event == 'start':
+                    if tag is etree.Comment:
+                        strings.append(element.text or '')
+                        visible.append(False)
+                    elif isinstance(tag, str):
+                        if tag == 'table':
+                            span = [len(strings), None]
+                            table_spans.append(span)
+                            open_spans.append(span)
+                        if element.text:
+                            strings.append(element.text)
+                            visible.append(tag not in _INVISIBLE_PARENTS)
+                else:
+                    if tag == 'table':
+                        open_spans.pop()[1] = len(strings)
+                    if tag == 'body' and element.getparent() is root:
+                        LxmlTableExtraction._add_body_end(element, html_doc, strings, visible)
+                    elif element is not node and element.tail:
+                        strings.append(element.tail)
+                        visible.append(element.getparent().tag not in _INVISIBLE_PARENTS)
+        return strings, visible, [tuple(span) for span in table_spans]
+
+    @staticmethod
+    def _add_body_end(body, html_doc, strings, visible) -> None:
+        """html5lib adds the text after the body, which lxml keeps in the tail of the body or drops when it is after
+        the html end tag, at the end of the body"""
+        end = (_end_bytes_re if isinstance(html_doc, bytes) else _end_re).search(html_doc)
+        trailing = end.group(1) if end else ''
+        if isinstance(trailing, bytes):
+            trailing = trailing.decode('ascii')
+        text = (body.tail or '') + trailing
+        if not text:
+            return
+        last = body[-1] if len(body) else None
+        if (last is None and body.text) or (last is not None and last.tail):
+            strings[-1] += text
+        else:
+            strings.append(text)
+            visible.append(True)
+
+    @staticmethod
+    def _lxml_strings_after(table, modified_cells, strings, index):
+        """The strings of the table, with the br replaced and the scripts removed in the modified cells,
+        and the strings from strings[index]"""
+        in_cell = 0
+        for event, element in _events(table):
+            tag = element.tag
+            if event == 'start':
+                if tag is etree.Comment:
+                    yield element.text or ''
+                elif isinstance(tag, str):
+                    if element in modified_cells:
+                        in_cell += 1
+                    if in_cell and tag == 'br':
+                        yield ' '
+                    elif element.text and not (in_cell and tag == 'script'):
+                        yield element.text
+            else:
+                if isinstance(tag, str) and element in modified_cells:
+                    in_cell -= 1
+                if element is not table and element.tail:
+                    yield element.tail
+        for i in range(index, len(strings)):
+            yield strings[i]
+
+
 class TableExtractor(Extractor):
     """
     **Description**
@@ -511,33 +1010,44 @@ class TableExtractor(Extractor):
             table_extractor.extract(html=html_str,
                                     return_text=True)
 
+            fast_table_extractor = TableExtractor(engine=TableEngine.LXML)
+
     """
 
     tableExtractorInstance = TableExtraction()
+    lxmlTableExtractorInstance = LxmlTableExtraction()
 
-    def __init__(self) -> None:
+    def __init__(self, engine: TableEngine = TableEngine.HTML5LIB) -> None:
+        """
+        Args:
+            engine (TableEngine): parser and table extraction used, see TableEngine
+        """
         Extractor.__init__(self,
                            input_type=InputType.TEXT,
                            category="content",
                            name="DigTableExtractor")
+        self.engine = engine
+        self._table_extraction = TableExtractor.lxmlTableExtractorInstance if engine == TableEngine.LXML \
+            else TableExtractor.tableExtractorInstance
 
     def _wrap_value_with_context(self, value: dict or str, field_name: str, start: int=0, end: int=0) -> Extraction:
         """Wraps the final result"""
         return Extraction(value, self.name, start_token=start, end_token=end, tag=field_name)
 
-    def extract(self, html: str, return_text: bool=False) -> List[Extraction]:
+    def extract(self, html: str, return_text: bool=False, context: bool=True) -> List[Extraction]:
         """
         Args:
             html (str): raw html of the page
             return_text (bool): if True, return the visible text in the page
                                 removing all the data tables
+            context (bool): if False, the context_before and context_after of the tables are not computed
 
         Returns:
             List[Extraction]: a list of Extractions
 
         """
         results = list()
-        temp_res = TableExtractor.tableExtractorInstance.extract(html)
+        temp_res = self._table_extraction.extract(html, context=context)
         if return_text:
             results.append(self._wrap_value_with_context(temp_res['html_text'], "text_without_tables"))
         results.extend(map(lambda t: self._wrap_value_with_context(t, "tables"), temp_res['tables']))
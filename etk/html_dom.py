@@ -0,0 +1,129 @@
+"""
+Parsed HTML pages shared by the HTML extractors.
+
+Each HTML extractor used to parse the page it is given, and Document.extract parsed it once more to check that it
+is HTML, so running the content and metadata extractors on a page parsed it several times.
+While a Document runs an extractor, parse_html returns the tree already parsed by another extractor for the same
+text and parser. The trees are shared, extractors modifying the tree they work on, e.g. TableExtraction, parse
+their own copy.
+"""
+import re
+from collections import OrderedDict
+from contextlib import contextmanager
+from bs4 import BeautifulSoup
+import lxml.html
+
+_tag_re = re.compile(r'<[a-zA-Z][^<>]*>')
+_tag_bytes_re = re.compile(br'<[a-zA-Z][^<>]*>')
+
+# the parser of lxml.html trees, same as extruct's parse_html
+LXML_HTML = "lxml.html"
+
+
+def looks_like_html(value) -> bool:
+    """
+    Cheap test for HTML, without parsing the page: True if value has at least one tag, as BeautifulSoup(value).find()
+
+    Args:
+        value: str or bytes
+
+    Returns: bool
+    """
+    if isinstance(value, str):
+        return _tag_re.search(value) is not None
+    if isinstance(value, bytes):
+        return _tag_bytes_re.search(value) is not None
+    return False
+
+
+class HTMLDOMCache(object):
+    """
+    Parsed HTML pages keyed by parser and text, shared by all the HTML extractors run on a document
+    """
+
+    def __init__(self, maxsize: int = None) -> None:
+        """
+        Args:
+            maxsize (int): number of parsed pages kept, the least recently used are dropped first,
+                None to keep all of them
+        """
+        self.maxsize = maxsize
+        self._trees = OrderedDict()
+
+    def get(self, html_text, parser: str):
+        """
+        Args:
+            html_text: str or bytes
+            parser (str): see parse_html
+
+        Returns: the cached or parsed tree
+        """
+        key = (parser, html_text)
+        try:
+            tree = self._trees[key]
+            if self.maxsize:
+                self._trees.move_to_end(key)
+            return tree
+        except KeyError:
+            tree = _parse(html_text, parser)
+            self._trees[key] = tree
+            if self.maxsize and len(self._trees) > self.maxsize:
+                self._trees.popitem(last=False)
+            return tree
+
+    def clear(self) -> None:
+        self._trees.clear()
+
+    def __contains__(self, key) -> bool:
+        return key in self._trees
+
+    def __len__(self) -> int:
+        return len(self._trees)
+
+
+def _parse(html_text, parser: str):
+    if parser == LXML_HTML:
+        try:
+            return lxml.html.fromstring(html_text, parser=lxml.html.HTMLParser(encoding="UTF-8"))
+        except ValueError:
+            # lxml does not parse a str with an xml encoding declaration, e.g. an xhtml page
+            return lxml.html.fromstring(html_text.encode("utf-8"), parser=lxml.html.HTMLParser(encoding="UTF-8"))
+    return BeautifulSoup(html_text, parser)
+
+
+_active_cache = None
+
+
+@contextmanager
+def use_html_dom_cache(cache: HTMLDOMCache):
+    """
+    Make parse_html look up and store the parsed pages in cache inside the with block, e.g. while a Document
+    runs an extractor
+
+    Args:
+        cache (HTMLDOMCache):
+    """
+    global _active_cache
+    previous = _active_cache
+    _active_cache = cache
+    try:
+        yield cache
+    finally:
+        _active_cache = previous
+
+
+def parse_html(html_text, parser: str = "html.parser"):
+    """
+    Parse an HTML page, or get the tree another extractor parsed with the same parser. The tree may be shared,
+    it must not be modified.
+
+    Args:
+        html_text: str or bytes
+        parser (str): a BeautifulSoup parser, e.g. 'html.parser' or 'html5lib', or LXML_HTML for the lxml.html
+            tree extruct extracts from
+
+    Returns: BeautifulSoup, or lxml.html.HtmlElement for LXML_HTML
+    """
+    if _active_cache is not None:
+        return _active_cache.get(html_text, parser)
+    return _parse(html_text, parser)
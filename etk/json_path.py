@@ -0,0 +1,126 @@
+from typing import List, Any
+from jsonpath_ng import jsonpath
+from jsonpath_ng.jsonpath import Child, Root, Fields, Slice
+
+
+class JsonPathMatch(object):
+    """
+    A value selected by a json path and the path to it, the path string is only built when full_path is used
+    """
+
+    __slots__ = ("value", "_path")
+
+    def __init__(self, value: Any, path: tuple) -> None:
+        self.value = value
+        self._path = path
+
+    @property
+    def full_path(self) -> str:
+        """
+        Returns: the full path of the value, same as str(full_path) of the jsonpath_ng match
+        """
+        if not self._path:
+            return "$"
+        return ".".join(step if isinstance(step, str) else "[%d]" % step for step in self._path)
+
+
+class _JsonPathNgMatch(object):
+    """
+    A jsonpath_ng match with full_path as a str
+    """
+
+    __slots__ = ("value", "_match")
+
+    def __init__(self, match) -> None:
+        self.value = match.value
+        self._match = match
+
+    @property
+    def full_path(self) -> str:
+        return str(self._match.full_path)
+
+
+class CompiledJsonPath(object):
+    """
+    A parsed json path with a find method evaluating the simple paths, made only of fields and [*],
+    e.g. '$.a.b' or '$.a[*].b', by walking the json directly, and any other path with jsonpath_ng
+    """
+
+    def __init__(self, parsed) -> None:
+        """
+        Args:
+            parsed: the json path parsed by jsonpath_ng
+        """
+        self.parsed = parsed
+        self._steps = self._simple_steps(parsed)
+
+    @property
+    def is_simple(self) -> bool:
+        return self._steps is not None
+
+    def find(self, value: Any) -> List:
+        """
+        Args:
+            value: the json to select from
+
+        Returns: the list of matches, each with a value and a full_path str
+        """
+        if self._steps is None:
+            return [_JsonPathNgMatch(match) for match in self.parsed.find(value)]
+
+        current = [(value, ())]
+        for step in self._steps:
+            selected = list()
+            if step is None:
+                # [*], same as jsonpath_ng: None selects nothing, a dict or a single value is a list of one element
+                for v, path in current:
+                    if v is None:
+                        continue
+                    if isinstance(v, (dict, int, float, str, bool)):
+                        selected.append((v, path + (0,)))
+                    else:
+                        selected.extend((v[i], path + (i,)) for i in range(len(v)))
+            else:
+                field, rendered = step
+                for v, path in current:
+                    if isinstance(v, dict) and field in v:
+                        selected.append((v[field], path + (rendered,)))
+            current = selected
+            if not current:
+                break
+        return [JsonPathMatch(v, path) for v, path in current]
+
+    @staticmethod
+    def _simple_steps(parsed) -> List or None:
+        """
+        Returns: the steps of a simple path, (field name, field as rendered by jsonpath_ng) or None for [*],
+            None if the path is not simple
+        """
+        steps = list()
+        node = parsed
+        while True:
+            if type(node) is Child:
+                right = node.right
+                node = node.left
+            else:
+                right = node
+                node = None
+
+            if type(right) is Root:
+                if node is not None:
+                    return None
+            elif type(right) is Fields:
+                if len(right.fields) != 1 or right.fields[0] in ("*", jsonpath.auto_id_field):
+                    return None
+                steps.append((right.fields[0], str(right)))
+            elif type(right) is Slice:
+                if right.start is not None or right.end is not None or right.step is not None:
+                    return None
+                steps.append(None)
+            else:
+                return None
+
+            if node is None:
+                break
+        steps.reverse()
+        return steps
@@ -4,9 +4,11 @@ from etk.knowledge_graph_schema import KGSchema
 from etk.field_types import FieldType
 from etk.etk_exceptions import KgValueError, UndefinedFieldError
 from etk.knowledge_graph_provenance_record import KnowledgeGraphProvenanceRecord
+from etk.provenance_store import ProvenanceLevel
 from etk.extraction import Extraction
 from etk.segment import Segment
 from etk.ontology_api import Ontology
+from etk.utilities import UniqueValues, TrackedList
 import json
 
 
@@ -18,6 +20,10 @@ class KnowledgeGraph(object):
 
     def __init__(self, schema: KGSchema, ontology: Ontology, doc) -> None:
         self._kg = {}
+        # index of the values of each field of _kg, to add a value only once
+        self._unique_values = UniqueValues()
+        # the @type of the nodes of _kg for Ontology.is_valid, (type, @context of the node or None) -> None
+        self._types = dict()
         self.origin_doc = doc
         self.schema = schema
         self.ontology = ontology
@@ -60,9 +66,9 @@ class KnowledgeGraph(object):
             self._kg["@id"] = value
             return True
         if field_name == "@type" and self.origin_doc.etk.generate_json_ld:
-            self._kg["@type"] = self._kg.get("@type", list())
-            if value not in self._kg["@type"]:
-                self._kg["@type"].append(value)
+            self._kg["@type"] = self._kg.get("@type", TrackedList())
+            self._unique_values.append("@type", self._kg["@type"], value)
+            self._types[(value, None)] = None
             return True
 
         if not need_to_parse(value):
@@ -74,19 +80,46 @@ class KnowledgeGraph(object):
         if self.ontology and self.origin_doc.etk.generate_json_ld:
             # Check and generate the valid value again from 'value'. this_value contains serialized results
             # and since we need toc heck the datatype again, we shouldnt use that.
-            valid_value = valid and self.ontology.is_valid(field_name, value, self._kg)
+            valid_value = valid and self.ontology.is_valid(field_name, value, self._kg, self._types)
             this_value = valid_value
+            if valid_value:
+                self._add_types(valid_value)
         else:
             valid_value = valid and {'value': this_value, 'key': self.create_key_from_value(this_value, field_name)}
         if valid_value:
-            if valid_value not in self._kg[field_name]:
-                self._kg[field_name].append(valid_value)
+            self._unique_values.append(field_name, self._kg[field_name], valid_value)
             self.create_kg_provenance(reference_type, str(this_value), provenance_path) \
                 if provenance_path else self.create_kg_provenance(reference_type, str(this_value))
             return True
         else:
             return False
 
+    def _add_types(self, value, context: tuple = None) -> None:
+        """
+        Track the @type of the nodes in a value added to the knowledge graph, so Ontology.is_valid does not parse
+        the whole knowledge graph to find them
+
+        Args:
+            value: the value added
+            context: items of the @context of the nodes containing the value
+        """
+        if isinstance(value, list):
+            for x in value:
+                self._add_types(x, context)
+        elif isinstance(value, dict):
+            if isinstance(value.get("@context"), dict):
+                try:
+                    context = tuple(dict(context or (), **value["@context"]).items())
+                    hash(context)
+                except TypeError:
+                    context = tuple((k, str(v)) for k, v in dict(context or (), **value["@context"]).items())
+            types = value.get("@type", [])
+            for type_ in types if isinstance(types, list) else [types]:
+                self._types[(type_, context)] = None
+            for k, v in value.items():
+                if k not in ("@type", "@context"):
+                    self._add_types(v, context)
+
     def _add_value(self, field_name: str, value, provenance_path=None) -> bool:
         """
         Helper function to add values to a knowledge graph
@@ -116,14 +149,14 @@ class KnowledgeGraph(object):
 
         Returns:
         """
-        path = self.origin_doc.etk.parse_json_path(jsonpath)
+        path = self.origin_doc.etk.compile_json_path(jsonpath)
         matches = path.find(self.origin_doc.value)
         all_valid = True
         invalid = []
         for a_match in matches:
             # If the value is the empty string, we treat is a None.
             if a_match.value:
-                valid = self._add_value(field_name, a_match.value, provenance_path=str(a_match.full_path))
+                valid = self._add_value(field_name, a_match.value, provenance_path=a_match.full_path)
                 if not valid:
                     invalid.append(field_name + ":" + str(a_match.value))
                 all_valid = all_valid and valid
@@ -161,7 +194,7 @@ class KnowledgeGraph(object):
 
         self.validate_field(field_name)
         if field_name not in self._kg:
-            self._kg[field_name] = []
+            self._kg[field_name] = TrackedList()
 
         if json_path:
             self._add_doc_value(field_name, json_path)
@@ -243,6 +276,15 @@ class KnowledgeGraph(object):
         return key
 
     def create_kg_provenance(self, reference_type, value, json_path: str = None) -> None:
+        provenance_level = self.origin_doc.provenance_level
+        if provenance_level == ProvenanceLevel.OFF:
+            return
+        if provenance_level == ProvenanceLevel.COMPACT:
+            new_id = self.origin_doc.provenances.add_kg(reference_type, value, json_path)
+            self.origin_doc.provenance_id_index_incrementer()
+            self.origin_doc.kg_provenances.setdefault(value, []).append(new_id)
+            return
+
         new_id = self.origin_doc.provenance_id_index
         kg_provenance_record: KnowledgeGraphProvenanceRecord = KnowledgeGraphProvenanceRecord(new_id,
                                                                                               "kg_provenance_record",
@@ -4,6 +4,10 @@ from datetime import date, datetime
 from etk.field_types import FieldType
 from etk.etk_exceptions import ISODateError
 
+# the dates accepted by KGSchema.is_date: year, month, day, hour, minute and second, each optional after the year
+_date_re = re.compile(r'^([0-9]{4})(?:-(0[1-9]|1[0-2])(?:-(0[1-9]|[1-2][0-9]|3[0-1])(?:T'
+                      r'([0-5][0-9])(?::([0-5][0-9])(?::([0-5][0-9]))?)?)?)?)?$')
+
 
 class KGSchema(object):
     """
@@ -131,41 +135,61 @@ class KGSchema(object):
 
         Returns: bool, value, where the value may have been coerced to the required type.
         """
-
-        if self.has_field(field_name):
-            if self.fields_dict[field_name] == FieldType.KG_ID:
-                return True, value
-
-            if self.fields_dict[field_name] == FieldType.NUMBER:
-                if isinstance(value, numbers.Number):
-                    return True, value
-                else:
-                    converted_number = self.parse_number(value)
-                    return (False, value) if not converted_number else (True, value)
-            if self.fields_dict[field_name] == FieldType.STRING:
-                if isinstance(value, str):
-                    return True, value.strip()
-                else:
-                    return True, str(value).strip()
-
-            if self.fields_dict[field_name] == FieldType.DATE:
-                valid, d = self.is_date(value)
-                if valid:
-                    return True, d.isoformat()
-                else:
-                    return False, value
-
-            if self.fields_dict[field_name] == FieldType.LOCATION:
-                valid, l = self.is_location(value)
-                if valid:
-                    return True, l
-                else:
-                    return False, value
-        else:
+        field_type = self.fields_dict.get(field_name)
+        if field_type is None:
             print('{} not found in KG Schema'.format(field_name))
             return False, value
             # Amandeep: returning False instead of printing a message
             # print(field_name + " field not defined")
+        return _validators[field_type](value)
+
+    def validate_many(self, field_name, values: List) -> List:
+        """
+        Same as is_valid for each value, the validator of the field is only looked up once
+
+        Args:
+            field_name: str
+            values: List
+
+        Returns: List of (bool, value), where the value may have been coerced to the required type.
+        """
+        field_type = self.fields_dict.get(field_name)
+        if field_type is None:
+            print('{} not found in KG Schema'.format(field_name))
+            return [(False, value) for value in values]
+        validator = _validators[field_type]
+        return [validator(value) for value in values]
+
+    @staticmethod
+    def _valid_kg_id(value) -> (bool, object):
+        return True, value
+
+    @staticmethod
+    def _valid_number(value) -> (bool, object):
+        if isinstance(value, numbers.Number):
+            return True, value
+        converted_number = KGSchema.parse_number(value)
+        return (False, value) if not converted_number else (True, value)
+
+    @staticmethod
+    def _valid_string(value) -> (bool, object):
+        if isinstance(value, str):
+            return True, value.strip()
+        return True, str(value).strip()
+
+    @staticmethod
+    def _valid_date(value) -> (bool, object):
+        valid, d = KGSchema.is_date(value)
+        if valid:
+            return True, d.isoformat()
+        return False, value
+
+    @staticmethod
+    def _valid_location(value) -> (bool, object):
+        valid, l = KGSchema.is_location(value)
+        if valid:
+            return True, l
+        return False, value
 
     @staticmethod
     def is_date(v) -> (bool, date):
@@ -179,18 +203,17 @@ class KGSchema(object):
         """
         if isinstance(v, date):
             return True, v
-        try:
-            reg = r'^([0-9]{4})(?:-(0[1-9]|1[0-2])(?:-(0[1-9]|[1-2][0-9]|3[0-1])(?:T' \
-                  r'([0-5][0-9])(?::([0-5][0-9])(?::([0-5][0-9]))?)?)?)?)?$'
-            match = re.match(reg, v)
-            if match:
-                groups = match.groups()
-                patterns = ['%Y', '%m', '%d', '%H', '%M', '%S']
-                d = datetime.strptime('-'.join([x for x in groups if x]),
-                                      '-'.join([patterns[i] for i in range(len(patterns)) if groups[i]]))
+        if not isinstance(v, str):
+            return False, v
+        match = _date_re.match(v)
+        if match:
+            year, month, day, hour, minute, second = match.groups()
+            try:
+                d = datetime(int(year), int(month or 1), int(day or 1), int(hour or 0), int(minute or 0),
+                             int(second or 0))
                 return True, d
-        except:
-            pass
+            except ValueError:
+                pass
         return False, v
 
     @staticmethod
@@ -225,3 +248,13 @@ class KGSchema(object):
             if latitude > 180:
                 return False, v
         return True, v
+
+
+# validator of each type of field, see KGSchema.is_valid
+_validators = {
+    FieldType.KG_ID: KGSchema._valid_kg_id,
+    FieldType.NUMBER: KGSchema._valid_number,
+    FieldType.STRING: KGSchema._valid_string,
+    FieldType.DATE: KGSchema._valid_date,
+    FieldType.LOCATION: KGSchema._valid_location
+}
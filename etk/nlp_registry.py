@@ -0,0 +1,85 @@
+"""
+Shared spaCy pipelines.
+
+Loading or deep copying a spaCy model for every ETK and extractor keeps one full copy of the model per object.
+The pipelines acquired here are shared by everyone asking for the same one, and dropped when the last user
+releases it. Objects holding their own state, e.g. Matchers, are still created by each extractor, which must not
+add lexeme flags or other state to the shared vocab.
+"""
+import copy
+import threading
+import spacy
+from etk.tokenizer import Tokenizer
+
+_lock = threading.Lock()
+# key -> [shared object, reference count, objects it depends on, kept alive while it is shared]
+_shared = dict()
+# id(shared object) -> key
+_keys = dict()
+
+
+def _acquire(key, create, depends_on=None):
+    with _lock:
+        entry = _shared.get(key)
+        if entry is None:
+            entry = [create(), 0, depends_on]
+            _shared[key] = entry
+            _keys[id(entry[0])] = key
+        entry[1] += 1
+        return entry[0]
+
+
+def load_model(name: str):
+    """
+    Load a spaCy model once, e.g. 'en_core_web_sm'
+
+    Args:
+        name (str): name or path of the spaCy model
+
+    Returns: the shared spaCy Language, call release() with it when it is not needed anymore
+    """
+    return _acquire(("model", name), lambda: spacy.load(name))
+
+
+def get_tokenizer(nlp) -> Tokenizer:
+    """
+    The etk Tokenizer of a spaCy pipeline. It uses a shallow copy of nlp, sharing its vocab and pipes,
+    with the etk custom tokenizer, so nlp itself keeps its own tokenizer and nothing is deep copied.
+
+    Args:
+        nlp: spaCy Language
+
+    Returns: the shared Tokenizer, call release() with it when it is not needed anymore
+    """
+    return _acquire(("tokenizer", id(nlp)), lambda: Tokenizer(copy.copy(nlp)), depends_on=nlp)
+
+
+def release(shared) -> None:
+    """
+    Release a pipeline returned by load_model() or get_tokenizer(), it is dropped by the registry when it is not
+    used anymore
+
+    Args:
+        shared: the object returned by load_model() or get_tokenizer()
+    """
+    with _lock:
+        key = _keys.get(id(shared))
+        if key is None:
+            return
+        entry = _shared[key]
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del _shared[key]
+            del _keys[id(shared)]
+
+
+def reference_count(shared) -> int:
+    """
+    Args:
+        shared: the object returned by load_model() or get_tokenizer()
+
+    Returns: number of users of the shared pipeline, 0 if it is not in the registry
+    """
+    with _lock:
+        key = _keys.get(id(shared))
+        return _shared[key][1] if key is not None else 0
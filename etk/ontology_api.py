@@ -1,10 +1,11 @@
 import logging
-from typing import Set, Union, Optional
+from typing import Set, Union, Optional, Iterable
 from functools import reduce
 from datetime import datetime, time, date
 from rdflib import Graph, URIRef, BNode
 from rdflib.namespace import RDF, RDFS, OWL, SKOS, XSD
-from etk.ontology_namespacemanager import OntologyNamespaceManager, SCHEMA
+from etk.ontology_namespacemanager import OntologyNamespaceManager, SCHEMA, WrongFormatURIException, \
+    PrefixNotFoundException
 from itertools import chain
 
 
@@ -89,6 +90,8 @@ class OntologyClass(OntologyEntity):
     def __init__(self, uri):
         super().__init__(uri)
         self._super_classes = set()
+        # frozen by Ontology once the hierarchy is built
+        self._super_classes_closure = None
 
     def super_classes(self) -> Set['OntologyClass']:
         """
@@ -105,9 +108,11 @@ class OntologyClass(OntologyEntity):
         Returns: the transitive closure of the super_classes function
 
         """
+        if self._super_classes_closure is not None:
+            return self._super_classes_closure
         if not self._super_classes:
             return set()
-        return self._super_classes | reduce(set.union, [x.super_classes_closure() for x in self._super_classes])
+        return self._super_classes | reduce(set.union, [set(x.super_classes_closure()) for x in self._super_classes])
 
 
 class OntologyProperty(OntologyEntity):
@@ -116,6 +121,10 @@ class OntologyProperty(OntologyEntity):
         self.domains = set()
         self.ranges = set()
         self._super_properties = set()
+        # frozen by Ontology once the hierarchy is built, the legal subjects and objects are True if anything is legal
+        self._super_properties_closure = None
+        self._legal_subjects = None
+        self._legal_objects = None
 
     def super_properties(self) -> Set['OntologyProperty']:
         """
@@ -132,9 +141,11 @@ class OntologyProperty(OntologyEntity):
         Returns:  the transitive closure of the super_properties function
 
         """
+        if self._super_properties_closure is not None:
+            return self._super_properties_closure
         if not self._super_properties:
             return set()
-        return self._super_properties | reduce(set.union, [x.super_properties_closure()
+        return self._super_properties | reduce(set.union, [set(x.super_properties_closure())
                                                            for x in self._super_properties])
 
     def included_domains(self) -> Set[OntologyClass]:
@@ -179,9 +190,25 @@ class OntologyProperty(OntologyEntity):
         Returns:
 
         """
+        if self._legal_subjects is not None:
+            return bool(c) and (self._legal_subjects is True or c in self._legal_subjects)
         domains = self.included_domains()
         return c and (not domains or c in domains or c.super_classes_closure() & domains)
 
+    def legal_subjects(self) -> Optional[frozenset]:
+        """
+        Returns: the classes that are legal subjects, the domains and all their sub classes, True if any class is
+            legal, None before the Ontology is built
+        """
+        return self._legal_subjects
+
+    def legal_objects(self) -> Optional[frozenset]:
+        """
+        Returns: the classes, or data types, that are legal objects, True if any is legal, None before the Ontology
+            is built
+        """
+        return self._legal_objects
+
     def is_legal_object(self, object) -> bool:
         raise NotImplementedError('Subclass should implement this.')
 
@@ -208,6 +235,8 @@ class OntologyObjectProperty(OntologyProperty):
         Returns:
 
         """
+        if self._legal_objects is not None:
+            return self._legal_objects is True or c in self._legal_objects
         ranges = self.included_ranges()
         return not ranges or c in ranges or c.super_classes_closure() & ranges
 
@@ -250,6 +279,8 @@ class OntologyDatatypeProperty(OntologyProperty):
 
         """
         data_type = str(data_type)
+        if self._legal_objects is not None:
+            return self._legal_objects is True or data_type in self._legal_objects
         ranges = self.included_ranges()
         return not ranges or data_type in ranges or self.super_properties() and \
                any(x.is_legal_object(data_type) for x in self.super_properties())
@@ -294,6 +325,8 @@ class Ontology(object):
         self.data_properties = set()
         self.log_stream = io.StringIO()
         self.expanded_jsonld = expanded_jsonld
+        # (property uri, class uri) -> is the class a legal subject of the property, see is_valid
+        self._legal_subjects = dict()
 
         logging.getLogger().addHandler(logging.StreamHandler(self.log_stream))
         if not quiet:
@@ -391,6 +424,8 @@ class Ontology(object):
             for comment in self.g.objects(uri, RDFS.comment):
                 entity._comment.add(comment.toPython())
 
+        self.__init_indexes()
+
         # After all hierarchies are built, perform the last validation
         # Validation 1: Inherited domain & range consistency
         if validation:
@@ -400,6 +435,72 @@ class Ontology(object):
             for p in self.data_properties:
                 self.__validation_property_domain(p)
 
+    def __init_indexes(self):
+        """
+        Freeze the closures of the class and property hierarchies, and the legal subjects and objects of each property,
+        so the validation does not walk the hierarchies again
+        """
+        def closure(entity, parents, closures):
+            if entity not in closures:
+                result = set()
+                for parent in parents(entity):
+                    result.add(parent)
+                    result |= closure(parent, parents, closures)
+                closures[entity] = frozenset(result)
+            return closures[entity]
+
+        class_closures = dict()
+        sub_classes = dict()
+        for class_ in self.classes:
+            for super_class in closure(class_, OntologyClass.super_classes, class_closures):
+                sub_classes.setdefault(super_class, set()).add(class_)
+        for class_, super_classes in class_closures.items():
+            class_._super_classes_closure = super_classes
+
+        def with_sub_classes(classes):
+            result = set(classes)
+            for class_ in classes:
+                result |= sub_classes.get(class_, set())
+            return frozenset(result)
+
+        property_closures = dict()
+        properties = self.all_properties()
+        for property_ in properties:
+            closure(property_, lambda x: x.super_properties() if isinstance(x, OntologyProperty) else (),
+                    property_closures)
+        for property_, super_properties in property_closures.items():
+            if isinstance(property_, OntologyProperty):
+                property_._super_properties_closure = super_properties
+
+        def legal_data_types(property_, legal):
+            # same as OntologyDatatypeProperty.is_legal_object, a range of the property or of a super property
+            if property_ not in legal:
+                ranges = property_.included_ranges()
+                if not ranges:
+                    legal[property_] = True
+                else:
+                    result = set(ranges)
+                    for super_property in property_.super_properties():
+                        if not isinstance(super_property, OntologyDatatypeProperty):
+                            continue
+                        super_legal = legal_data_types(super_property, legal)
+                        if super_legal is True:
+                            result = True
+                            break
+                        result |= super_legal
+                    legal[property_] = result if result is True else frozenset(result)
+            return legal[property_]
+
+        data_types = dict()
+        for property_ in properties:
+            domains = property_.included_domains()
+            property_._legal_subjects = with_sub_classes(domains) if domains else True
+            if isinstance(property_, OntologyDatatypeProperty):
+                property_._legal_objects = legal_data_types(property_, data_types)
+            elif isinstance(property_, OntologyObjectProperty):
+                ranges = property_.included_ranges()
+                property_._legal_objects = with_sub_classes(ranges) if ranges else True
+
     def __read_owl_union_of(self, class_):
         for head in self.g.objects(class_, OWL.unionOf):
             # data range union
@@ -715,7 +816,7 @@ class Ontology(object):
         XSD.NOTATION: 'string'
     }
 
-    def is_valid(self, field_name: str, value, kg: dict) -> Optional[dict]:
+    def is_valid(self, field_name: str, value, kg: dict, types: Iterable = None) -> Optional[dict]:
         """
         Check if this value is valid for the given name property according to input knowledge graph and ontology.
         If is valid, then return a dict with key @id or @value for ObjectProperty or DatatypeProperty.
@@ -724,6 +825,8 @@ class Ontology(object):
         :param field_name: name of the property, if prefix is omitted, then use default namespace
         :param value: the value that try to add
         :param kg: the knowledge graph that perform adding action
+        :param types: the @type of the nodes in kg, pairs (type, items of the @context of the node or None for the
+            @context of kg) as tracked by KnowledgeGraph, if None the types are found by parsing kg
         :return: None if the value isn't valid for the property, otherwise return {key: value}, key is @id for
             ObjectProperty and @value for DatatypeProperty.
         """
@@ -733,7 +836,7 @@ class Ontology(object):
         if not isinstance(property_, OntologyProperty):
             logging.warning("Property is not OntologyProperty, ignoring it:  %s", uri)
             return None
-        if not self.__is_valid_domain(property_, kg):
+        if not self.__is_valid_domain(property_, kg, types):
             logging.warning("Property does not have valid domain, ignoring it:  %s", uri)
             return None
         # check if is valid range
@@ -796,18 +899,40 @@ class Ontology(object):
                 return [x.toPython() for x in type_infer[class_]]
         return None
 
-    def __is_valid_domain(self, property_, kg):
+    def __is_valid_domain(self, property_, kg, types=None):
         import json
         # extract id a.k.a uri from kg
         empty_kg = True
-        kg_ = Graph().parse(data=json.dumps(kg), format='json-ld')
-        for type_ in kg_.objects(None, RDF.type):
+        if types is None:
+            kg_ = Graph().parse(data=json.dumps(kg), format='json-ld')
+            type_uris = kg_.objects(None, RDF.type)
+        else:
+            context = kg.get("@context")
+            type_uris = (self.__resolve_type(type_, dict(chain((context or {}).items(), node_context))
+                                             if node_context else context)
+                         for type_, node_context in types)
+        for type_ in type_uris:
             empty_kg = False
-            entity = self.get_entity(type_)
-            if entity and property_.is_legal_subject(entity):
+            if self.__is_legal_subject(property_, type_):
                 return True
         return empty_kg
 
+    def __resolve_type(self, type_, context: Optional[dict]) -> str:
+        try:
+            return self.__is_valid_uri_resolve(str(type_), context)
+        except (WrongFormatURIException, PrefixNotFoundException):
+            # not a class of the ontology, as when json-ld can not expand it
+            return str(type_)
+
+    def __is_legal_subject(self, property_, type_) -> bool:
+        key = (property_.uri(), str(type_))
+        legal = self._legal_subjects.get(key)
+        if legal is None:
+            entity = self.get_entity(type_)
+            legal = bool(entity and property_.is_legal_subject(entity))
+            self._legal_subjects[key] = legal
+        return legal
+
     def __is_valid_uri_resolve(self, field_name: str, context: Optional[dict]) -> URIRef:
         uri = OntologyNamespaceManager.check_uriref(field_name)
         if not uri and context:
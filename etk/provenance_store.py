@@ -0,0 +1,144 @@
+from collections.abc import Mapping
+from enum import Enum
+from typing import Dict, List
+from etk.extraction_provenance_record import ExtractionProvenanceRecord
+from etk.storage_provenance_record import StorageProvenanceRecord
+from etk.knowledge_graph_provenance_record import KnowledgeGraphProvenanceRecord
+
+
+class ProvenanceLevel(Enum):
+    """
+    OFF: no provenance is recorded
+    COMPACT: provenances are kept in a ProvenanceStore and added to the CDR document when it is serialized
+    FULL: a provenance record object and its dict are created by each extraction, store and kg value
+    """
+    OFF = "off"
+    COMPACT = "compact"
+    FULL = "full"
+
+
+_EXTRACTION = 0
+_STORAGE = 1
+_KG = 2
+
+
+class ProvenanceStore(Mapping):
+    """
+    The provenances of a document in COMPACT level, one column per attribute and the provenance id as the row.
+    Reading it as a Mapping, provenance id -> provenance record, builds the record on demand, so
+    ProvenanceAPI.get_origins works the same as with the records of the FULL level.
+
+    Columns by type of provenance:
+        extraction: path = origin json path, name = method, value = None, parent = parent provenance id
+        storage: path = json path of the segment, name = attribute, value = None,
+            parent = {extracted value: extraction provenance id}
+        kg: path = json path, name = reference type, value = kg value, parent = None
+    """
+
+    __slots__ = ("_document", "_types", "_paths", "_names", "_values", "_start_chars", "_end_chars",
+                 "_confidences", "_parents", "_serialized")
+
+    def __init__(self, document) -> None:
+        self._document = document
+        self._types = list()
+        self._paths = list()
+        self._names = list()
+        self._values = list()
+        self._start_chars = list()
+        self._end_chars = list()
+        self._confidences = list()
+        self._parents = list()
+        # number of provenances already added to the CDR document
+        self._serialized = 0
+
+    def _add(self, type_: int, path, name, value, start_char, end_char, confidence, parent) -> int:
+        self._types.append(type_)
+        self._paths.append(path)
+        self._names.append(name)
+        self._values.append(value)
+        self._start_chars.append(start_char)
+        self._end_chars.append(end_char)
+        self._confidences.append(confidence)
+        self._parents.append(parent)
+        return len(self._types) - 1
+
+    def add_extraction(self, json_path: str, method: str, start_char, end_char, confidence,
+                       parent_extraction_provenance: int = None) -> int:
+        """
+        Returns: the provenance id
+        """
+        return self._add(_EXTRACTION, json_path, method, None, start_char, end_char, confidence,
+                         parent_extraction_provenance)
+
+    def add_storage(self, json_path: str, attribute: str, extraction_provenances: Dict) -> int:
+        """
+        Returns: the provenance id
+        """
+        return self._add(_STORAGE, json_path, attribute, None, None, None, None, extraction_provenances)
+
+    def add_kg(self, reference_type: str, value: str, json_path: str = None) -> int:
+        """
+        Returns: the provenance id
+        """
+        return self._add(_KG, json_path, reference_type, value, None, None, None, None)
+
+    def __getitem__(self, prov_id: int):
+        if not isinstance(prov_id, int) or not 0 <= prov_id < len(self._types):
+            raise KeyError(prov_id)
+        type_ = self._types[prov_id]
+        if type_ == _EXTRACTION:
+            return ExtractionProvenanceRecord(prov_id, self._paths[prov_id], self._names[prov_id],
+                                              self._start_chars[prov_id], self._end_chars[prov_id],
+                                              self._confidences[prov_id], self._document, self._parents[prov_id])
+        if type_ == _STORAGE:
+            return StorageProvenanceRecord(prov_id, self._paths[prov_id], self._names[prov_id],
+                                           self._parents[prov_id], self._document)
+        return KnowledgeGraphProvenanceRecord(prov_id, "kg_provenance_record", self._names[prov_id],
+                                              self._values[prov_id], self._paths[prov_id], self._document)
+
+    def __iter__(self):
+        return iter(range(len(self._types)))
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+    def serialize(self) -> List[Dict]:
+        """
+        The provenances added since the last call, as the dicts the FULL level adds to the CDR document
+
+        Returns: List[Dict]
+        """
+        results = list()
+        # storage provenances only list their parents in the first provenance of a destination
+        destinations = set()
+        for prov_id in range(len(self._types)):
+            type_ = self._types[prov_id]
+            if type_ == _STORAGE:
+                destination = self._paths[prov_id] + '.' + self._names[prov_id]
+                first = destination not in destinations
+                destinations.add(destination)
+                if prov_id < self._serialized:
+                    continue
+                prov_dict = {"@id": prov_id, "@type": "storage_provenance_record", "doc_id": None, "field": None,
+                             "destination": destination}
+                if first:
+                    prov_dict["parent_provenances"] = self._parents[prov_id]
+            elif prov_id < self._serialized:
+                continue
+            elif type_ == _EXTRACTION:
+                prov_dict = {"@id": prov_id, "@type": "extraction_provenance_record",
+                             "method": self._names[prov_id], "confidence": self._confidences[prov_id]}
+                if self._paths[prov_id] is not None:
+                    prov_dict["origin_record"] = {"path": self._paths[prov_id],
+                                                  "start_char": self._start_chars[prov_id],
+                                                  "end_char": self._end_chars[prov_id]}
+                if self._parents[prov_id] is not None:
+                    prov_dict["parent_provenance_id"] = self._parents[prov_id]
+            else:
+                prov_dict = {"@id": prov_id, "@type": "kg_provenance_record",
+                             "reference_type": self._names[prov_id], "value": self._values[prov_id]}
+                if self._paths[prov_id] is not None:
+                    prov_dict["json_path"] = self._paths[prov_id]
+            results.append(prov_dict)
+        self._serialized = len(self._types)
+        return results
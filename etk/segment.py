@@ -2,6 +2,8 @@ from etk.extraction import Extractable, Extraction
 from typing import List, Dict
 from etk.etk_exceptions import StoreExtractionError
 from etk.storage_provenance_record import StorageProvenanceRecord
+from etk.provenance_store import ProvenanceLevel
+from etk.utilities import UniqueValues, TrackedList
 from numbers import Number
 
 
@@ -15,11 +17,24 @@ class Segment(Extractable):
 
     def __init__(self, json_path: str, _value: Dict, _document) -> None:
         Extractable.__init__(self)
-        self.json_path = json_path
+        # the json path str, or the json path match of the segment, whose full_path is only built when needed
+        self._json_path = json_path
         self._value = _value
         self._extractions = dict()
+        # index of the values stored in each attribute, and each tag of an attribute, to store a value only once
+        self._unique_values = UniqueValues()
         self._document = _document
 
+    @property
+    def json_path(self) -> str:
+        if not isinstance(self._json_path, str):
+            self._json_path = self._json_path.full_path
+        return self._json_path
+
+    @json_path.setter
+    def json_path(self, json_path: str) -> None:
+        self._json_path = json_path
+
     @property
     def full_path(self) -> str:
         """
@@ -73,38 +88,42 @@ class Segment(Extractable):
                 for e in extractions:
                     tag = e.tag if e.tag else 'NO_TAGS'
                     if tag not in self.value[attribute]:
-                        self.value[attribute][tag] = [e.value]
+                        self.value[attribute][tag] = TrackedList([e.value])
                     else:
-                        if e.value not in self.value[attribute][tag]:
-                            self.value[attribute][tag].append(e.value)
+                        self._unique_values.append((attribute, tag), self.value[attribute][tag], e.value)
                     # TODO: handle provenance of non literals
                     if isinstance(e.value, Number) or isinstance(e.value, str):
                         extraction_provenances[e.value] = e.prov_id
-                self._extractions[attribute] = self._extractions[attribute].union(extractions)
-                new_id = self._document.provenance_id_index  # for the purpose of provenance hierarrchy tracking
-                storage_provenance_record: StorageProvenanceRecord = StorageProvenanceRecord(new_id, self.json_path,
-                                                                                             attribute,
-                                                                                             extraction_provenances,
-                                                                                             self.document)
-                self._document.provenance_id_index_incrementer()
-                self._document.provenances[new_id] = storage_provenance_record
-                self.create_storage_provenance(storage_provenance_record)
+                self._extractions[attribute].update(extractions)
+                self._record_storage_provenance(attribute, extraction_provenances)
                 return
             except StopIteration:
                 pass
 
         if attribute not in self._extractions:
             self._extractions[attribute] = set([])
-            self._value[attribute] = list()
+            self._value[attribute] = TrackedList()
 
-        self._extractions[attribute] = self._extractions[attribute].union(extractions)
+        self._extractions[attribute].update(extractions)
         extraction_provenances = dict()
         for a_extraction in extractions:
             # TODO: handle provenance of non literals
             if isinstance(a_extraction.value, Number) or isinstance(a_extraction.value, str):
                 extraction_provenances[a_extraction.value] = a_extraction.prov_id
-            if a_extraction.value not in self._value[attribute]:
-                self._value[attribute].append(a_extraction.value)
+            self._unique_values.append(attribute, self._value[attribute], a_extraction.value)
+
+        self._record_storage_provenance(attribute, extraction_provenances)
+
+    def _record_storage_provenance(self, attribute: str, extraction_provenances: Dict) -> None:
+        provenance_level = self._document.provenance_level
+        if provenance_level == ProvenanceLevel.OFF:
+            return
+
+        if provenance_level == ProvenanceLevel.COMPACT:
+            new_id = self._document.provenances.add_storage(self.json_path, attribute, extraction_provenances)
+            self._document.provenance_id_index_incrementer()
+            self._document.jsonpath_provenances.setdefault(self.json_path + '.' + attribute, []).append(new_id)
+            return
 
         new_id = self._document.provenance_id_index  # for the purpose of provenance hierarchy tracking
         storage_provenance_record: StorageProvenanceRecord = StorageProvenanceRecord(new_id, self.json_path, attribute,
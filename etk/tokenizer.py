@@ -2,7 +2,157 @@ import spacy
 import re
 from spacy.tokenizer import Tokenizer as spacyTokenizer
 from spacy.tokens import Token, Doc
-from typing import List
+from typing import List, Iterable, Iterator
+from collections import OrderedDict
+from contextlib import contextmanager
+
+_integer_re = re.compile(r'^[-+]?[0-9]+$')
+_decimal_re = re.compile(r'^[-+]?[0-9]+\.[0-9]+$')
+
+
+def _get_shape(token):
+    """Add full_shape attribute. Eg. 21.33 => dd.dd, esadDeweD23 => xxxxXxxxXdd"""
+    full_shape = ""
+    for i in token.text:
+        if i.isdigit():
+            full_shape += "d"
+        elif i.islower():
+            full_shape += "x"
+        elif i.isupper():
+            full_shape += "X"
+        else:
+            full_shape += i
+    return full_shape
+
+
+def _is_integer(token):
+    return bool(_integer_re.match(token.text))
+
+
+def _is_decimal(token):
+    return bool(_decimal_re.match(token.text))
+
+
+def _is_ordinal(token):
+    return token.orth_[-2:] in ['rd', 'st', 'th', 'nd']
+
+
+def _is_mixed(token):
+    if not token.is_title and not token.is_lower and not token.is_upper:
+        return True
+    else:
+        return False
+
+
+def _n_prefix(token, n):
+    """Add get_prefix method. RETURN length N prefix"""
+    return token.text[:n]
+
+
+def _n_suffix(token, n):
+    """Add get_suffix method. RETURN length N suffix"""
+    return token.text[-n:]
+
+
+def _register_token_extensions() -> None:
+    """
+    Register the custom attributes and methods on spaCy Token, they are class level so this is done once
+    """
+    Token.set_extension("full_shape", getter=_get_shape, force=True)
+    Token.set_extension("is_integer", getter=_is_integer, force=True)
+    Token.set_extension("is_decimal", getter=_is_decimal, force=True)
+    Token.set_extension("is_ordinal", getter=_is_ordinal, force=True)
+    Token.set_extension("is_mixed", getter=_is_mixed, force=True)
+    Token.set_extension("n_prefix", method=_n_prefix, force=True)
+    Token.set_extension("n_suffix", method=_n_suffix, force=True)
+
+
+_register_token_extensions()
+
+
+def pipe(nlp, texts: Iterable[str], disable=[], batch_size: int = 1000, n_process: int = 1) -> Iterator[Doc]:
+    """
+    Run nlp over many texts with nlp.pipe, yielding a spaCy doc for each text, in the same order
+
+    Args:
+        nlp: spaCy Language
+        texts (Iterable[str]):
+        disable (List[str]): names of the spaCy pipes not to run
+        batch_size (int): number of texts spaCy processes at a time
+        n_process (int): number of processes spaCy uses, requires spaCy 2.2.2+ when not 1
+
+    Returns: Iterator[Doc]
+
+    """
+    kwargs = {"n_process": n_process} if n_process != 1 else {}
+    disable = [name for name in disable if name in nlp.pipe_names]
+    return nlp.pipe(texts, disable=disable, batch_size=batch_size, **kwargs)
+
+
+class TokenizationCache(object):
+    """
+    Tokenization results keyed by tokenizer and text, shared by all the extractors run on a document,
+    or by all the documents processed by an ETK when it has a bounded size.
+    """
+
+    def __init__(self, maxsize: int = None) -> None:
+        """
+        Args:
+            maxsize (int): number of tokenization results kept, the least recently used are dropped first,
+                None to keep all of them
+        """
+        self.maxsize = maxsize
+        self._results = OrderedDict()
+
+    def get(self, key, compute):
+        """
+        Args:
+            key: hashable key of the tokenization, e.g. (tokenizer, text)
+            compute: function returning the tokenization when it is not cached
+
+        Returns: the cached or computed tokenization
+        """
+        try:
+            result = self._results[key]
+            if self.maxsize:
+                self._results.move_to_end(key)
+            return result
+        except KeyError:
+            result = compute()
+            self._results[key] = result
+            if self.maxsize and len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+            return result
+
+    def clear(self) -> None:
+        self._results.clear()
+
+    def __contains__(self, key) -> bool:
+        return key in self._results
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+
+_active_cache = None
+
+
+@contextmanager
+def use_tokenization_cache(cache: TokenizationCache):
+    """
+    Make every Tokenizer look up and store its results in cache inside the with block, e.g. while a Document
+    runs an extractor, so extractors tokenizing the same text with the same tokenizer share the tokens
+
+    Args:
+        cache (TokenizationCache):
+    """
+    global _active_cache
+    previous = _active_cache
+    _active_cache = cache
+    try:
+        yield cache
+    finally:
+        _active_cache = previous
 
 
 class Tokenizer(object):
@@ -50,15 +200,43 @@ class Tokenizer(object):
         """
 
         """Tokenize text"""
+        if _active_cache is not None:
+            return _active_cache.get((self, self.keep_multi_space, bool(customize), tuple(disable), text),
+                                     lambda: self._tokenize(text, customize, disable))
+        return self._tokenize(text, customize, disable)
+
+    def _tokenize(self, text: str, customize=True, disable=[]) -> List[Token]:
         if not self.keep_multi_space:
             text = re.sub(' +', ' ', text)
         # disable spacy parsing, tagging etc as it takes a long time if the text is short
         tokens = self.nlp(text, disable=disable)
         if customize:
-            tokens = [self.custom_token(a_token) for a_token in tokens]
+            tokens = list(tokens)
 
         return tokens
 
+    def tokenize_many(self, texts: List[str], customize=True, disable=[], batch_size: int = 1000,
+                      n_process: int = 1) -> List[List[Token]]:
+        """
+        Tokenize many texts at once with nlp.pipe, returning a list of tokens for each text, in the same order
+
+        Args:
+            texts (List[str]):
+            customize (bool): return lists of tokens if True, spaCy docs otherwise
+            disable (List[str]): names of the spaCy pipes not to run
+            batch_size (int): number of texts spaCy processes at a time
+            n_process (int): number of processes spaCy uses, requires spaCy 2.2.2+ when not 1
+
+        Returns: [[tokens]]
+
+        """
+        if not self.keep_multi_space:
+            texts = (re.sub(' +', ' ', text) for text in texts)
+        docs = pipe(self.nlp, texts, disable=disable, batch_size=batch_size, n_process=n_process)
+        if customize:
+            return [list(doc) for doc in docs]
+        return list(docs)
+
     def tokenize_to_spacy_doc(self, text: str) -> Doc:
         """
         Tokenize the given text, returning a spacy doc. Used for spacy rule extractor
@@ -69,13 +247,15 @@ class Tokenizer(object):
         Returns: Doc
 
         """
+        if _active_cache is not None:
+            return _active_cache.get((self, self.keep_multi_space, "spacy_doc", text),
+                                     lambda: self._tokenize_to_spacy_doc(text))
+        return self._tokenize_to_spacy_doc(text)
+
+    def _tokenize_to_spacy_doc(self, text: str) -> Doc:
         if not self.keep_multi_space:
             text = re.sub(' +', ' ', text)
-        doc = self.nlp(text, disable=['parser'])
-        for a_token in doc:
-            self.custom_token(a_token)
-
-        return doc
+        return self.nlp(text, disable=['parser'])
 
     def custom_tokenizer(self) -> spacyTokenizer:
         """
@@ -91,69 +271,11 @@ class Tokenizer(object):
     def custom_token(spacy_token) -> Token:
         """
         Function for token attributes extension, methods extension
-        Use set_extension method.
+        The extensions are registered on the Token class once, when this module is imported,
+        see _register_token_extensions.
         Reference: https://spacy.io/api/token, https://spacy.io/usage/processing-pipelines#custom-components-attributes
 
         """
-
-        """Add custom attributes"""
-        """Add full_shape attribute. Eg. 21.33 => dd.dd, esadDeweD23 => xxxxXxxxXdd"""
-
-        def get_shape(token):
-            full_shape = ""
-            for i in token.text:
-                if i.isdigit():
-                    full_shape += "d"
-                elif i.islower():
-                    full_shape += "x"
-                elif i.isupper():
-                    full_shape += "X"
-                else:
-                    full_shape += i
-            return full_shape
-
-        spacy_token.set_extension("full_shape", getter=get_shape, force=True)
-
-        def is_integer(token):
-            pattern = re.compile('^[-+]?[0-9]+$')
-            return bool(pattern.match(token.text))
-
-        spacy_token.set_extension("is_integer", getter=is_integer, force=True)
-
-        def is_decimal(token):
-            pattern = re.compile('^[-+]?[0-9]+\.[0-9]+$')
-            return bool(pattern.match(token.text))
-
-        spacy_token.set_extension("is_decimal", getter=is_decimal, force=True)
-
-        def is_ordinal(token):
-            return token.orth_[-2:] in ['rd', 'st', 'th', 'nd']
-
-        spacy_token.set_extension("is_ordinal", getter=is_ordinal, force=True)
-
-        def is_mixed(token):
-            if not token.is_title and not token.is_lower and not token.is_upper:
-                return True
-            else:
-                return False
-
-        spacy_token.set_extension("is_mixed", getter=is_mixed, force=True)
-
-        """Add custom methods"""
-        """Add get_prefix method. RETURN length N prefix"""
-
-        def n_prefix(token, n):
-            return token.text[:n]
-
-        spacy_token.set_extension("n_prefix", method=n_prefix, force=True)
-
-        """Add get_suffix method. RETURN length N suffix"""
-
-        def n_suffix(token, n):
-            return token.text[-n:]
-
-        spacy_token.set_extension("n_suffix", method=n_suffix, force=True)
-
         return spacy_token
 
     @staticmethod
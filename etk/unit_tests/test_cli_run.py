@@ -0,0 +1,84 @@
+import unittest, json, os, gzip, tempfile, argparse
+from etk.cli import run
+
+sample_inputs = [
+    {
+        "doc_id": str(i),
+        "projects": [
+            {
+                "name": "etk",
+                "description": "version {} of etk, implemented by Runqi, Dongyu, Sylvia, Amandeep and others.".format(i)
+            }
+        ]
+    } for i in range(10)
+]
+
+version_module = '''
+from etk.etk_module import ETKModule
+from etk.extractors.regex_extractor import RegexExtractor
+
+
+class CliRunVersionModule(ETKModule):
+    def __init__(self, etk):
+        ETKModule.__init__(self, etk)
+        self.version_extractor = RegexExtractor(pattern=r"version \\d+", extractor_name="version_extractor")
+
+    def process_document(self, doc):
+        for d in doc.select_segments("projects[*].description"):
+            extractions = doc.extract(self.version_extractor, d)
+            doc.kg.add_value("developer", value=[e.value for e in extractions])
+        return list()
+'''
+
+
+class TestCliRun(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.modules_dir = os.path.join(self.tmp_dir.name, "modules")
+        os.makedirs(self.modules_dir)
+        with open(os.path.join(self.modules_dir, "em_cli_run_version.py"), "w") as f:
+            f.write(version_module)
+        self.input_file = os.path.join(self.tmp_dir.name, "docs.jl")
+        with open(self.input_file, "w") as f:
+            for doc in sample_inputs:
+                f.write(json.dumps(doc) + "\n")
+            f.write("\n")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def run_command(self, output_name: str, *options) -> list:
+        parser = argparse.ArgumentParser()
+        run.add_arguments(parser)
+        output_file = os.path.join(self.tmp_dir.name, output_name)
+        args = parser.parse_args([self.input_file, "-m", self.modules_dir, "-k",
+                                  "etk/unit_tests/ground_truth/test_config.json", "-o", output_file] + list(options))
+        run.run(args)
+        open_output = gzip.open if output_name.endswith(".gz") else open
+        with open_output(output_file, "rt") as f:
+            return [json.loads(line) for line in f]
+
+    def test_run(self) -> None:
+        results = self.run_command("out.jl")
+        self.assertEqual([r["doc_id"] for r in results], [str(i) for i in range(10)])
+        for i, result in enumerate(results):
+            self.assertEqual(result["knowledge_graph"]["developer"][0]["value"], "version {}".format(i))
+            self.assertIn("provenances", result)
+
+    def test_run_workers(self) -> None:
+        expected = self.run_command("out.jl", "--provenance", "off")
+        self.assertTrue(all("provenances" not in r for r in expected))
+        results = self.run_command("out.jl.gz", "--provenance", "off", "-w", "2", "-b", "3")
+        self.assertEqual(results, expected)
+
+        results = self.run_command("unordered.jl", "--provenance", "off", "-w", "2", "-b", "3", "--unordered")
+        self.assertEqual(sorted(results, key=lambda r: int(r["doc_id"])), expected)
+
+    def test_run_output_kg_only(self) -> None:
+        results = self.run_command("kg.jl", "--output-kg-only")
+        self.assertEqual([r["developer"][0]["value"] for r in results], ["version {}".format(i) for i in range(10)])
+        self.assertTrue(all("doc_id" not in r for r in results))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -127,6 +127,35 @@ class TestDateExtractor(unittest.TestCase):
         self.assertEqual(results_with_base, expected_with_base)
         self.assertEqual(results_base_today, expected_base_today)
 
+    def test_relative_date_batch(self) -> None:
+        texts = ['5 days ago', 'nothing relative here', 'in two months and yesterday']
+        base = datetime.datetime(2018, 1, 1, tzinfo=pytz.timezone('UTC'))
+
+        extractions = de.extract_relative_dates(texts, relative_base=base)
+        results = [[e.value for e in x] for x in extractions]
+
+        expected = [
+            [self.convert_to_iso_format(base + relativedelta(days=-5))],
+            [],
+            [self.convert_to_iso_format(base + relativedelta(months=2)),
+             self.convert_to_iso_format(base + relativedelta(days=-1))]
+        ]
+
+        self.assertEqual(results, expected)
+
+    def test_extract_batch(self) -> None:
+        texts = ['04/03/2018', 'Jun 27 2017', 'no date', '04/03/2018', '2009-10-23']
+
+        extractions = de.extract_batch(texts, preferred_date_order='DMY', prefer_language_date_order=False)
+        results = [[e.value for e in x] for x in extractions]
+
+        expected = [[e.value for e in de.extract(text, preferred_date_order='DMY', prefer_language_date_order=False)]
+                    for text in texts]
+
+        self.assertEqual(results, expected)
+        self.assertEqual(results[0], ['2018-03-04'])
+        self.assertIsNot(extractions[0][0], extractions[3][0])
+
     def test_order_preference(self) -> None:
         text = '10111211, 04/03/2018, 11121011'
 
@@ -172,6 +201,14 @@ class TestDateExtractor(unittest.TestCase):
 
         self.assertEqual(results, expected)
 
+    def test_given_language(self) -> None:
+        text = 'el 29 de febrero de 1996 vs lunes, el 24 de junio, 2013 vs 3 de octubre de 2017, and 04/03/2010'
+
+        detected = [e.value for e in de.extract(text, prefer_language_date_order=True, preferred_date_order='MDY')]
+        given = [e.value for e in de.extract(text, language='es', preferred_date_order='MDY')]
+
+        self.assertEqual(given, detected)
+
     def test_original_resolution(self) -> None:
         text = '2019-10-23 | 2017-06 | 2018-03-10 10:12 | July 2018 | Mar 2000 | year 2020'
 
@@ -73,6 +73,20 @@ class TestDocumentSelector(unittest.TestCase):
         self.assertEqual(True, res_true)
         self.assertEqual(False, res_false)
 
+    def test_compiled_selector(self) -> None:
+        doc = etk.create_document(sample_input)
+        selector_true = DefaultDocumentSelector(datasets=[".*unittest", ".*abc"],
+                                                url_patterns=[".*unittest", ".*zxc"],
+                                                website_patterns=[".*unittest", ".*abc"],
+                                                json_paths=["$.website"],
+                                                json_paths_regex=[".*unittest", ".*abc"])
+        selector_false = DefaultDocumentSelector(datasets=[".*unittest"], url_patterns=[".*ZXc", ".*hhhh"])
+        self.assertEqual(True, selector_true.select_document(doc))
+        self.assertEqual(False, selector_false.select_document(doc))
+        self.assertEqual(True, DefaultDocumentSelector().select_document(doc))
+        self.assertEqual(False, DefaultDocumentSelector(datasets=[".*"]).select_document(
+            etk.create_document({"url": "zxc"})))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,7 @@
 import unittest
 from etk.extraction import Extractable
-from etk.tokenizer import Tokenizer
+from etk.tokenizer import Tokenizer, TokenizationCache, use_tokenization_cache
+from etk.etk import ETK
 
 
 class TestExtractable(unittest.TestCase):
@@ -36,5 +37,28 @@ class TestExtractable(unittest.TestCase):
 
         self.assertEqual(text, expected_str)
 
+    def test_document_tokenization_cache(self) -> None:
+        etk = ETK(use_spacy_tokenizer=True)
+        doc = etk.create_document({'a': 'i live in los angeles.', 'b': 'i live in los angeles.'})
+        t = etk.default_tokenizer
+
+        tokens = doc.select_segments("$.a")[0].get_tokens(t)
+        self.assertIs(doc.select_segments("$.a")[0].get_tokens(t), tokens)
+        self.assertIs(doc.select_segments("$.b")[0].get_tokens(t), tokens)
+        self.assertEqual(len(doc.tokenization_cache), 1)
+        self.assertIsNot(etk.create_document({'a': 'i live in los angeles.'}).tokenization_cache,
+                         doc.tokenization_cache)
+
+    def test_shared_tokenization_cache(self) -> None:
+        cache = TokenizationCache(maxsize=2)
+        t = Tokenizer()
+        with use_tokenization_cache(cache):
+            tokens = t.tokenize('one')
+            self.assertIs(t.tokenize('one'), tokens)
+            t.tokenize('two')
+            t.tokenize('three')
+        self.assertEqual(len(cache), 2)
+        self.assertIsNot(t.tokenize('three'), t.tokenize('three'))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
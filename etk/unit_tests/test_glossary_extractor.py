@@ -4,6 +4,13 @@ from etk.tokenizer import Tokenizer
 from etk.etk import ETK
 from etk.document import Document
 import time
+import tempfile
+import os
+import re
+import copy
+import json
+from unittest import mock
+from spacy.tokenizer import Tokenizer as spacyTokenizer
 
 
 class TestGlossaryExtractor(unittest.TestCase):
@@ -46,6 +53,86 @@ class TestGlossaryExtractor(unittest.TestCase):
 
         self.assertEqual(results, expected)
 
+    def test_longest_match_only(self) -> None:
+        t = Tokenizer()
+        text = 'i live in los angeles. my hometown is Beijing. I love New York City.'
+        tokens = t.tokenize(text)
+
+        ge = GlossaryExtractor(self.glossary_1 + self.glossary_2, 'test_glossary', t, None, False,
+                               longest_match_only=True)
+
+        results = [i.value for i in ge.extract(tokens)]
+        expected = ['los angeles', 'Beijing', 'New York City']
+
+        self.assertEqual(results, expected)
+
+    def test_long_entries(self) -> None:
+        t = Tokenizer()
+        text = 'the University of Southern California Information Sciences Institute is in Marina del Rey.'
+        tokens = t.tokenize(text)
+
+        glossary = ['University of Southern California Information Sciences Institute', 'Marina del Rey']
+        ge = GlossaryExtractor(glossary, 'test_glossary', t, None, False)
+
+        results = [i.value for i in ge.extract(tokens)]
+        expected = ['Marina del Rey', 'University of Southern California Information Sciences Institute']
+
+        self.assertEqual(results, expected)
+
+    def test_index_dir(self) -> None:
+        t = Tokenizer()
+        text = 'i live in los angeles. my hometown is Beijing. I love New York City.'
+        tokens = t.tokenize(text)
+
+        with tempfile.TemporaryDirectory() as index_dir:
+            ge = GlossaryExtractor(self.glossary_1, 'test_glossary', t, 3, False, index_dir=index_dir)
+            self.assertEqual(len(os.listdir(index_dir)), 1)
+            ge_loaded = GlossaryExtractor(self.glossary_1, 'test_glossary', t, 3, False, index_dir=index_dir)
+            self.assertEqual(ge_loaded._glossary, ge._glossary)
+            GlossaryExtractor(self.glossary_1, 'test_glossary', t, 3, True, index_dir=index_dir)
+            self.assertEqual(len(os.listdir(index_dir)), 2)
+
+            results = [i.value for i in ge_loaded.extract(tokens)]
+            expected = ['Beijing', 'los angeles', 'New York']
+
+            self.assertEqual(results, expected)
+
+    def test_index_dir_files(self) -> None:
+        t = Tokenizer()
+        dot_tokenizer = Tokenizer(copy.copy(t.nlp))
+        dot_tokenizer.nlp.tokenizer = spacyTokenizer(t.nlp.vocab, infix_finditer=re.compile(r'\.').finditer)
+        with tempfile.TemporaryDirectory() as index_dir:
+            ge = GlossaryExtractor(self.glossary_1, 'test_glossary', t, 3, False, index_dir=index_dir)
+            index_file = os.path.join(index_dir, os.listdir(index_dir)[0])
+            with open(index_file) as f:
+                self.assertIn(["los", "angeles"], [key for key, value in json.load(f)["entries"]])
+
+            # same settings but other tokenizer rules, another index
+            GlossaryExtractor(self.glossary_1, 'test_glossary', dot_tokenizer, 3, False, index_dir=index_dir)
+            self.assertEqual(len(os.listdir(index_dir)), 2)
+
+            # an index file that is not a glossary index is not loaded, the glossary is tokenized again
+            with open(index_file, "wb") as f:
+                f.write(b"\x80\x04K\x01.")
+            with self.assertWarns(UserWarning):
+                ge_rebuilt = GlossaryExtractor(self.glossary_1, 'test_glossary', t, 3, False, index_dir=index_dir)
+            self.assertEqual(ge_rebuilt._glossary, ge._glossary)
+
+    def test_index_dir_failed_write(self) -> None:
+        t = Tokenizer()
+        with tempfile.TemporaryDirectory() as index_dir:
+            # the index is not saved, no partial file is left in index_dir
+            with mock.patch("etk.extractors.glossary_extractor.os.replace", side_effect=OSError("disk full")):
+                with self.assertWarns(UserWarning):
+                    ge = GlossaryExtractor(self.glossary_1, 'test_glossary', t, 3, False, index_dir=index_dir)
+            self.assertEqual(os.listdir(index_dir), [])
+            self.assertIn("angeles", ge._glossary["los"])
+
+            with mock.patch("etk.extractors.glossary_extractor.json.dump", side_effect=KeyboardInterrupt):
+                with self.assertRaises(KeyboardInterrupt):
+                    GlossaryExtractor(self.glossary_1, 'test_glossary', t, 3, False, index_dir=index_dir)
+            self.assertEqual(os.listdir(index_dir), [])
+
     def test_etk__spacy_glossary_extraction(self):
         etk = ETK(use_spacy_tokenizer=True)
         s = time.time()
@@ -60,6 +147,18 @@ class TestGlossaryExtractor(unittest.TestCase):
             for extracted_city in extracted_cities:
                 self.assertTrue(extracted_city.value in ['los angeles', 'New York', 'angeles'])
 
+    def test_extract_many(self):
+        etk = ETK(use_spacy_tokenizer=True)
+        city_extractor = GlossaryExtractor(['los angeles', 'new york', 'beijing'], 'city_extractor',
+                                           etk.default_tokenizer, case_sensitive=False, ngrams=3)
+        doc_json = {'texts': ['i live in los angeles.', 'my hometown is Beijing.', 'I love New York City.']}
+        doc = Document(etk, cdr_document=doc_json, mime_type='json', url='', doc_id='1')
+        t_segments = doc.select_segments("$.texts[*]")
+        results = [[e.value for e in x] for x in doc.extract_many(city_extractor, t_segments, batch_size=2)]
+
+        self.assertEqual(results, [['los angeles'], ['Beijing'], ['New York']])
+        self.assertEqual(len(doc.provenances), 3)
+
     def test_etk_crf_glossary_extraction(self):
         etk = ETK(use_spacy_tokenizer=False)
         s = time.time()
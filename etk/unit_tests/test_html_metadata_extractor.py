@@ -1,6 +1,9 @@
 import unittest
 import json
 from etk.extractors.html_metadata_extractor import HTMLMetadataExtractor
+from etk.extractors.html_content_extractor import HTMLContentExtractor, Strategy
+from etk.html_dom import looks_like_html
+from etk.etk import ETK
 
 
 class TestMetadataExtractor(unittest.TestCase):
@@ -180,6 +183,30 @@ class TestMetadataExtractor(unittest.TestCase):
                                'http://schema.org/creator': [{'@id': '#me'}]}]
         self.assertEqual(rdfa_data, expected_rdfa_data)
 
+    def test_shared_html_dom(self) -> None:
+        with open('etk/unit_tests/ground_truth/sample_html.jl', 'r') as f:
+            sample_html = json.load(f)
+        hme = HTMLMetadataExtractor()
+        hce = HTMLContentExtractor()
+        doc = ETK().create_document(sample_html)
+        raw = doc.select_segments("$.raw_content")[0]
+
+        title = doc.extract(hme, raw, extract_title=True, extract_meta=True)
+        all_text = doc.extract(hce, raw, strategy=Strategy.ALL_TEXT)
+        # the metadata and content extractors share the page parsed by html.parser
+        self.assertEqual(len(doc.html_dom_cache), 1)
+        self.assertEqual([e.value for e in title],
+                         [e.value for e in hme.extract(sample_html["raw_content"], extract_title=True,
+                                                       extract_meta=True)])
+        self.assertEqual(all_text[0].value,
+                         hce.extract(sample_html["raw_content"], strategy=Strategy.ALL_TEXT)[0].value)
+
+        self.assertTrue(looks_like_html("text <b>bold</b>"))
+        self.assertTrue(looks_like_html(b"<p>"))
+        self.assertFalse(looks_like_html("1 < 2 and 3 > 2"))
+        self.assertFalse(looks_like_html("no tags"))
+        self.assertEqual(doc.extract(hce, doc.select_segments("$.url")[0]), [])
+
 
 if __name__ == '__main__':
     unittest.main()
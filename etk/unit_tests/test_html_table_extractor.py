@@ -1,5 +1,7 @@
 import unittest
-from etk.extractors.table_extractor import TableExtractor, EntityTableDataExtraction
+from bs4.builder import HTML5TreeBuilder
+from etk.extractors.table_extractor import TableExtractor, EntityTableDataExtraction, TableExtraction, \
+    LxmlTableExtraction, TableEngine, Toolkit
 
 
 class TestTableExtractor(unittest.TestCase):
@@ -33,6 +35,77 @@ class TestTableExtractor(unittest.TestCase):
         self.assertEqual(len(res), 2)
         self.assertEqual(res[0].value, "test random text!")
 
+    def test_table_context(self) -> None:
+        doc = '<html><body><p>first</p>' + \
+              ''.join('<p>before {0}</p><table><tr><th>k{0}:</th><td>v{0}</td></tr><tr><th>n:</th><td>{0}</td></tr>'
+                      '</table><p>after {0}</p>'.format(i) for i in range(3)) + '</body></html>'
+        my_table_extractor = TableExtractor()
+        tables = [e.value for e in my_table_extractor.extract(doc)]
+        self.assertEqual(len(tables), 3)
+        # the strings of the table are the first strings after it, the tables before it are removed
+        self.assertEqual(tables[1]["context_before"], "before 1 after 0 before 0 first")
+        self.assertEqual(tables[1]["context_after"], "k1: v1 n: 1 after 1")
+        tables = [e.value for e in my_table_extractor.extract(doc, context=False)]
+        self.assertEqual([(t["context_before"], t["context_after"]) for t in tables], [("", "")] * 3)
+
+    parity_docs = [
+        '''<!DOCTYPE html>
+        <html><head><title>Prices</title><style>td {}</style></head>
+        <body><h1>Prices</h1><!-- list -->
+        <table class=" prices  list" border="1">
+        <caption>Prices in 2017</caption>
+        <thead><tr><th>item</th><th>price</th><th>note</th></tr></thead>
+        <tr><td>bread &amp; butter</td><td>2 &lt; 3</td><td>fresh<br>daily<script>track();</script></td></tr>
+        <tr><td><a href="/milk?size=1&amp;fat=2" title='say "hi"'>milk</a></td><td>1.5</td>
+        <td><img src="m.png"></td></tr>
+        <tr><td colspan="2">total: 3.5</td><td><input type="checkbox" disabled=""></td></tr>
+        <tfoot><tr><td>footer</td></tr></tfoot>
+        </table>
+        <p>after the prices</p>
+        </body>
+        </html>
+        ''',
+        '''<html><body><p>layout</p>
+        <table><tr><td><table><tbody><tr><th>k:</th><td>v</td></tr><tr><th>x:</th><td>1</td></tr></tbody></table>
+        </td><td>side</td></tr></table>
+        <table><tr><td rowspan="2">a</td><td>b</td></tr><tr><td>c</td></tr><tr><td>d</td><td>e<!-- note --></td></tr>
+        </table>
+        <table><tbody><tr><td>1</td></tr><tr><td>2</td></tr></tbody><tbody><tr><td>3</td></tr></tbody></table>
+        </body></html>''',
+        test_doc
+    ]
+
+    def test_lxml_table_extraction_parity(self) -> None:
+        for doc in self.parity_docs:
+            expected = TableExtraction().extract(doc)
+            self.assertTrue(len(expected["tables"]) > 0)
+            self.assertEqual(LxmlTableExtraction().extract(doc), expected)
+            self.assertEqual(LxmlTableExtraction().extract(doc.encode('utf-8')), expected)
+            self.assertEqual(LxmlTableExtraction().extract(doc, context=False),
+                             TableExtraction().extract(doc, context=False))
+        self.assertEqual(LxmlTableExtraction().extract(''), TableExtraction().extract(''))
+
+        my_table_extractor = TableExtractor(engine=TableEngine.LXML)
+        res = my_table_extractor.extract(TestTableExtractor.test_doc, True)
+        self.assertEqual(len(res), 2)
+        self.assertEqual(res[0].value, "test random text!")
+        self.assertEqual(res[1].value, TableExtractor().extract(TestTableExtractor.test_doc)[0].value)
+
+    def test_lxml_cell_html(self) -> None:
+        # the cells are written with the rules of BeautifulSoup: void elements, attributes with several values,
+        # strings written without escaping them, and strings left out of stripped_strings
+        cells = ['a<{0} id="x">b'.format(tag) for tag in ['area', 'base', 'basefont', 'bgsound', 'command', 'embed',
+                                                          'hr', 'img', 'input', 'keygen', 'link', 'meta', 'param',
+                                                          'source', 'track', 'wbr']]
+        cells.extend('a<{0} {1}=" p  q ">b</{0}>'.format('span' if tag == '*' else tag, attribute)
+                     for tag, attributes in HTML5TreeBuilder().cdata_list_attributes.items()
+                     for attribute in attributes)
+        cells.append('a<style>x < y & z</style><template>t</template><ruby>r<rp>(</rp><rt>R</rt></ruby>')
+        for cell in cells:
+            doc = '<table><tr><td>{}</td><td>1</td></tr><tr><td>c</td><td>2</td></tr></table>'.format(cell)
+            expected = TableExtraction().extract(doc)
+            self.assertEqual(LxmlTableExtraction().extract(doc), expected)
+
     def test_entity_table_data_extractor(self) -> None:
         expected_res = [("caliber", "0.45 mm"),
                         ("manufacturer", "WXC"),
@@ -49,6 +122,43 @@ class TestTableExtractor(unittest.TestCase):
         res = [(x.tag, x.value) for x in res]
         self.assertEqual(res, expected_res)
 
+    def test_cell_matches_dict(self) -> None:
+        table_data_extractor = EntityTableDataExtraction()
+        glossary = ["Caliber", "calibre", "cal"]
+        table_data_extractor.add_glossary(glossary, "caliber")
+        self.assertTrue(table_data_extractor.cell_matches_dict("CALIBER:", glossary))
+        self.assertTrue(table_data_extractor.cell_matches_dict("cal.", ["cal"]))
+        self.assertFalse(table_data_extractor.cell_matches_dict("caliber of the gun", glossary))
+        self.assertFalse(table_data_extractor.cell_matches_dict("", glossary))
+        glossary.append("gun caliber")
+        self.assertTrue(table_data_extractor.cell_matches_dict("the gun caliber", glossary))
+        for cell in ["caliber", "cal", "calibres", "calibre of", "Caliber of gun", "gun caliber:"]:
+            self.assertEqual(table_data_extractor.cell_matches_dict(cell, glossary),
+                             any(table_data_extractor.cell_matches_text(cell, x) for x in glossary))
+
+        # entries changed in place are matched, the glossary is indexed again
+        glossary[0] = "bore"
+        self.assertTrue(table_data_extractor.cell_matches_dict("Bore:", glossary))
+        self.assertFalse(table_data_extractor.cell_matches_dict("caliber", glossary))
+        table = {"features": {"max_cols_in_a_row": 2, "no_of_rows": 2},
+                 "rows": [{"cells": [{"text": "Bore:"}, {"text": "9 mm"}]},
+                          {"cells": [{"text": "Caliber"}, {"text": "45"}]}]}
+        self.assertEqual([(x.tag, x.value) for x in table_data_extractor.extract(table)], [("caliber", "9 mm")])
+
+    def test_normalize_cells(self) -> None:
+        cells = [["Price: 1,200.00 \u20ac", "  a.m. (approx.)", "mail john.doe@isi.edu"],
+                 ["tom@x.com, bob@y.com, jo@z.org", "", "50% off!\t#1"]]
+        expected = [["price NUM NUMNUMNUM.NUMNUM", "a m. approx.", "mail john EMAILNAME isi edu"],
+                    ["EMAILNAME x com EMAILNAME y com jo@z org", "", "NUMNUM% off #NUM"]]
+        normalized = [[cell.lower() for cell in r] for r in cells]
+        Toolkit.normalize_cells(normalized)
+        self.assertEqual(normalized, expected)
+
+        separate = [[cell.lower() for cell in r] for r in cells]
+        Toolkit.clean_cells(separate)
+        Toolkit.regulize_cells(separate)
+        self.assertEqual(separate, expected)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
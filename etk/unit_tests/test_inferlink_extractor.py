@@ -1,5 +1,6 @@
 import unittest, json
 from etk.extractors.inferlink_extractor import InferlinkExtractor, InferlinkRuleSet
+from etk.dependencies.landmark.landmark_extractor.extraction.Landmark import loadRule
 
 
 class TestInferlinkExtractor(unittest.TestCase):
@@ -26,6 +27,24 @@ class TestInferlinkExtractor(unittest.TestCase):
 
         self.assertEqual(result, expected)
 
+    def test_iteration_rule(self) -> None:
+        page = '<ul><li>a</li><li>bb</li><li></li><li>c</li></ul>'
+        rule = loadRule({"name": "items", "rule_type": "IterationRule", "begin_regex": "\\<ul\\>",
+                         "end_regex": "\\</ul\\>", "iter_begin_regex": "\\<li\\>", "iter_end_regex": "\\</li\\>"})
+        sequence = rule.apply(page)['sequence']
+        self.assertEqual([(x['extract'], x['begin_index'], x['end_index']) for x in sequence],
+                         [('a', 8, 9), ('bb', 18, 20), ('c', 38, 39)])
+        self.assertEqual([x['sequence_number'] for x in sequence], [1, 2, 3])
+
+        # ^ matches at the start of the rest of the page, as when it was searched in a copy of it
+        rule = loadRule({"name": "items", "rule_type": "IterationRule", "begin_regex": "", "end_regex": "",
+                         "iter_begin_regex": "^(\\</li\\>)?\\<li\\>", "iter_end_regex": "\\</li\\>"})
+        self.assertEqual([x['extract'] for x in rule.apply(page[4:-5])['sequence']], ['a', 'bb', 'c'])
+
+        rule = loadRule({"name": "item", "rule_type": "ItemRule", "begin_regex": "\\<li\\>",
+                         "end_regex": "\\</ul\\>", "strip_end_regex": "\\</li\\>"})
+        self.assertEqual(rule.apply(page)['extract'], 'a</li><li>bb</li><li></li><li>c')
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,44 @@
+import unittest
+import jsonpath_ng.ext
+from etk.json_path import CompiledJsonPath
+
+sample_input = {
+    "doc_id": "1",
+    "url": "http://ex.com/123",
+    "empty": None,
+    "x y": "a field that needs quotes",
+    "projects": [
+        {"name": "etk", "description": "version 2 of etk", "tags": ["a", "b"], "members": {"lead": "Pedro"}},
+        {"name": "rltk", "description": "record linkage toolkit", "tags": "c"},
+        {"name": "dig"},
+        "not a dict",
+        None
+    ],
+    "matrix": [[1, 2], [3], []],
+    "nested": {"a": {"b": {"c": 0}}}
+}
+
+
+class TestJsonPath(unittest.TestCase):
+    def test_same_as_jsonpath_ng(self) -> None:
+        paths = ["$", "$.doc_id", "doc_id", "$.missing", "$.empty", "$.empty[*]", "$['x y']", "$.projects",
+                 "$.projects[*]", "$.projects[*].name", "projects[*].description", "$.projects[*].tags[*]",
+                 "$.projects[*].members[*]", "$.projects.name", "$.matrix[*][*]", "$.nested.a.b.c", "$.url[*]",
+                 "$[*]", "$.nested.a.b.c[*]", "$.projects[0].name", "$.projects[*].*", "$..name",
+                 "$.projects[?name = 'etk'].description"]
+        for path in paths:
+            parsed = jsonpath_ng.ext.parse(path)
+            expected = [(str(m.full_path), m.value) for m in parsed.find(sample_input)]
+            results = [(m.full_path, m.value) for m in CompiledJsonPath(parsed).find(sample_input)]
+            self.assertEqual(results, expected, path)
+
+    def test_simple_paths(self) -> None:
+        for path in ["$", "$.doc_id", "a.b", "$.projects[*].name", "$.matrix[*][*]", "$['x y']"]:
+            self.assertTrue(CompiledJsonPath(jsonpath_ng.ext.parse(path)).is_simple, path)
+        for path in ["$.projects[0].name", "$.projects[*].*", "$..name", "$.projects[?name = 'etk']", "$.a,b",
+                     "$.matrix[1:]"]:
+            self.assertFalse(CompiledJsonPath(jsonpath_ng.ext.parse(path)).is_simple, path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -152,10 +152,37 @@ class TestKnowledgeGraph(unittest.TestCase):
         self.assertEqual(expected_non_empty, sample_doc.kg.value["test_non_empty"])
         self.assertEqual(expected_empty, sample_doc.kg.value["test_empty"])
 
+    def test_add_value_changed_in_place(self):
+        kg = self.doc.kg
+        kg.add_value("developer", value=["Runqi", "Dongyu"])
+        kg.value["developer"][0] = {"value": "Sylvia", "key": "sylvia"}
+        kg.add_value("developer", value=["Runqi", "Sylvia"])
+        self.assertEqual(["Sylvia", "Dongyu", "Runqi"], [v["value"] for v in kg.value["developer"]])
+        kg.value["developer"].pop()
+        kg.value["developer"].append({"value": "Amandeep", "key": "amandeep"})
+        kg.add_value("developer", value=["Amandeep", "Runqi"])
+        self.assertEqual(["Sylvia", "Dongyu", "Amandeep", "Runqi"], [v["value"] for v in kg.value["developer"]])
+
     def test_add_value_empty(self):
         self.doc.kg.add_value('test_zero', 0.0)
         self.assertEqual(self.doc.kg.value['test_zero'][0]['value'], 0.0)
 
+    def test_schema_validate_many(self):
+        schema = self.doc.kg.schema
+        dates = ['2007', '2007-12', '2007-12-05', '2007-12-05T23', '2007-12-05T23:19:00', '2007-02-30',
+                 '2007-12-05 23:19:00', date(2018, 3, 28), 2007]
+        self.assertEqual([(True, '2007-01-01T00:00:00'), (True, '2007-12-01T00:00:00'),
+                          (True, '2007-12-05T00:00:00'), (True, '2007-12-05T23:00:00'),
+                          (True, '2007-12-05T23:19:00'), (False, '2007-02-30'), (False, '2007-12-05 23:19:00'),
+                          (True, '2018-03-28'), (False, 2007)],
+                         schema.validate_many('test_date', dates))
+        numbers = ['1,234', ' 12.5 ', '+3', '.5', '1e5', 'nan', 'abc', '', 7]
+        self.assertEqual([True, True, True, True, False, False, False, False, True],
+                         [valid for valid, _ in schema.validate_many('test_number', numbers)])
+        self.assertEqual([schema.is_valid('developer', x) for x in [' a ', 3]],
+                         schema.validate_many('developer', [' a ', 3]))
+        self.assertEqual([(False, 1)], schema.validate_many('not_a_field', [1]))
+
 
 class TestKnowledgeGraphWithOntology(unittest.TestCase):
     def setUp(self):
@@ -218,3 +245,16 @@ class TestKnowledgeGraphWithOntology(unittest.TestCase):
         self.assertEqual('has_name', field_name)
         kg.add_value(field_name, 'Jack')
         self.assertIn({'value': 'Jack', "key": "jack"}, kg._kg[field_name])
+
+    def test_add_value_kg_jsonld_tracked_types(self):
+        kg = self.doc.kg
+        ontology = self.doc.etk.ontology
+        field_name = kg.context_resolve(DIG.has_name)
+        field_child = kg.context_resolve(DIG.has_child)
+        kg.add_value(field_child, {'@id': 'http://xxx/3', '@type': [DIG.Person]})
+        for i in range(100):
+            kg.add_value(field_name, 'Jack {}'.format(i))
+        self.assertEqual(100, len(kg._kg[field_name]))
+        # the tracked types give the same result as parsing the knowledge graph
+        self.assertEqual(ontology.is_valid(field_name, 'Jill', kg._kg),
+                         ontology.is_valid(field_name, 'Jill', kg._kg, kg._types))
@@ -0,0 +1,44 @@
+import unittest, gc
+from etk import nlp_registry
+from etk.etk import ETK
+
+
+class TestNlpRegistry(unittest.TestCase):
+    def test_shared_model(self) -> None:
+        etk = ETK(use_spacy_tokenizer=True)
+        other_etk = ETK(use_spacy_tokenizer=True)
+
+        self.assertIs(etk.default_nlp, other_etk.default_nlp)
+        self.assertIs(etk.default_tokenizer, other_etk.default_tokenizer)
+        self.assertIs(etk.default_tokenizer.nlp.vocab, etk.default_nlp.vocab)
+        self.assertIsNot(etk.default_tokenizer.nlp.tokenizer, etk.default_nlp.tokenizer)
+
+    def test_reference_count(self) -> None:
+        nlp = nlp_registry.load_model('en_core_web_sm')
+        t1 = nlp_registry.get_tokenizer(nlp)
+        t2 = nlp_registry.get_tokenizer(nlp)
+        self.assertIs(t1, t2)
+        self.assertEqual(nlp_registry.reference_count(t1), 2)
+
+        nlp_registry.release(t1)
+        self.assertEqual(nlp_registry.reference_count(t2), 1)
+        self.assertEqual([t.orth_ for t in t2.tokenize("dsa@isi.edu 32.4")], ['dsa', '@', 'isi', '.', 'edu', '32.4'])
+
+        nlp_registry.release(t2)
+        self.assertEqual(nlp_registry.reference_count(t2), 0)
+        t3 = nlp_registry.get_tokenizer(nlp)
+        self.assertIsNot(t3, t2)
+        nlp_registry.release(t3)
+        nlp_registry.release(nlp)
+
+    def test_release_with_etk(self) -> None:
+        etk = ETK(use_spacy_tokenizer=True)
+        tokenizer = etk.default_tokenizer
+        count = nlp_registry.reference_count(tokenizer)
+        del etk
+        gc.collect()
+        self.assertEqual(nlp_registry.reference_count(tokenizer), count - 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -150,6 +150,42 @@ class TestOntologyAPI(unittest.TestCase):
         self.assertSetEqual(iso_code.super_properties(), {code})
         self.assertSetEqual(iso_country_code.super_properties_closure(), {code, iso_code})
 
+    def test_legality_indexes(self):
+        rdf_content = rdf_prefix + '''
+:Entity a owl:Class ; .
+:Group a owl:Class ;
+    rdfs:subClassOf :Entity ; .
+:Actor a owl:Class ;
+    owl:subClassOf :Group ; .
+:Place a owl:Class ; .
+:member a owl:ObjectProperty ;
+    schema:domainIncludes :Group ;
+    schema:rangeIncludes :Entity ; .
+:code a owl:DatatypeProperty ;
+    schema:rangeIncludes xsd:string ; .
+:iso_code a owl:DatatypeProperty ;
+    rdfs:subPropertyOf :code ;
+    schema:rangeIncludes xsd:integer ; .
+        '''
+        ontology = Ontology(rdf_content)
+        entity, group, actor, place = [ontology.get_entity(DIG[x].toPython())
+                                       for x in ["Entity", "Group", "Actor", "Place"]]
+        member = ontology.get_entity(DIG.member.toPython())
+        code = ontology.get_entity(DIG.code.toPython())
+        iso_code = ontology.get_entity(DIG.iso_code.toPython())
+        self.assertIsInstance(actor.super_classes_closure(), frozenset)
+        self.assertSetEqual(actor.super_classes_closure(), {entity, group})
+        self.assertSetEqual(member.legal_subjects(), {group, actor})
+        self.assertSetEqual(member.legal_objects(), {entity, group, actor})
+        self.assertTrue(member.is_legal_subject(actor))
+        self.assertFalse(member.is_legal_subject(entity))
+        self.assertFalse(member.is_legal_object(place))
+        self.assertIs(code.legal_subjects(), True)
+        self.assertTrue(code.is_legal_subject(place))
+        self.assertSetEqual(iso_code.legal_objects(), {XSD.string.toPython(), XSD.integer.toPython()})
+        self.assertTrue(iso_code.is_legal_object(XSD.string))
+        self.assertFalse(iso_code.is_legal_object(XSD.dateTime))
+
     def test_class_cycle_detection(self):
         rdf_content = rdf_prefix + '''
 :Entity a owl:Class ;
@@ -0,0 +1,77 @@
+import unittest, json, time
+from etk.etk import ETK
+from etk.etk_module import ETKModule
+from etk.extractors.regex_extractor import RegexExtractor
+from etk.knowledge_graph_schema import KGSchema
+
+sample_inputs = [
+    {
+        "doc_id": str(i),
+        "projects": [
+            {
+                "name": "etk",
+                "description": "version {} of etk, implemented by Runqi, Dongyu, Sylvia, Amandeep and others.".format(i)
+            }
+        ]
+    } for i in range(10)
+]
+
+
+class VersionModule(ETKModule):
+    def __init__(self, etk):
+        ETKModule.__init__(self, etk)
+        self.version_extractor = RegexExtractor(pattern=r"version \d+", extractor_name="version_extractor")
+
+    def process_document(self, doc):
+        descriptions = doc.select_segments("projects[*].description")
+        projects = doc.select_segments("projects[*]")
+        for d, p in zip(descriptions, projects):
+            p.store(doc.extract(self.version_extractor, d), "version")
+        return list()
+
+
+class SlowFirstDocumentModule(ETKModule):
+    def __init__(self, etk):
+        ETKModule.__init__(self, etk)
+
+    def process_document(self, doc):
+        if doc.cdr_document["doc_id"] == "0":
+            time.sleep(3)
+        return list()
+
+
+class TestProcessStream(unittest.TestCase):
+    def setUp(self):
+        kg_schema = KGSchema(json.load(open('etk/unit_tests/ground_truth/test_config.json')))
+        self.etk = ETK(kg_schema=kg_schema, modules=VersionModule)
+
+    def test_process_stream_single_process(self) -> None:
+        results = list(self.etk.process_stream(json.loads(json.dumps(sample_inputs))))
+        self.assertEqual(len(results), len(sample_inputs))
+        for i, result in enumerate(results):
+            self.assertEqual(result[0]["doc_id"], str(i))
+            self.assertEqual(result[0]["projects"][0]["version"], ["version {}".format(i)])
+
+    def test_process_stream_workers(self) -> None:
+        expected = list(self.etk.process_stream(json.loads(json.dumps(sample_inputs))))
+        results = list(self.etk.process_stream(json.loads(json.dumps(sample_inputs)), workers=2, chunk_size=3))
+        self.assertEqual(results, expected)
+
+    def test_process_stream_unordered(self) -> None:
+        results = self.etk.process_stream(json.loads(json.dumps(sample_inputs)), workers=2, ordered=False)
+        doc_ids = sorted(int(result[0]["doc_id"]) for result in results)
+        self.assertEqual(doc_ids, list(range(len(sample_inputs))))
+
+
+    def test_process_stream_slow_document(self) -> None:
+        # the other chunks keep flowing while the slow document is processed, beyond the chunks read ahead with it
+        etk = ETK(modules=SlowFirstDocumentModule)
+        inputs = [{"doc_id": str(i)} for i in range(40)]
+        results = etk.process_stream(inputs, workers=2, chunk_size=1, ordered=False)
+        doc_ids = [result[0]["doc_id"] for result in results]
+        self.assertEqual(sorted(doc_ids, key=int), [str(i) for i in range(40)])
+        self.assertEqual(doc_ids[-1], "0")
+
+
+if __name__ == '__main__':
+    unittest.main()
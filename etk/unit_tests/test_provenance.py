@@ -2,6 +2,7 @@ import unittest, json
 from etk.etk import ETK
 from etk.extractors.glossary_extractor import GlossaryExtractor
 from etk.knowledge_graph_schema import KGSchema
+from etk.provenance_api import ProvenanceAPI
 
 sample_input = {
         "projects": [
@@ -163,5 +164,39 @@ class TestProvenance(unittest.TestCase):
         self.assertEqual(expected_projects, doc.value["projects"])
         self.assertEqual(expected_provenances, doc.value["provenances"])
 
+    def test_provenance_levels(self) -> None:
+        kg_schema = KGSchema(json.load(open('etk/unit_tests/ground_truth/test_config.json')))
+        g = ['runqi', 'sylvia', 'dongyu', 'mayank', 'pedro', 'amandeep', 'yixiang']
+        docs = dict()
+        for provenance in ["full", "compact", "off"]:
+            etk = ETK(kg_schema=kg_schema, use_spacy_tokenizer=True, provenance=provenance)
+            name_extractor = GlossaryExtractor(g, "name_extractor", etk.default_tokenizer, case_sensitive=False,
+                                               ngrams=1)
+            doc = etk.create_document({"projects": [{"name": x["name"], "description": x["description"]}
+                                                    for x in sample_input["projects"]]})
+            for d, p in zip(doc.select_segments("projects[*].description"), doc.select_segments("projects[*]")):
+                names = doc.extract(name_extractor, d)
+                p.store(names, "members")
+                p.store(names, "members")
+            doc.kg.add_value("developer", json_path="projects[*].members[*]")
+            docs[provenance] = doc
+
+        self.assertNotIn("provenances", docs["compact"].value)
+        docs["compact"].serialize_provenances()
+        self.assertEqual(docs["full"].value["provenances"], docs["compact"].value["provenances"])
+        self.assertEqual(docs["full"].jsonpath_provenances, docs["compact"].jsonpath_provenances)
+        self.assertEqual(docs["full"].kg_provenances, docs["compact"].kg_provenances)
+
+        def origins(doc):
+            return [(o.full_path, o.start_char, o.end_char) for o in ProvenanceAPI(doc).get_origins("developer")]
+
+        self.assertTrue(origins(docs["full"]))
+        self.assertEqual(origins(docs["full"]), origins(docs["compact"]))
+
+        self.assertEqual(docs["full"].value["projects"], docs["off"].value["projects"])
+        self.assertNotIn("provenances", docs["off"].value)
+        self.assertEqual(0, len(docs["off"].provenances))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,6 @@
 import unittest, json
 from etk.etk import ETK
+from etk.extraction import Extraction
 from etk.knowledge_graph_schema import KGSchema
 
 sample_input = {
@@ -31,6 +32,38 @@ class TestSegment(unittest.TestCase):
         ]
         self.assertEqual(description_value, expected)
 
+    def test_store_unique_values(self) -> None:
+        etk = ETK()
+        doc = etk.create_document({"projects": [{"name": "etk"}]})
+        project = doc.select_segments("projects[0]")[0]
+        values = ["a", "b", "a", 1, 1.0, {"x": 1}, {"x": 1}, {"x": [1]}, {"x": [1]}, [1], [1]]
+        project.store([Extraction(v, "test") for v in values], "values")
+        self.assertEqual(["a", "b", 1, {"x": 1}, {"x": [1]}, [1]], project.value["values"])
+
+        # the stored list changed outside of store
+        project.value["values"].remove("b")
+        project.store([Extraction(v, "test") for v in ["b", "b", "a"]], "values")
+        self.assertEqual(["a", 1, {"x": 1}, {"x": [1]}, [1], "b"], project.value["values"])
+
+        # changed in place, or popped then appended to outside of store, without changing the length
+        project.value["values"][0] = "c"
+        project.store([Extraction(v, "test") for v in ["a", "c"]], "values")
+        self.assertEqual(["c", 1, {"x": 1}, {"x": [1]}, [1], "b", "a"], project.value["values"])
+        project.value["values"].pop()
+        project.value["values"].append("d")
+        project.store([Extraction(v, "test") for v in ["a", "d"]], "values")
+        self.assertEqual(["c", 1, {"x": 1}, {"x": [1]}, [1], "b", "d", "a"], project.value["values"])
+
+        # replaced by a plain list
+        project.value["values"] = ["e"]
+        project.store([Extraction(v, "test") for v in ["e", "f"]], "values")
+        project.value["values"][1] = "g"
+        project.store([Extraction(v, "test") for v in ["f", "g"]], "values")
+        self.assertEqual(["e", "g", "f"], project.value["values"])
+
+        project.store([Extraction(v, "test", tag=t) for v, t in [("a", "x"), ("a", "x"), ("a", "y")]], "tagged")
+        self.assertEqual({"x": ["a"], "y": ["a"]}, project.value["tagged"])
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
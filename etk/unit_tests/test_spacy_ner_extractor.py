@@ -36,6 +36,16 @@ class TestSpacyNerExtractor(unittest.TestCase):
             self.assertEqual(extracted[result_count], expected[result_count])
             result_count += 1
 
+    def test_extract_many(self) -> None:
+        get_attr = ['PERSON', 'ORG', 'GPE']
+        extractor = SpacyNerExtractor(extractor_name='spacy_ner_extractor')
+        texts = ['Napoléon Bonaparte was a French statesman.', '', 'Napoleon led France against a series of coalitions.']
+
+        results = [[(i.value, i.tag) for i in x] for x in extractor.extract_many(texts, get_attr=get_attr, batch_size=2)]
+        expected = [[(i.value, i.tag) for i in extractor.extract(text, get_attr=get_attr)] for text in texts]
+
+        self.assertEqual(results, expected)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -99,6 +99,17 @@ class TestSpacyRuleExtractor(unittest.TestCase):
         expected = [('rule_0', 'Name: Rq, Shao'), ('rule_0', 'Name: Sylvia, lin')]
         self.assertEqual([(x.rule_id, x.value) for x in extractions], expected)
 
+    def test_SpacyRuleExtractor_many_extractors(self) -> None:
+        sample_rules = rules["test_SpacyRuleExtractor_punc_1"]
+
+        extractors = [SpacyRuleExtractor(self.nlp, sample_rules, "test_extractor_{}".format(i)) for i in range(70)]
+        for sample_rule_extractor in [extractors[0], extractors[-1]]:
+            extractions = sample_rule_extractor.extract(
+                "version 2 of etk, implemented by Rq? Shao. DongYu94 Li, Sylvia-lin, Amandeep and others.")
+
+            expected = [('rule_0', 'Name: Rq, Shao'), ('rule_0', 'Name: Sylvia, lin')]
+            self.assertEqual([(x.rule_id, x.value) for x in extractions], expected)
+
     def test_SpacyRuleExtractor_linebreak_1(self) -> None:
         sample_rules = rules["test_SpacyRuleExtractor_linebreak_1"]
 
@@ -40,5 +40,13 @@ class TestTokenizer(unittest.TestCase):
         self.assertEqual(token_attrs, expected)
         self.assertEqual(t.reconstruct_text(tokens), reconstruct_text)
 
+    def test_tokenize_many(self) -> None:
+        texts = ["dsa@isi.edu 32.4 -32.1", "(123)-345-6789, #1  \n \n   ", ""]
+        t = Tokenizer()
+        results = [[(i.orth_, i.idx, i._.full_shape) for i in tokens] for tokens in t.tokenize_many(texts, batch_size=2)]
+        expected = [[(i.orth_, i.idx, i._.full_shape) for i in t.tokenize(text)] for text in texts]
+
+        self.assertEqual(results, expected)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,7 +1,7 @@
 import datetime
 import hashlib
 import json
-from typing import Dict
+from typing import Dict, List
 import uuid
 
 
@@ -61,3 +61,127 @@ class Utility(object):
             description += '"' + key + '":"' + str(doc_json[key]) + '", <br/>'
         description += '}'
         return description
+
+
+# marks the hashable form of a dict, so it is never equal to the one of a frozenset
+_DICT = object()
+
+
+class TrackedList(list):
+    """
+    A list counting the changes made to it, so UniqueValues knows when its index of the list is stale.
+    The lists of values of KnowledgeGraph and Segment are TrackedLists, and can be changed like any other list.
+    """
+
+    changes = 0
+
+    def _changed(self) -> None:
+        self.changes += 1
+
+    def append(self, value) -> None:
+        self._changed()
+        list.append(self, value)
+
+    def extend(self, values) -> None:
+        self._changed()
+        list.extend(self, values)
+
+    def insert(self, i, value) -> None:
+        self._changed()
+        list.insert(self, i, value)
+
+    def pop(self, *args):
+        self._changed()
+        return list.pop(self, *args)
+
+    def remove(self, value) -> None:
+        self._changed()
+        list.remove(self, value)
+
+    def clear(self) -> None:
+        self._changed()
+        list.clear(self)
+
+    def __setitem__(self, key, value) -> None:
+        self._changed()
+        list.__setitem__(self, key, value)
+
+    def __delitem__(self, key) -> None:
+        self._changed()
+        list.__delitem__(self, key)
+
+    def __iadd__(self, values):
+        self._changed()
+        return list.__iadd__(self, values)
+
+    def __imul__(self, n):
+        self._changed()
+        return list.__imul__(self, n)
+
+
+class UniqueValues(object):
+    """
+    Hash indexes over lists of values, each list identified by a name, so adding a value to a list only if it is not
+    already in it is O(1) instead of a linear "value not in list".
+
+    The index of a TrackedList is rebuilt when the list was replaced or changed outside of append(). Any other list
+    may have been changed in place, it is indexed again on each append().
+    Values that can not be hashed, e.g. dicts holding lists, are compared linearly with the other unhashable values.
+    """
+
+    def __init__(self) -> None:
+        # name -> [the list, its TrackedList.changes when indexed, set of hashable forms, list of unhashable values]
+        self._indexes = dict()
+
+    def append(self, name, values: List, value) -> bool:
+        """
+        Append value to values if it is not already in it
+
+        Args:
+            name: any hashable name of the list, e.g. a field name
+            values (List): the list, a TrackedList to keep its index between calls
+            value: the value to append
+
+        Returns: True if value was appended
+        """
+        index = self._indexes.get(name)
+        if index is None or index[0] is not values or not isinstance(values, TrackedList) \
+                or index[1] != values.changes:
+            index = [values, getattr(values, "changes", None), set(), list()]
+            for v in values:
+                self._add(index, v)
+            self._indexes[name] = index
+
+        if not self._add(index, value):
+            return False
+        # not a change of the list for its index
+        list.append(values, value)
+        return True
+
+    def _add(self, index: List, value) -> bool:
+        key = self._hashable(value)
+        if key is None:
+            if value in index[3]:
+                return False
+            index[3].append(value)
+        else:
+            if key in index[2]:
+                return False
+            index[2].add(key)
+        return True
+
+    @staticmethod
+    def _hashable(value):
+        """
+        Returns: a hashable form of value, equal for values that are equal, None if there is none
+        """
+        if isinstance(value, dict):
+            try:
+                return _DICT, frozenset(value.items())
+            except TypeError:
+                return None
+        try:
+            hash(value)
+        except TypeError:
+            return None
+        return value
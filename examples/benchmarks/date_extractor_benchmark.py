@@ -0,0 +1,86 @@
+"""
+Benchmark for DateExtractor on long news articles.
+
+Compares scanning the whole article with every default date regex (what DateExtractor.extract used to do)
+with the anchored scan DateExtractor uses now, and reports the time of a full extract() per article.
+Also compares extract() on every cell of a date column with extract_batch() on the whole column.
+
+Usage:
+    python date_extractor_benchmark.py [number_of_articles]
+"""
+import os, sys, time, random, warnings
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+from etk.extractors.date_extractor import DateExtractor
+
+sentences = [
+    "The finance ministers of several European countries gathered in Brussels to discuss a new framework",
+    "The meeting had been postponed twice since the spring and was expected to produce a common position",
+    "Analysts said the outcome would depend largely on whether the largest economies could agree",
+    "Markets reacted cautiously to the news, with the main index edging lower in early trading",
+    "A spokesperson for the presidency described the atmosphere as constructive",
+    "Opposition lawmakers criticised the government for failing to consult parliament before the meeting",
+    "The central bank kept interest rates unchanged and repeated its commitment to support the recovery",
+    "Economists noted that inflation had remained below target for most of the past decade",
+    "Trade unions announced a series of strikes in the transport sector, warning of disruption",
+    "The transport minister urged both sides to return to the table"
+]
+
+dates = [
+    "on March 3, 2018", "in 2012", "12/05/2017", "last Monday", "Jun 27 2017", "2009-10-23",
+    "about 450 people", "2.5 percent", "Wednesday, September 12th, 2018 at 10:30 PM UTC", "04/03/2010"
+]
+
+
+def generate_article(length: int = 60) -> str:
+    parts = list()
+    for _ in range(length):
+        sentence = random.choice(sentences)
+        if random.random() < 0.2:
+            sentence += " " + random.choice(dates)
+        parts.append(sentence)
+    return ". ".join(parts) + "."
+
+
+def full_scan(date_extractor: DateExtractor, text: str):
+    return [[date_extractor._wrap_date_match(order, match) for match in compiled_regex.finditer(text)]
+            for order, compiled_regex in date_extractor._compiled_regex.items()]
+
+
+def timed(func, articles):
+    start = time.time()
+    results = [func(article) for article in articles]
+    return (time.time() - start) / len(articles), results
+
+
+if __name__ == '__main__':
+    random.seed(0)
+    warnings.simplefilter('ignore')
+    number_of_articles = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    articles = [generate_article() for _ in range(number_of_articles)]
+    print("{} articles, {:.0f} chars on average".format(number_of_articles,
+                                                         sum(len(x) for x in articles) / number_of_articles))
+
+    de = DateExtractor()
+    full_time, full_results = timed(lambda x: full_scan(de, x), articles)
+    anchored_time, anchored_results = timed(de._match_default_formats, articles)
+    assert full_results == anchored_results
+    print("default formats, full scan:     {:.2f} ms per article".format(full_time * 1000))
+    print("default formats, anchored scan: {:.2f} ms per article ({:.1f}x)".format(anchored_time * 1000,
+                                                                                 full_time / anchored_time))
+
+    extract_time, _ = timed(lambda x: de.extract(x, prefer_language_date_order=False), articles)
+    print("extract():                      {:.2f} ms per article".format(extract_time * 1000))
+
+    cells = [random.choice(dates) for _ in range(number_of_articles * 100)]
+    print("{} cells".format(len(cells)))
+    start = time.time()
+    cell_results = [[e.value for e in de.extract(x)] for x in cells]
+    cell_time = (time.time() - start) / len(cells)
+    start = time.time()
+    batch_results = [[e.value for e in x] for x in de.extract_batch(cells)]
+    batch_time = (time.time() - start) / len(cells)
+    assert cell_results == batch_results
+    print("extract() per cell:             {:.3f} ms per cell".format(cell_time * 1000))
+    print("extract_batch():                {:.3f} ms per cell ({:.1f}x)".format(batch_time * 1000,
+                                                                              cell_time / batch_time))
@@ -0,0 +1,61 @@
+"""
+Benchmark for GlossaryExtractor with a large glossary.
+
+Builds a glossary of synthetic place names of 1 to 8 words, and reports the time of extract() per document
+for all the matches and for the longest matches only, and the time to load the glossary from a prebuilt index.
+
+Usage:
+    python glossary_extractor_benchmark.py [number_of_glossary_entries]
+"""
+import os, sys, time, random, tempfile
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+from etk.extractors.glossary_extractor import GlossaryExtractor
+
+syllables = ['ban', 'cor', 'del', 'fal', 'gra', 'hol', 'lin', 'mar', 'nor', 'por', 'ros', 'san', 'ter', 'val']
+words = ['the', 'of', 'and', 'in', 'a', 'to', 'was', 'for', 'on', 'with', 'new', 'city', 'county', 'river']
+
+
+def generate_word() -> str:
+    return ''.join(random.choice(syllables) for _ in range(random.randint(2, 3))).capitalize()
+
+
+def generate_document(glossary, length: int = 2000) -> list:
+    tokens = list()
+    while len(tokens) < length:
+        if random.random() < 0.05:
+            tokens.extend(random.choice(glossary).split())
+        else:
+            tokens.append(random.choice(words + [generate_word()]))
+    return tokens
+
+
+def timed(extractor, documents):
+    start = time.time()
+    count = sum(len(extractor.extract(tokens)) for tokens in documents)
+    return (time.time() - start) / len(documents), count
+
+
+if __name__ == '__main__':
+    random.seed(0)
+    number_of_entries = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    glossary = [' '.join(generate_word() for _ in range(random.randint(1, 8))) for _ in range(number_of_entries)]
+    documents = [generate_document(glossary) for _ in range(50)]
+
+    start = time.time()
+    all_matches = GlossaryExtractor(glossary, 'benchmark', None, None)
+    longest_matches = GlossaryExtractor(glossary, 'benchmark', None, None, longest_match_only=True)
+    print("{} glossary entries, built in {:.1f}s".format(number_of_entries, (time.time() - start) / 2))
+
+    all_time, all_count = timed(all_matches, documents)
+    print("all matches:     {:.2f} ms per 2000 token document, {} matches".format(all_time * 1000, all_count))
+    longest_time, longest_count = timed(longest_matches, documents)
+    print("longest matches: {:.2f} ms per 2000 token document, {} matches".format(longest_time * 1000, longest_count))
+
+    with tempfile.TemporaryDirectory() as index_dir:
+        start = time.time()
+        GlossaryExtractor(glossary, 'benchmark', None, None, index_dir=index_dir)
+        build_time = time.time() - start
+        start = time.time()
+        GlossaryExtractor(glossary, 'benchmark', None, None, index_dir=index_dir)
+        print("index: built and saved in {:.1f}s, loaded in {:.1f}s".format(build_time, time.time() - start))
@@ -0,0 +1,54 @@
+"""
+Benchmark for json path evaluation in Document.select_segments.
+
+Compares jsonpath_ng find() with the full paths as strings (what select_segments used to do) with
+CompiledJsonPath, which walks the json directly for simple paths.
+
+Usage:
+    python json_path_benchmark.py [number_of_documents]
+"""
+import os, sys, time, random
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+import jsonpath_ng.ext
+from etk.json_path import CompiledJsonPath
+
+paths = ["$.url", "$.knowledge_graph.title[*].value", "$.projects[*].description", "$.projects[*].members[*].name"]
+
+
+def generate_document(i: int) -> dict:
+    return {
+        "doc_id": str(i),
+        "url": "http://ex.com/{}".format(i),
+        "knowledge_graph": {"title": [{"value": "title {}".format(j)} for j in range(3)]},
+        "projects": [
+            {
+                "name": "project {}".format(j),
+                "description": "description of project {}".format(j),
+                "members": [{"name": "member {}".format(k)} for k in range(random.randint(1, 5))]
+            } for j in range(random.randint(1, 10))
+        ]
+    }
+
+
+def timed(find, documents):
+    start = time.time()
+    results = [[(m[0], m[1]) for path in paths for m in find(path, doc)] for doc in documents]
+    return (time.time() - start) / len(documents), results
+
+
+if __name__ == '__main__':
+    random.seed(0)
+    number_of_documents = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    documents = [generate_document(i) for i in range(number_of_documents)]
+    parsed = {path: jsonpath_ng.ext.parse(path) for path in paths}
+    compiled = {path: CompiledJsonPath(parsed[path]) for path in paths}
+
+    old_time, old_results = timed(lambda path, doc: ((str(m.full_path), m.value) for m in parsed[path].find(doc)),
+                                  documents)
+    new_time, new_results = timed(lambda path, doc: ((m.full_path, m.value) for m in compiled[path].find(doc)),
+                                  documents)
+    assert old_results == new_results
+    print("{} documents, {} paths".format(number_of_documents, len(paths)))
+    print("jsonpath_ng:      {:.3f} ms per document".format(old_time * 1000))
+    print("CompiledJsonPath: {:.3f} ms per document ({:.1f}x)".format(new_time * 1000, old_time / new_time))
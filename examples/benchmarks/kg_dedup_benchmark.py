@@ -0,0 +1,58 @@
+"""
+Benchmark for adding many values to one field, with KnowledgeGraph.add_value and Segment.store.
+
+Both keep each value once. The values are checked against a hash index, the previous linear
+"value not in list" made adding n values O(n^2), it is timed on a sample of the values for comparison.
+
+Usage:
+    python kg_dedup_benchmark.py [number_of_values] [number_of_values_for_the_linear_scan]
+"""
+import os, sys, time, json
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+from etk.etk import ETK
+from etk.extraction import Extraction
+from etk.knowledge_graph_schema import KGSchema
+
+schema_path = os.path.join(os.path.dirname(__file__), '../../etk/unit_tests/ground_truth/test_config.json')
+
+
+def linear_scan(values):
+    start = time.time()
+    result = list()
+    for value in values:
+        valid_value = {"value": value, "key": value.lower()}
+        if valid_value not in result:
+            result.append(valid_value)
+    return time.time() - start
+
+
+if __name__ == '__main__':
+    number_of_values = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    number_of_scanned_values = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    # every value twice
+    values = ["Value {}".format(i % (number_of_values // 2)) for i in range(number_of_values)]
+
+    etk = ETK(kg_schema=KGSchema(json.load(open(schema_path))), provenance="off")
+    doc = etk.create_document({"doc_id": "1"})
+
+    start = time.time()
+    doc.kg.add_value("developer", value=values)
+    kg_time = time.time() - start
+    assert len(doc.kg.value["developer"]) == number_of_values // 2
+
+    extractions = [Extraction(value, "benchmark") for value in values]
+    start = time.time()
+    for i in range(0, len(extractions), 100):
+        doc.store(extractions[i:i + 100], "developers")
+    store_time = time.time() - start
+    assert len(doc.value["developers"]) == number_of_values // 2
+
+    scan_time = linear_scan(values[:number_of_scanned_values])
+
+    print("{} values, {} distinct".format(number_of_values, number_of_values // 2))
+    print("KnowledgeGraph.add_value: {:.3f} s ({:.1f} us per value)".format(kg_time, kg_time / number_of_values * 1e6))
+    print("Segment.store:            {:.3f} s ({:.1f} us per value)".format(store_time,
+                                                                           store_time / number_of_values * 1e6))
+    print("linear scan of the first {} values only: {:.3f} s ({:.1f} us per value)".format(
+        number_of_scanned_values, scan_time, scan_time / number_of_scanned_values * 1e6))
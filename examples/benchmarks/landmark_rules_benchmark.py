@@ -0,0 +1,72 @@
+"""
+Benchmark for the landmark IterationRule on long listing pages.
+
+The begin and end regexes of the items are matched from a position in the page, each item used to be searched in a
+copy of the rest of the page, O(items x page size). The previous search is timed on the same page for comparison,
+and finds the same items.
+
+Usage:
+    python landmark_rules_benchmark.py [number_of_items]
+"""
+import os, sys, time
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+from etk.dependencies.landmark.landmark_extractor.extraction.Landmark import loadRule
+
+rule_json = {
+    "name": "items",
+    "rule_type": "IterationRule",
+    "begin_regex": "\\<ul class=\"listing\"\\>",
+    "end_regex": "\\</ul\\>",
+    "iter_begin_regex": "\\<li\\>\\<span class=\"title\"\\>",
+    "iter_end_regex": "\\</span\\>",
+    "no_first_begin_iter_rule": False,
+    "no_last_end_iter_rule": False
+}
+
+
+def create_page(number_of_items):
+    parts = ['<html><body><h1>Listing</h1><ul class="listing">']
+    for i in range(number_of_items):
+        parts.append('<li><span class="title">Item {0}</span> <span class="price">${0}.99</span> '
+                     '<a href="/item/{0}">details</a></li>'.format(i))
+    parts.append('</ul></body></html>')
+    return ''.join(parts)
+
+
+def previous_search(rule, page):
+    """The values of the items as found before, searching a copy of the rest of the page for each item"""
+    base = page[rule.begin_rule.search(page).end():]
+    base = base[:rule.end_rule.search(base).start()]
+    values = list()
+    start_index = 0
+    while start_index < len(base):
+        begin_match = rule.iter_begin_rule.search(base[start_index:])
+        if begin_match is None:
+            break
+        end_match = rule.iter_end_rule.search(base[start_index + begin_match.end():])
+        if end_match is None:
+            break
+        values.append(base[start_index + begin_match.end():start_index + begin_match.end() + end_match.start()])
+        start_index = start_index + begin_match.end() + end_match.start()
+    return values
+
+
+if __name__ == '__main__':
+    number_of_items = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    page = create_page(number_of_items)
+    rule = loadRule(rule_json)
+
+    start = time.time()
+    result = rule.apply(page)
+    apply_time = time.time() - start
+    assert len(result["sequence"]) == number_of_items
+
+    start = time.time()
+    values = previous_search(rule, page)
+    search_time = time.time() - start
+    assert values == [item["extract"] for item in result["sequence"]]
+
+    print("{} items, {} characters".format(number_of_items, len(page)))
+    print("IterationRule.apply:           {:.3f} s".format(apply_time))
+    print("search the rest of the page:   {:.3f} s".format(search_time))
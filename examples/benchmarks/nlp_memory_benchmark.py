@@ -0,0 +1,49 @@
+"""
+Memory benchmark for the spaCy pipelines used by extractors.
+
+Starts a worker process per mode, each building the tokenizers of a number of extractors over en_core_web_sm:
+'copy' deep copies the pipeline for every extractor (what SpacyRuleExtractor and ETK used to do), 'shared' gets
+them from etk.nlp_registry. Reports the resident memory (RSS) of each worker.
+
+Usage:
+    python nlp_memory_benchmark.py [number_of_extractors]
+"""
+import os, sys, copy, multiprocessing
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+
+
+def rss_mb() -> float:
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def worker(mode: str, number_of_extractors: int, queue) -> None:
+    from etk import nlp_registry
+    from etk.tokenizer import Tokenizer
+
+    nlp = nlp_registry.load_model('en_core_web_sm')
+    before = rss_mb()
+    if mode == 'copy':
+        tokenizers = [Tokenizer(copy.deepcopy(nlp)) for _ in range(number_of_extractors)]
+    else:
+        tokenizers = [nlp_registry.get_tokenizer(nlp) for _ in range(number_of_extractors)]
+    for t in tokenizers:
+        t.tokenize("The University of Southern California is in Los Angeles.")
+    queue.put((before, rss_mb()))
+
+
+if __name__ == '__main__':
+    number_of_extractors = int(sys.argv[1]) if len(sys.argv) > 1 else 12
+    print("{} extractors per worker".format(number_of_extractors))
+    ctx = multiprocessing.get_context('spawn')
+    for mode in ['copy', 'shared']:
+        queue = ctx.Queue()
+        p = ctx.Process(target=worker, args=(mode, number_of_extractors, queue))
+        p.start()
+        before, after = queue.get()
+        p.join()
+        print("{:6}: {:.0f} MB RSS per worker, {:.0f} MB for the extractors".format(mode, after, after - before))
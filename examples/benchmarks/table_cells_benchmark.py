@@ -0,0 +1,76 @@
+"""
+Benchmark for the cell normalization of Toolkit and the glossary matching of EntityTableDataExtraction.
+
+Toolkit.normalize_cells cleans and regulizes a table array with precompiled patterns, the cells were cleaned and
+regulized with re.sub calls compiling a pattern for each dot and email name found. cell_matches_dict looks up the
+substrings of a cell in an index of the glossary, it tested every entry of the glossary. Both previous versions
+are timed on the same cells for comparison, and give the same results.
+
+Usage:
+    python table_cells_benchmark.py [number_of_rows] [number_of_glossary_entries]
+"""
+import os, sys, time, re, copy, random
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+from etk.extractors.table_extractor import Toolkit, EntityTableDataExtraction
+
+
+def previous_normalize_cells(t):
+    for r in t:
+        for i in range(len(r)):
+            r[i] = re.sub(r'[^\x00-\x7F]', ' ', r[i])
+            r[i] = re.sub(r'[^\s\w\.\-\$_%\^&*#~+@"\']', ' ', r[i])
+            for x in re.findall(r'(\.[a-z])', r[i]):
+                r[i] = re.sub(r'\.{0}'.format(x[1]), ' {0}'.format(x[1]), r[i])
+            r[i] = re.sub(r'\s+', ' ', r[i])
+            r[i] = r[i].strip()
+    for r in t:
+        for i in range(len(r)):
+            r[i] = re.sub('[0-9]', 'NUM', r[i])
+            for x in re.findall('([a-z][a-z][a-z]+@)', r[i]):
+                r[i] = re.sub(x, 'EMAILNAME ', r[i])
+
+
+def generate_word():
+    return ''.join(random.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(random.randint(3, 9)))
+
+
+if __name__ == '__main__':
+    number_of_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    number_of_entries = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    random.seed(0)
+    cells = [["{} ({}):".format(generate_word(), generate_word()),
+              "{}.{} - {}@{}.com".format(generate_word(), generate_word(), generate_word(), generate_word()),
+              "{} x {}.{} €".format(random.randint(1, 999), random.randint(1, 99), random.randint(0, 99))]
+             for _ in range(number_of_rows)]
+
+    table = copy.deepcopy(cells)
+    start = time.time()
+    Toolkit.normalize_cells(table)
+    normalize_time = time.time() - start
+
+    previous_table = copy.deepcopy(cells)
+    start = time.time()
+    previous_normalize_cells(previous_table)
+    previous_normalize_time = time.time() - start
+    assert table == previous_table
+
+    glossary = [' '.join(generate_word() for _ in range(random.randint(1, 3))) for _ in range(number_of_entries)]
+    extractor = EntityTableDataExtraction()
+    extractor.add_glossary(glossary, "benchmark")
+    labels = [random.choice(glossary) + ":" if i % 2 else r[0] for i, r in enumerate(cells[:2000])]
+
+    start = time.time()
+    matches = [extractor.cell_matches_dict(label, glossary) for label in labels]
+    index_time = time.time() - start
+
+    start = time.time()
+    scan_matches = [any([extractor.cell_matches_text(label, x) for x in glossary]) for label in labels]
+    scan_time = time.time() - start
+    assert matches == scan_matches
+
+    print("{} cells, {} glossary entries".format(number_of_rows * 3, number_of_entries))
+    print("Toolkit.normalize_cells:            {:.3f} s".format(normalize_time))
+    print("previous clean and regulize:        {:.3f} s".format(previous_normalize_time))
+    print("cell_matches_dict, {} cells:      {:.3f} s".format(len(labels), index_time))
+    print("glossary scan, {} cells:          {:.3f} s".format(len(labels), scan_time))
@@ -0,0 +1,71 @@
+"""
+Benchmark for TableExtraction.extract on a page with many data tables.
+
+The context of the tables is read from the strings of the page indexed in one walk, it was found by searching
+the whole page before and after each table with find_all_previous and find_all_next, O(tables x page size).
+The previous search is timed on the same page for comparison, and gives the same contexts.
+LxmlTableExtraction, the lxml engine of TableExtractor, is timed on the same page and gives the same tables.
+
+Usage:
+    python table_context_benchmark.py [number_of_tables]
+"""
+import os, sys, time
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+from bs4 import BeautifulSoup
+from etk.extractors.table_extractor import TableExtraction, LxmlTableExtraction
+
+
+def create_page(number_of_tables):
+    parts = ['<html><head><title>Benchmark</title></head><body>']
+    for i in range(number_of_tables):
+        parts.append('<h2>Table {0}</h2><p>Some text about the table {0}.</p><table>'.format(i))
+        parts.append('<tr><th>name</th><th>value</th><th>unit</th></tr>')
+        for j in range(10):
+            parts.append('<tr><td>row {0}.{1}</td><td>{1}</td><td>kg</td></tr>'.format(i, j))
+        parts.append('</table>')
+    parts.append('</body></html>')
+    return ''.join(parts)
+
+
+def search_contexts(html_doc, min_data_rows=1):
+    """The contexts as found before, searching the page for each data table"""
+    soup = BeautifulSoup(html_doc, 'html5lib')
+    contexts = list()
+    for table in soup.findAll('table'):
+        if TableExtraction.is_data_table(table, min_data_rows) is not False:
+            contexts.append((' '.join(TableExtraction.gen_context(table.find_all_previous(string=True))),
+                             ' '.join(TableExtraction.gen_context(table.find_all_next(string=True)))))
+            table.decompose()
+    return contexts
+
+
+if __name__ == '__main__':
+    number_of_tables = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    page = create_page(number_of_tables)
+    extraction = TableExtraction()
+
+    start = time.time()
+    result = extraction.extract(page)
+    context_time = time.time() - start
+    assert len(result["tables"]) == number_of_tables
+
+    start = time.time()
+    extraction.extract(page, context=False)
+    no_context_time = time.time() - start
+
+    start = time.time()
+    lxml_result = LxmlTableExtraction().extract(page)
+    lxml_time = time.time() - start
+    assert lxml_result == result
+
+    start = time.time()
+    contexts = search_contexts(page)
+    search_time = time.time() - start
+    assert contexts == [(t["context_before"], t["context_after"]) for t in result["tables"]]
+
+    print("{} tables, {} characters".format(number_of_tables, len(page)))
+    print("extract:                       {:.3f} s".format(context_time))
+    print("extract, context=False:        {:.3f} s".format(no_context_time))
+    print("parse and search the contexts: {:.3f} s".format(search_time))
+    print("LxmlTableExtraction.extract:   {:.3f} s".format(lxml_time))
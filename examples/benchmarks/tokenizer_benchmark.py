@@ -0,0 +1,61 @@
+"""
+Benchmark for Tokenizer.tokenize.
+
+Compares registering the custom token extensions for every token (what Tokenizer.custom_token used to do)
+with the extensions registered once at import, and reports tokens per second.
+
+Usage:
+    python tokenizer_benchmark.py [number_of_texts]
+"""
+import os, sys, time, random, re
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '../..'))
+from etk.tokenizer import Tokenizer, _get_shape, _is_ordinal, _is_mixed, _n_prefix, _n_suffix
+
+words = ['The', 'price', 'was', '21.33', 'dollars', 'on', 'the', '3rd', 'of', 'May', 'iPhone', 'sold', '1,200',
+         'units', 'in', 'Los', 'Angeles', '-', 'according', 'to', 'reports', '(', 'Reuters', ')', '.']
+
+
+def register_per_token(spacy_token):
+    def is_integer(token):
+        pattern = re.compile('^[-+]?[0-9]+$')
+        return bool(pattern.match(token.text))
+
+    def is_decimal(token):
+        pattern = re.compile(r'^[-+]?[0-9]+\.[0-9]+$')
+        return bool(pattern.match(token.text))
+
+    spacy_token.set_extension("full_shape", getter=_get_shape, force=True)
+    spacy_token.set_extension("is_integer", getter=is_integer, force=True)
+    spacy_token.set_extension("is_decimal", getter=is_decimal, force=True)
+    spacy_token.set_extension("is_ordinal", getter=_is_ordinal, force=True)
+    spacy_token.set_extension("is_mixed", getter=_is_mixed, force=True)
+    spacy_token.set_extension("n_prefix", method=_n_prefix, force=True)
+    spacy_token.set_extension("n_suffix", method=_n_suffix, force=True)
+    return spacy_token
+
+
+def use_extensions(tokens):
+    return [(t._.full_shape, t._.is_integer, t._.is_decimal, t._.is_ordinal, t._.is_mixed) for t in tokens]
+
+
+if __name__ == '__main__':
+    random.seed(0)
+    number_of_texts = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    texts = [' '.join(random.choice(words) for _ in range(100)) for _ in range(number_of_texts)]
+    t = Tokenizer()
+
+    start = time.time()
+    old_results = [use_extensions([register_per_token(x) for x in t.tokenize(text, customize=False)])
+                   for text in texts]
+    old_time = time.time() - start
+
+    start = time.time()
+    new_results = [use_extensions(t.tokenize(text)) for text in texts]
+    new_time = time.time() - start
+
+    assert old_results == new_results
+    number_of_tokens = sum(len(x) for x in new_results)
+    print("{} texts, {} tokens".format(number_of_texts, number_of_tokens))
+    print("per-token registration: {:.0f} tokens/s".format(number_of_tokens / old_time))
+    print("registered at import:   {:.0f} tokens/s ({:.1f}x)".format(number_of_tokens / new_time, old_time / new_time))